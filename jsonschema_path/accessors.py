@@ -1,9 +1,14 @@
 """JSONSchema spec accessors module."""
 
+import asyncio
 import warnings
+from collections.abc import AsyncIterator
 from collections.abc import Hashable
+from collections.abc import Iterable
 from collections.abc import Iterator
+from collections.abc import Mapping
 from collections.abc import Sequence
+from contextlib import asynccontextmanager
 from contextlib import contextmanager
 from typing import Any
 from typing import cast
@@ -13,6 +18,7 @@ from pathable.types import LookupKey
 from pathable.types import LookupNode
 from pathable.types import LookupValue
 from referencing import Registry
+from referencing import Resource
 from referencing import Specification
 from referencing._core import Resolved
 from referencing._core import Resolver
@@ -20,13 +26,53 @@ from referencing.jsonschema import DRAFT202012
 
 from jsonschema_path._referencing_compat import rebind_resolved
 from jsonschema_path.caches import FullPathResolvedCache
+from jsonschema_path.caches import ResourceCache
 from jsonschema_path.handlers import default_handlers
+from jsonschema_path.lazy import materialize
+from jsonschema_path.prefetchers import prefetch_resources
 from jsonschema_path.resolvers import CachedPathResolver
+from jsonschema_path.retrievers import AsyncSchemaRetriever
+from jsonschema_path.retrievers import RetrievalDeferred
+from jsonschema_path.retrievers import RetrievalPolicy
 from jsonschema_path.retrievers import SchemaRetriever
+from jsonschema_path.retrievers import defer_retrieval
+from jsonschema_path.sourcemaps import SourceMap
+from jsonschema_path.typing import AsyncResolverHandlers
 from jsonschema_path.typing import ResolverHandlers
 from jsonschema_path.typing import Schema
 
 
+def _as_resource(
+    document: Schema | Resource[Schema], specification: Specification[Schema]
+) -> Resource[Schema]:
+    if isinstance(document, Resource):
+        return document
+    return specification.create_resource(document)
+
+
+def _get_deferred(exc: BaseException) -> RetrievalDeferred | None:
+    # referencing wraps retrieval errors, e.g. Unresolvable from
+    # Unretrievable from the retriever's exception.
+    cause: BaseException | None = exc
+    while cause is not None:
+        if isinstance(cause, RetrievalDeferred):
+            return cause
+        cause = cause.__cause__
+    return None
+
+
+def _replace_cause(
+    exc: BaseException, cause: BaseException, replacement: BaseException
+) -> BaseException:
+    link = exc
+    while link.__cause__ is not None:
+        if link.__cause__ is cause:
+            link.__cause__ = replacement
+            return exc
+        link = link.__cause__
+    return replacement
+
+
 class SchemaAccessor(LookupAccessor):
     """Resource handle binding a schema document to its resolver.
 
@@ -49,6 +95,8 @@ class SchemaAccessor(LookupAccessor):
         schema: Schema,
         resolver: Resolver[Schema],
         resolved_cache_maxsize: int = 128,
+        source_map: SourceMap | None = None,
+        async_retriever: AsyncSchemaRetriever | None = None,
     ):
         if resolved_cache_maxsize < 0:
             raise ValueError("resolved_cache_maxsize must be >= 0")
@@ -61,6 +109,8 @@ class SchemaAccessor(LookupAccessor):
         self._resolved_cache: FullPathResolvedCache = FullPathResolvedCache(
             maxsize=resolved_cache_maxsize
         )
+        self.source_map = source_map
+        self.async_retriever = async_retriever
 
     def __eq__(self, other: object) -> Any:
         if not isinstance(other, SchemaAccessor):
@@ -95,22 +145,107 @@ class SchemaAccessor(LookupAccessor):
         base_uri: str = "",
         handlers: ResolverHandlers | None = None,
         resolved_cache_maxsize: int = 0,
+        prefetch: bool = False,
+        resource_cache: ResourceCache | None = None,
+        source_map: SourceMap | None = None,
+        resources: Mapping[str, Schema | Resource[Schema]] | None = None,
+        retrieval_policy: RetrievalPolicy | None = None,
+        async_handlers: AsyncResolverHandlers | None = None,
     ) -> "SchemaAccessor":
+        """Build an accessor for *schema*.
+
+        With ``prefetch`` all external documents reachable through
+        ``$ref`` are retrieved concurrently up front, so no retrieval
+        happens on first lookup. A ``resource_cache`` (for example
+        ``jsonschema_path.caches.shared_resource_cache``) shares
+        retrieved documents between accessors. A ``source_map`` holding
+        the positions of the loaded documents is used to locate nodes.
+
+        ``resources`` maps URIs to documents (or prebuilt ``Resource``s)
+        already held in memory. They are added to the registry up front,
+        so ``$ref``s to them never reach the retriever or the handlers.
+
+        A ``retrieval_policy`` retries failed retrievals of remote
+        documents and fails fast on URIs and hosts that keep failing.
+
+        ``async_handlers`` map schemes to async handlers used by the
+        async API (``aget_resolved``); other documents are retrieved
+        through ``handlers`` in a worker thread.
+        """
         if handlers is None:
             handlers = default_handlers
-        retriever = SchemaRetriever(handlers, specification)
+        retriever = SchemaRetriever(
+            handlers,
+            specification,
+            resource_cache=resource_cache,
+            policy=retrieval_policy,
+        )
         base_resource = specification.create_resource(schema)
         registry: Registry[Schema] = Registry(
             retrieve=retriever,  # type: ignore
         )
+        if resources:
+            registry = registry.with_resources(
+                (uri, _as_resource(document, specification))
+                for uri, document in resources.items()
+            )
         registry = registry.with_resource(base_uri, base_resource)
+        if prefetch:
+            registry = prefetch_resources(
+                registry, retriever, schema, base_uri, specification
+            )
         resolver = registry.resolver(base_uri=base_uri)
         return cls(
             schema,
             resolver,
             resolved_cache_maxsize=resolved_cache_maxsize,
+            source_map=source_map,
+            async_retriever=AsyncSchemaRetriever(retriever, async_handlers),
         )
 
+    @classmethod
+    def from_documents(
+        cls,
+        documents: Iterable[tuple[str, Schema]],
+        specification: Specification[Schema] = DRAFT202012,
+        handlers: ResolverHandlers | None = None,
+        resolved_cache_maxsize: int = 0,
+        resource_cache: ResourceCache | None = None,
+    ) -> dict[str, "SchemaAccessor"]:
+        """Build accessors for many ``(uri, schema)`` documents at once.
+
+        All documents are registered in one registry under their URI, so
+        ``$ref``s between them resolve without retrieval, and one
+        retriever serves them all. Without a ``resource_cache`` a new one
+        is shared by the returned accessors, so documents retrieved for
+        one of them are reused by the others.
+        """
+        if handlers is None:
+            handlers = default_handlers
+        if resource_cache is None:
+            resource_cache = ResourceCache()
+        retriever = SchemaRetriever(
+            handlers, specification, resource_cache=resource_cache
+        )
+        resources = [
+            (uri, specification.create_resource(schema))
+            for uri, schema in documents
+        ]
+        registry: Registry[Schema] = Registry(
+            retrieve=retriever,  # type: ignore
+        )
+        registry = registry.with_resources(resources)
+        async_retriever = AsyncSchemaRetriever(retriever)
+        return {
+            uri: cls(
+                resource.contents,
+                registry.resolver(base_uri=uri),
+                resolved_cache_maxsize=resolved_cache_maxsize,
+                async_retriever=async_retriever,
+            )
+            for uri, resource in resources
+        }
+
     @property
     def base_uri(self) -> str:
         return self._path_resolver.resolver._base_uri
@@ -206,6 +341,11 @@ class SchemaAccessor(LookupAccessor):
         node = self[parts]
         return self._read_node(node)
 
+    @classmethod
+    def _read_node(cls, node: LookupNode) -> LookupValue:
+        # Values leave as real data, not lazy nodes C encoders see empty.
+        return materialize(node)
+
     @contextmanager
     def resolve(
         self, parts: Sequence[LookupKey]
@@ -240,3 +380,48 @@ class SchemaAccessor(LookupAccessor):
         self._resolved_cache.set(parts, result.resolved)
 
         return result.resolved
+
+    async def aread(self, parts: Sequence[LookupKey]) -> LookupValue:
+        resolved = await self.aget_resolved(parts)
+        return self._read_node(resolved.contents)
+
+    @asynccontextmanager
+    async def aresolve(
+        self, parts: Sequence[LookupKey]
+    ) -> AsyncIterator[Resolved[LookupNode]]:
+        yield await self.aget_resolved(parts)
+
+    async def aget_resolved(
+        self, parts: Sequence[LookupKey]
+    ) -> Resolved[LookupNode]:
+        """Resolve *parts* without blocking the event loop.
+
+        Resolution runs as in `get_resolved`, except that documents which
+        are not in the registry, bundled or cached are awaited from the
+        async retriever and added to the registry before resolution is
+        resumed.
+        """
+        if self.async_retriever is None:
+            return await asyncio.to_thread(self.get_resolved, parts)
+
+        retrieved: set[str] = set()
+        while True:
+            token = defer_retrieval.set(True)
+            try:
+                return self.get_resolved(parts)
+            except Exception as exc:
+                deferred = _get_deferred(exc)
+                if deferred is None or deferred.uri in retrieved:
+                    raise
+                failure = exc
+            finally:
+                defer_retrieval.reset(token)
+
+            try:
+                resource = await self.async_retriever(deferred.uri)
+            except Exception as error:
+                # Fail as `get_resolved` does, with the retrieval error
+                # in place of the deferral.
+                raise _replace_cause(failure, deferred, error)
+            self._path_resolver.add_resource(deferred.uri, resource)
+            retrieved.add(deferred.uri)
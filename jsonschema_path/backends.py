@@ -0,0 +1,100 @@
+"""JSONSchema spec JSON backends module."""
+
+import json
+import re
+from typing import Any
+
+HAS_ORJSON = False
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    pass
+else:
+    HAS_ORJSON = True
+
+__all__ = [
+    "JsonBackend",
+    "OrjsonBackend",
+    "get_default_json_backend",
+    "set_default_json_backend",
+]
+
+
+# orjson silently decodes integers outside the 64-bit range as floats.
+LONG_INTEGER_RE = re.compile(r"\d{19,}")
+LONG_INTEGER_BYTES_RE = re.compile(rb"\d{19,}")
+
+
+def _reject_constant(name: str) -> Any:
+    raise ValueError(f"Unexpected constant {name}")
+
+
+class JsonBackend:
+    """Standard library JSON backend."""
+
+    name = "json"
+
+    def loads(
+        self, data: str | bytes | memoryview, allow_nan: bool = True
+    ) -> Any:
+        """Decode a JSON document.
+
+        With ``allow_nan`` false the non-standard ``NaN`` and
+        ``Infinity`` constants are rejected with ``ValueError``.
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        if allow_nan:
+            return json.loads(data)
+        return json.loads(data, parse_constant=_reject_constant)
+
+    def dumps(self, data: Any) -> str:
+        return json.dumps(data)
+
+
+class OrjsonBackend(JsonBackend):
+    """``orjson`` JSON backend.
+
+    Decodes with ``orjson`` and falls back to the standard library for
+    input it refuses (non-standard constants) or would decode lossily
+    (integers beyond 64 bits), so results match `JsonBackend`. Encoding
+    stays on the standard library because ``orjson`` serialises ``NaN``
+    as ``null`` and rejects non-string keys.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not HAS_ORJSON:
+            raise ImportError("orjson is not installed")
+
+    def loads(
+        self, data: str | bytes | memoryview, allow_nan: bool = True
+    ) -> Any:
+        # orjson reads bytes and memoryviews in place.
+        if isinstance(data, str):
+            has_long_integer = LONG_INTEGER_RE.search(data) is not None
+        else:
+            has_long_integer = LONG_INTEGER_BYTES_RE.search(data) is not None
+        if has_long_integer:
+            return super().loads(data, allow_nan=allow_nan)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data, allow_nan=allow_nan)
+
+
+_default_json_backend: JsonBackend = (
+    OrjsonBackend() if HAS_ORJSON else JsonBackend()
+)
+
+
+def get_default_json_backend() -> JsonBackend:
+    """Return the JSON backend used when none is configured: ``orjson``
+    when installed, otherwise the standard library."""
+    return _default_json_backend
+
+
+def set_default_json_backend(backend: JsonBackend) -> None:
+    global _default_json_backend
+    _default_json_backend = backend
@@ -1,6 +1,7 @@
 """JSONSchema path caches module.
 
-Both caches store ``Resolved`` values keyed on hashable schema paths.
+The resolved caches store ``Resolved`` values keyed on hashable schema
+paths.
 Staleness across ``referencing.Registry`` growth is *not* handled by
 invalidation here; the callers rebind cached ``Resolved`` values to the
 current registry on read (see
@@ -9,15 +10,27 @@ the assumption that registries grow monotonically — resources are added,
 never replaced. Handlers that return drifting content for the same URI
 violate that assumption; users who need to defend against that should
 disable caching with ``resolved_cache_maxsize=0``.
+
+``ResourceCache`` stores retrieved documents and can be shared by
+retrievers of many accessors.
 """
 
+import threading
 from collections import OrderedDict
+from collections.abc import Hashable
 from collections.abc import Sequence
+from typing import Any
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
 
 from pathable.types import LookupKey
 from pathable.types import LookupNode
+from referencing import Resource
+from referencing import Specification
 from referencing._core import Resolved
 
+from jsonschema_path.typing import Schema
+
 
 class FullPathResolvedCache:
     def __init__(self, maxsize: int):
@@ -122,3 +135,85 @@ class PrefixResolvedCache:
             self._cache[prefix] = resolved
         except TypeError:
             pass
+
+
+def normalize_uri(uri: str) -> str:
+    """Normalise *uri* for cache keys: lowercase scheme and host, no
+    fragment."""
+    parts = urlsplit(uri)
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path,
+            parts.query,
+            "",
+        )
+    )
+
+
+class ResourceCache:
+    """Thread-safe LRU cache of retrieved resources.
+
+    Keyed by the normalised URI and the specification the resource was
+    created with. A single instance can be shared by the retrievers of
+    any number of accessors so documents referenced from many specs are
+    retrieved, parsed and held in memory once. Entries are never
+    refreshed; use ``invalidate`` or ``clear`` when documents change.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[tuple[str, Hashable], Resource[Schema]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(
+        self, uri: str, specification: Specification[Schema]
+    ) -> Resource[Schema] | None:
+        key = self._make_key(uri, specification)
+        with self._lock:
+            resource = self._cache.get(key)
+            if resource is not None:
+                self._cache.move_to_end(key)
+            return resource
+
+    def set(
+        self,
+        uri: str,
+        specification: Specification[Schema],
+        resource: Resource[Schema],
+    ) -> None:
+        if self._maxsize <= 0:
+            return
+        key = self._make_key(uri, specification)
+        with self._lock:
+            self._cache[key] = resource
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, uri: str) -> None:
+        """Drop every entry for *uri*."""
+        uri = normalize_uri(uri)
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == uri]:
+                del self._cache[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _make_key(
+        self, uri: str, specification: Specification[Any]
+    ) -> tuple[str, Hashable]:
+        return normalize_uri(uri), specification
+
+
+shared_resource_cache = ResourceCache()
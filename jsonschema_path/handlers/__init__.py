@@ -1,6 +1,9 @@
 from typing import TYPE_CHECKING
 
 from jsonschema_path.handlers.file import FileHandler
+from jsonschema_path.handlers.file import FilePathHandler
+from jsonschema_path.handlers.package import PackageResourceHandler
+from jsonschema_path.handlers.package import register_package_scheme
 from jsonschema_path.handlers.urllib import UrllibHandler
 
 if TYPE_CHECKING:
@@ -15,11 +18,17 @@ else:
 
 __all__ = ["FileHandler", "UrlHandler"]
 
+# NOTE: process-wide side effect. The default handlers serve
+# ``package://`` URIs, so ``urljoin`` is taught to resolve relative
+# references against them (see ``register_package_scheme``).
+register_package_scheme()
+
 file_handler = FileHandler()
 all_urls_handler = UrllibHandler("http", "https", "file")
 default_handlers = {
     "<all_urls>": all_urls_handler,
     "http": UrlHandler("http"),
     "https": UrlHandler("https"),
-    "file": UrllibHandler("file"),
+    "file": FilePathHandler(),
+    "package": PackageResourceHandler(),
 }
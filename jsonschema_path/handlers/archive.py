@@ -0,0 +1,101 @@
+"""JSONSchema spec handlers archive module."""
+
+import os
+import threading
+from typing import Any
+from typing import ContextManager
+from typing import cast
+from zipfile import ZipFile
+from zipfile import ZipInfo
+
+from jsonschema_path.handlers.file import BaseFilePathHandler
+from jsonschema_path.handlers.file import FileHandler
+from jsonschema_path.handlers.protocols import SupportsReadBytes
+from jsonschema_path.handlers.urllib import UrllibHandler
+from jsonschema_path.handlers.utils import uri_to_path
+
+
+class ZipArchiveHandler(BaseFilePathHandler):
+    """Zip archive file path handler.
+
+    Serves ``file`` URIs pointing inside ``archive_path`` as if the
+    archive was a directory, e.g. ``file:///srv/bundle.zip/openapi.yaml``,
+    so relative ``$ref``s between bundled documents resolve to archive
+    members. The archive is opened and its member index built once, on
+    first use, and kept open until :meth:`close`, or the end of a
+    ``with`` block using the handler. Other URIs are passed to
+    ``fallback_handler``.
+    """
+
+    allowed_schemes = ("file",)
+
+    def __init__(
+        self,
+        archive_path: str | os.PathLike[str],
+        *allowed_schemes: str,
+        file_handler: FileHandler | None = None,
+        fallback_handler: Any = None,
+    ):
+        super().__init__(*allowed_schemes, file_handler=file_handler)
+        self.archive_path = os.path.abspath(archive_path)
+        self.fallback_handler = fallback_handler or UrllibHandler(
+            *self.allowed_schemes
+        )
+        self._lock = threading.RLock()
+        self._zipfile: ZipFile | None = None
+        self._members: dict[str, ZipInfo] = {}
+
+    def __call__(self, uri: str) -> Any:
+        self._check_scheme(uri)
+        if self.get_member_name(uri) is None:
+            return self.fallback_handler(uri)
+        return super().__call__(uri)
+
+    def get_member_name(self, uri: str) -> str | None:
+        """Return the archive member name of *uri*, or ``None`` if it
+        points outside the archive."""
+        path = uri_to_path(uri)
+        prefix = self.archive_path + os.sep
+        if not path.startswith(prefix):
+            return None
+        return path[len(prefix) :].replace(os.sep, "/")
+
+    def __enter__(self) -> "ZipArchiveHandler":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the archive; it is reopened if used again."""
+        with self._lock:
+            if self._zipfile is not None:
+                self._zipfile.close()
+                self._zipfile = None
+                self._members = {}
+
+    def _open(self, uri: str) -> ContextManager[SupportsReadBytes]:
+        name = self.get_member_name(uri)
+        # Held until the member is open, which keeps the archive file
+        # open past a concurrent `close`.
+        with self._lock:
+            zipfile, members = self._get_zipfile()
+            try:
+                info = members[name or ""]
+            except KeyError:
+                raise FileNotFoundError(
+                    f"No such member in {self.archive_path}: {name}"
+                ) from None
+            return cast(ContextManager[SupportsReadBytes], zipfile.open(info))
+
+    def _get_zipfile(self) -> tuple[ZipFile, dict[str, ZipInfo]]:
+        # The archive and its member index, as one snapshot.
+        with self._lock:
+            if self._zipfile is None:
+                self._zipfile = ZipFile(self.archive_path)
+                self._members = {
+                    info.filename: info
+                    for info in self._zipfile.infolist()
+                    if not info.is_dir()
+                }
+            return self._zipfile, self._members
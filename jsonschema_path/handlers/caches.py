@@ -0,0 +1,212 @@
+"""JSONSchema spec handlers caches module."""
+
+import hashlib
+import marshal
+import os
+import tempfile
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any
+
+MISSING = object()
+
+
+class DocumentCache:
+    """Persistent on-disk cache of parsed documents.
+
+    Entries are ``marshal`` snapshots stored in *directory* and keyed by
+    the absolute file path and a caller supplied *key* (the parser
+    configuration). Each entry records the file mtime, size and content
+    hash; an entry is only used when all of them match the file on disk,
+    otherwise the file is parsed again and the entry is rewritten.
+
+    Entries are written atomically, so concurrent processes sharing one
+    cache directory never observe partial files. Unreadable entries are
+    treated as misses and write failures are ignored.
+    """
+
+    format_version = 1
+
+    def __init__(self, directory: str | os.PathLike[str]):
+        self.directory = os.fspath(directory)
+
+    def load(
+        self,
+        path: str | os.PathLike[str],
+        parse: Callable[[bytes], Any],
+        key: str = "",
+    ) -> Any:
+        path = os.path.abspath(path)
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            content = f.read()
+
+        signature = (
+            self.format_version,
+            path,
+            key,
+            stat.st_mtime_ns,
+            stat.st_size,
+            hashlib.sha256(content).hexdigest(),
+        )
+        entry_path = self._get_entry_path(path, key)
+
+        data = self._read_entry(entry_path, signature)
+        if data is not MISSING:
+            return data
+
+        data = parse(content)
+        self._write_entry(entry_path, signature, data)
+        return data
+
+    def clear(self) -> None:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.endswith(".marshal"):
+                os.unlink(os.path.join(self.directory, name))
+
+    def _get_entry_path(self, path: str, key: str) -> str:
+        name = hashlib.sha256(f"{path}\0{key}".encode()).hexdigest()
+        return os.path.join(self.directory, f"{name}.marshal")
+
+    def _read_entry(self, entry_path: str, signature: tuple[Any, ...]) -> Any:
+        try:
+            with open(entry_path, "rb") as f:
+                entry_signature, data = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return MISSING
+
+        if entry_signature != signature:
+            return MISSING
+        return data
+
+    def _write_entry(
+        self, entry_path: str, signature: tuple[Any, ...], data: Any
+    ) -> None:
+        try:
+            payload = marshal.dumps((signature, data))
+        except ValueError:
+            # Not a plain JSON-like document; skip caching.
+            return
+
+        # Caching is best effort; an unwritable directory only costs
+        # the parse on the next load.
+        write_file_atomic(self.directory, entry_path, payload)
+
+
+@dataclass(frozen=True)
+class HttpCacheEntry:
+    """Cached HTTP response body with its validators."""
+
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    content_type: str | None = None
+
+    @classmethod
+    def from_headers(cls, body: bytes, headers: Any) -> "HttpCacheEntry":
+        return cls(
+            body=body,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            content_type=headers.get("Content-Type"),
+        )
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Response headers of the cached body."""
+        if self.content_type is None:
+            return {}
+        return {"Content-Type": self.content_type}
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers revalidating this entry."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def open(self) -> "ResponseBodyStream":
+        return ResponseBodyStream(self.body, self.headers)
+
+
+class ResponseBodyStream(BytesIO):
+    """Binary response body stream exposing the response headers."""
+
+    def __init__(self, body: bytes, headers: Any):
+        super().__init__(body)
+        self.headers = headers
+
+
+class HttpCache:
+    """Persistent on-disk cache of remote documents.
+
+    URL handlers store each response body with its ``ETag`` and
+    ``Last-Modified`` validators and revalidate it with a conditional
+    request next time, reusing the stored body on ``304 Not Modified``.
+
+    In ``offline`` mode the network is never used: documents are served
+    from the cache only and missing ones raise ``LookupError``.
+    """
+
+    format_version = 1
+
+    def __init__(
+        self, directory: str | os.PathLike[str], offline: bool = False
+    ):
+        self.directory = os.fspath(directory)
+        self.offline = offline
+
+    def get(self, uri: str) -> HttpCacheEntry | None:
+        try:
+            with open(self._get_entry_path(uri), "rb") as f:
+                version, entry_uri, fields = marshal.load(f)
+            if version != self.format_version or entry_uri != uri:
+                return None
+            return HttpCacheEntry(*fields)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    def set(self, uri: str, entry: HttpCacheEntry) -> None:
+        fields = (
+            entry.body,
+            entry.etag,
+            entry.last_modified,
+            entry.content_type,
+        )
+        payload = marshal.dumps((self.format_version, uri, fields))
+        write_file_atomic(self.directory, self._get_entry_path(uri), payload)
+
+    def get_offline(self, uri: str) -> HttpCacheEntry:
+        entry = self.get(uri)
+        if entry is None:
+            raise LookupError(f"{uri} is not in the offline HTTP cache")
+        return entry
+
+    def _get_entry_path(self, uri: str) -> str:
+        name = hashlib.sha256(uri.encode()).hexdigest()
+        return os.path.join(self.directory, f"{name}.marshal")
+
+
+def write_file_atomic(directory: str, path: str, payload: bytes) -> None:
+    """Write *payload* to *path* atomically, ignoring ``OSError``."""
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        with suppress(OSError):
+            os.unlink(tmp_path)
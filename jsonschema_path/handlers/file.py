@@ -1,29 +1,328 @@
 """JSONSchema spec handlers file module."""
 
-from json import dumps
-from json import loads
+import codecs
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import partial
+from io import BufferedReader
+from io import BytesIO
+from io import StringIO
+from io import TextIOWrapper
 from typing import Any
+from typing import BinaryIO
 from typing import ContextManager
+from typing import cast
 from urllib.parse import urlparse
 
 from yaml import load
+from yaml import load_all
 
+from jsonschema_path.backends import JsonBackend
+from jsonschema_path.backends import get_default_json_backend
+from jsonschema_path.handlers.caches import DocumentCache
 from jsonschema_path.handlers.protocols import SupportsRead
+from jsonschema_path.handlers.protocols import SupportsReadBytes
+from jsonschema_path.handlers.utils import COMPRESSION_MAGIC_SIZE
+from jsonschema_path.handlers.utils import JSON_FORMAT
+from jsonschema_path.handlers.utils import JSON_LINES_FORMAT
+from jsonschema_path.handlers.utils import PrefixedStream
+from jsonschema_path.handlers.utils import get_charset
+from jsonschema_path.handlers.utils import guess_format
+from jsonschema_path.handlers.utils import iter_lines
+from jsonschema_path.handlers.utils import normalize_json_types
+from jsonschema_path.handlers.utils import open_decompressed
+from jsonschema_path.handlers.utils import read_prefix
+from jsonschema_path.handlers.utils import sniff_compression
+from jsonschema_path.handlers.utils import sniff_format
 from jsonschema_path.handlers.utils import uri_to_path
+from jsonschema_path.lazy import load_lazy
+from jsonschema_path.lazy import loads_lazy
+from jsonschema_path.lazy import loads_lazy_yaml
 from jsonschema_path.loaders import JsonschemaSafeLoader
+from jsonschema_path.sourcemaps import SourceMap
+from jsonschema_path.sourcemaps import load_yaml_located
+from jsonschema_path.sourcemaps import loads_json_located
+
+PREFIX_SIZE = 64
 
 
 class FileHandler:
-    """File-like object handler."""
+    """File-like object handler.
+
+    JSON documents are decoded with the JSON parser directly, skipping
+    the YAML parse and the normalising round-trip. The format is taken
+    from the URI suffix or the content type when given, otherwise from
+    the first non-whitespace character. YAML is used for everything
+    else, and as a fallback when a presumed JSON document fails to
+    decode. Set ``detect_json`` to ``False`` to always parse as YAML.
+
+    YAML documents are normalised to JSON types through a ``dumps`` /
+    ``loads`` round-trip, which copies every aliased subtree. With
+    ``preserve_aliases`` the document is normalised in place instead, so
+    ``&anchor``/``*alias`` subtrees stay shared objects.
+
+    JSON is decoded with ``json_backend``, or the process-wide default
+    backend (``orjson`` when installed) when not set.
+
+    Binary streams compressed with gzip, bzip2 or xz are detected by
+    their magic bytes and decompressed while parsing.
 
-    def __init__(self, loader: Any = JsonschemaSafeLoader):
+    With ``lazy``, nested objects and block mappings are decoded on first
+    access (see :mod:`jsonschema_path.lazy`), so resolving a fragment of
+    a large document only parses the part on the way to it.
+
+    With a ``source_map``, the line and column of every node are recorded
+    in it while parsing (see :mod:`jsonschema_path.sourcemaps`). JSON is
+    then decoded by a position-tracking decoder instead of
+    ``json_backend``, and ``lazy`` is ignored.
+
+    Subclasses overriding ``_load`` are handed a text stream for every
+    document, JSON included. Path handlers call subclasses overriding
+    ``__call__`` with the text stream as the only argument.
+    """
+
+    def __init__(
+        self,
+        loader: Any = JsonschemaSafeLoader,
+        detect_json: bool = True,
+        preserve_aliases: bool = False,
+        json_backend: JsonBackend | None = None,
+        lazy: bool = False,
+        source_map: SourceMap | None = None,
+    ):
         self.loader = loader
+        self.detect_json = detect_json
+        self.preserve_aliases = preserve_aliases
+        self.json_backend = json_backend
+        self.lazy = lazy
+        self.source_map = source_map
+
+    def __call__(
+        self,
+        stream: SupportsRead | SupportsReadBytes,
+        uri: str | None = None,
+        content_type: str | None = None,
+    ) -> Any:
+        if isinstance(stream, BytesIO) and stream.tell() == 0:
+            # Unread in-memory bodies are parsed in place.
+            return self.loads(
+                stream.getvalue(), uri=uri, content_type=content_type
+            )
+
+        prefix = read_prefix(cast(SupportsRead, stream))
+        stream = PrefixedStream(prefix, cast(SupportsRead, stream))
+        if isinstance(prefix, bytes):
+            compression = sniff_compression(prefix)
+            if compression is not None:
+                with open_decompressed(stream, compression) as decompressed:
+                    return self(decompressed, uri=uri)
+
+        if self._overrides_load():
+            return self._load_text(stream.read())
+
+        if self.source_map is not None:
+            return self._load_located(
+                self.source_map, stream.read(), uri, content_type, prefix
+            )
+
+        if self.lazy:
+            return self._load_lazy(stream.read(), uri, content_type, prefix)
+
+        if self.detect_json:
+            document_format = self._get_format(uri, content_type, prefix)
+            if document_format == JSON_FORMAT:
+                return self._load_json(stream.read())
+
+        return self._normalize(self._load(stream))
+
+    def loads(
+        self,
+        data: str | bytes | memoryview,
+        uri: str | None = None,
+        content_type: str | None = None,
+    ) -> Any:
+        """Parse a document held in memory.
+
+        ``bytes`` and ``memoryview`` buffers are handed to the parsers as
+        they are, without decoding them to text first.
+        """
+        prefix: str | bytes
+        if isinstance(data, str):
+            prefix = data[:PREFIX_SIZE]
+        else:
+            prefix = bytes(data[:PREFIX_SIZE])
+            compression = sniff_compression(prefix)
+            if compression is not None:
+                with open_decompressed(BytesIO(data), compression) as f:
+                    return self(f, uri=uri)
+
+        if self._overrides_load():
+            return self._load_text(data)
+
+        if self.source_map is not None:
+            return self._load_located(
+                self.source_map, data, uri, content_type, prefix
+            )
+
+        if self.lazy:
+            return self._load_lazy(data, uri, content_type, prefix)
+
+        if self.detect_json:
+            document_format = self._get_format(uri, content_type, prefix)
+            if document_format == JSON_FORMAT:
+                return self._load_json(data)
+
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return self._normalize(self._load(data))
+
+    def iter_documents(
+        self,
+        stream: SupportsRead | SupportsReadBytes,
+        uri: str | None = None,
+        content_type: str | None = None,
+    ) -> Iterator[Any]:
+        """Parse a stream of documents, one document at a time.
+
+        JSON Lines (a ``.jsonl`` or ``.ndjson`` URI, or a JSON Lines
+        content type) are decoded line by line, skipping blank lines.
+        Anything else is read as a YAML stream of ``---`` separated
+        documents, skipping empty (or ``null``) documents. Compressed
+        streams are decompressed.
+        """
+        prefix = read_prefix(cast(SupportsRead, stream))
+        stream = PrefixedStream(prefix, cast(SupportsRead, stream))
+        if isinstance(prefix, bytes):
+            compression = sniff_compression(prefix)
+            if compression is not None:
+                with open_decompressed(stream, compression) as decompressed:
+                    yield from self.iter_documents(
+                        decompressed, uri=uri, content_type=content_type
+                    )
+                return
+
+        if guess_format(uri, content_type) == JSON_LINES_FORMAT:
+            json_backend = self._get_json_backend()
+            for line in iter_lines(stream):
+                if line.strip():
+                    yield json_backend.loads(line)
+            return
+
+        for document in load_all(stream, self.loader):
+            # e.g. after a trailing ``---``
+            if document is not None:
+                yield self._normalize(document)
+
+    def _get_format(
+        self,
+        uri: str | None,
+        content_type: str | None,
+        prefix: str | bytes,
+    ) -> str:
+        document_format = guess_format(uri, content_type)
+        if document_format is None:
+            document_format = sniff_format(prefix)
+        return document_format
+
+    def _load_json(self, data: str | bytes | memoryview) -> Any:
+        try:
+            # NaN/Infinity are not JSON; let YAML decide what they mean.
+            return self._get_json_backend().loads(data, allow_nan=False)
+        except ValueError:
+            if isinstance(data, memoryview):
+                data = data.tobytes()
+            return self._normalize(self._load(data))
+
+    def _load_lazy(
+        self,
+        content: str | bytes | memoryview,
+        uri: str | None,
+        content_type: str | None,
+        prefix: str | bytes,
+    ) -> Any:
+        document_format = self._get_format(uri, content_type, prefix)
+        if document_format == JSON_FORMAT:
+            data = content.encode() if isinstance(content, str) else content
+            try:
+                return loads_lazy(data)
+            except ValueError:
+                return self._load_yaml(content)
+
+        if not isinstance(content, str):
+            try:
+                content = str(content, "utf-8-sig")
+            except UnicodeDecodeError:
+                # Leave other encodings to the YAML reader.
+                return self._load_yaml(content)
+        return loads_lazy_yaml(content, self._load_yaml)
+
+    def _load_located(
+        self,
+        source_map: SourceMap,
+        content: str | bytes | memoryview,
+        uri: str | None,
+        content_type: str | None,
+        prefix: str | bytes,
+    ) -> Any:
+        if isinstance(content, memoryview):
+            content = content.tobytes()
+        located = None
+        if self.detect_json:
+            document_format = self._get_format(uri, content_type, prefix)
+            if document_format == JSON_FORMAT:
+                try:
+                    located = loads_json_located(content)
+                except ValueError:
+                    pass
+        if located is None:
+            located = load_yaml_located(content, self.loader, self._normalize)
+        data, nodes = located
+        source_map.add(data, uri or "", nodes)
+        return data
+
+    def _overrides_load(self) -> bool:
+        return type(self)._load is not FileHandler._load
+
+    def _load_text(self, content: str | bytes | memoryview) -> Any:
+        # ``_load`` overrides get a text stream of the whole document and
+        # see JSON too, as before the binary stream and JSON fast paths.
+        if not isinstance(content, str):
+            content = bytes(content).decode("utf-8")
+        return self._normalize(self._load(StringIO(content)))
 
-    def __call__(self, stream: SupportsRead) -> Any:
-        data = self._load(stream)
-        return loads(dumps(data))
+    def _load_yaml(self, content: str | bytes | memoryview) -> Any:
+        if isinstance(content, memoryview):
+            content = content.tobytes()
+        return self._normalize(self._load(content))
 
-    def _load(self, stream: SupportsRead) -> Any:
+    @property
+    def cache_key(self) -> str:
+        """Parser configuration key for persistent document caches.
+
+        It covers every option that changes the parsed document.
+        """
+        handler = f"{type(self).__module__}.{type(self).__qualname__}"
+        loader = f"{self.loader.__module__}.{self.loader.__qualname__}"
+        return ":".join(
+            [
+                handler,
+                loader,
+                f"preserve_aliases={self.preserve_aliases}",
+                f"detect_json={self.detect_json}",
+                f"json_backend={self._get_json_backend().name}",
+            ]
+        )
+
+    def _normalize(self, data: Any) -> Any:
+        if self.preserve_aliases:
+            return normalize_json_types(data)
+        json_backend = self._get_json_backend()
+        return json_backend.loads(json_backend.dumps(data))
+
+    def _get_json_backend(self) -> JsonBackend:
+        return self.json_backend or get_default_json_backend()
+
+    def _load(self, stream: SupportsRead | str | bytes) -> Any:
         return load(stream, self.loader)
 
 
@@ -39,19 +338,67 @@ class BaseFilePathHandler:
         self.file_handler = file_handler or FileHandler()
 
     def __call__(self, uri: str) -> Any:
+        self._check_scheme(uri)
+
+        with self._open(uri) as stream:
+            content_type = self._get_content_type(stream)
+            if self._overrides_file_handler_call():
+                # ``__call__`` overrides keep getting the one text stream
+                # argument they were written for.
+                return self.file_handler(self._read_text(stream, content_type))
+            return self.file_handler(
+                stream, uri=uri, content_type=content_type
+            )
+
+    def _overrides_file_handler_call(self) -> bool:
+        return type(self.file_handler).__call__ is not FileHandler.__call__
+
+    def _read_text(
+        self,
+        stream: SupportsRead | SupportsReadBytes,
+        content_type: str | None,
+    ) -> SupportsRead:
+        data = stream.read()
+        if isinstance(data, str):
+            return StringIO(data)
+        compression = sniff_compression(data[:COMPRESSION_MAGIC_SIZE])
+        if compression is not None:
+            with open_decompressed(BytesIO(data), compression) as f:
+                data = f.read()
+        return StringIO(data.decode(get_charset(content_type) or "utf-8"))
+
+    def _check_scheme(self, uri: str) -> None:
         parsed_url = urlparse(uri)
         if parsed_url.scheme not in self.allowed_schemes:
             raise ValueError(f"Scheme {parsed_url.scheme} not allowed")
 
-        with self._open(uri) as stream:
-            return self.file_handler(stream)
-
-    def _open(self, uri: str) -> ContextManager[SupportsRead]:
+    def _open(
+        self, uri: str
+    ) -> ContextManager[SupportsRead | SupportsReadBytes]:
         raise NotImplementedError
 
+    def _get_content_type(
+        self, stream: SupportsRead | SupportsReadBytes
+    ) -> str | None:
+        headers = getattr(stream, "headers", None)
+        if headers is None:
+            return None
+        content_type: str | None = headers.get("Content-Type")
+        return content_type
+
 
 class FilePathHandler(BaseFilePathHandler):
-    """File path handler."""
+    """File path handler.
+
+    With a ``document_cache``, parsed documents are stored on disk and
+    unchanged files are loaded from the cache without parsing.
+
+    With ``lazy``, JSON files are memory-mapped and decoded on demand,
+    one object or array at a time (see :mod:`jsonschema_path.lazy`), and
+    other documents are read with a lazy ``FileHandler``. Lazy documents,
+    and documents read with a ``source_map``, are not stored in the
+    ``document_cache``.
+    """
 
     allowed_schemes = ("file",)
 
@@ -60,10 +407,85 @@ class FilePathHandler(BaseFilePathHandler):
         *allowed_schemes: str,
         file_handler: FileHandler | None = None,
         encoding: str = "utf-8",
+        document_cache: DocumentCache | None = None,
+        lazy: bool = False,
     ):
+        if file_handler is None and lazy:
+            file_handler = FileHandler(lazy=True)
         super().__init__(*allowed_schemes, file_handler=file_handler)
         self.encoding = encoding
+        self.document_cache = document_cache
+        self.lazy = lazy
+        # The parsers read (and decompress) UTF-8 bytes directly.
+        self._read_bytes = codecs.lookup(encoding).name == "utf-8"
+
+    def __call__(self, uri: str) -> Any:
+        if self._overrides_file_handler_call():
+            return super().__call__(uri)
+
+        if self.lazy:
+            self._check_scheme(uri)
+            data = self._load_lazy(uri)
+            if data is not None:
+                return data
+
+        if (
+            self.document_cache is None
+            or self.file_handler.lazy
+            or self.file_handler.source_map is not None
+        ):
+            return super().__call__(uri)
+
+        self._check_scheme(uri)
+        return self.document_cache.load(
+            uri_to_path(uri),
+            partial(self._parse, uri=uri),
+            key=self.file_handler.cache_key,
+        )
+
+    def _load_lazy(self, uri: str) -> Any:
+        # Returns ``None`` when the file is not lazily loadable JSON.
+        if self.encoding.lower().replace("-", "") != "utf8":
+            return None
+        with open(uri_to_path(uri), "rb") as f:
+            prefix = read_prefix(cast(SupportsRead, f))
+            if sniff_compression(prefix) is not None:
+                return None
+            document_format = guess_format(uri)
+            if document_format is None:
+                document_format = sniff_format(prefix)
+            if document_format != JSON_FORMAT:
+                return None
+            try:
+                return load_lazy(f)
+            except ValueError:
+                # Empty file or not JSON (e.g. a YAML flow mapping).
+                return None
+
+    def _parse(self, content: bytes, uri: str) -> Any:
+        if self._read_bytes:
+            return self.file_handler.loads(content, uri=uri)
+        stream = self._decode(BytesIO(content), content)
+        return self.file_handler(stream, uri=uri)
+
+    def _open(
+        self, uri: str
+    ) -> ContextManager[SupportsRead | SupportsReadBytes]:
+        # A plain buffered binary file, with no wrapper to enter, unless
+        # it has to be decoded.
+        f = open(uri_to_path(uri), "rb")
+        if self._read_bytes:
+            return f
+        return self._open_decoded(f)
+
+    @contextmanager
+    def _open_decoded(self, f: BufferedReader) -> Iterator[SupportsRead]:
+        with f:
+            yield self._decode(f, f.peek(COMPRESSION_MAGIC_SIZE))
 
-    def _open(self, uri: str) -> ContextManager[SupportsRead]:
-        filepath = uri_to_path(uri)
-        return open(filepath, encoding=self.encoding)
+    def _decode(self, stream: BinaryIO, prefix: bytes) -> SupportsRead:
+        # Compressed files are decompressed while being read.
+        compression = sniff_compression(prefix)
+        if compression is not None:
+            stream = open_decompressed(stream, compression)
+        return TextIOWrapper(stream, encoding=self.encoding)
@@ -0,0 +1,82 @@
+"""JSONSchema spec handlers package module."""
+
+import posixpath
+import sys
+import threading
+from importlib.resources import files
+from typing import ContextManager
+from typing import cast
+from urllib.parse import quote
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+from urllib.parse import uses_netloc
+from urllib.parse import uses_relative
+
+from jsonschema_path.handlers.file import BaseFilePathHandler
+from jsonschema_path.handlers.file import FileHandler
+from jsonschema_path.handlers.protocols import SupportsReadBytes
+
+if sys.version_info >= (3, 11):
+    from importlib.resources.abc import Traversable
+else:
+    from importlib.abc import Traversable
+
+PACKAGE_SCHEME = "package"
+
+
+def register_package_scheme() -> None:
+    """Let ``urljoin`` (and so ``$ref`` resolution) resolve relative
+    references against ``package://`` URIs.
+
+    NOTE: this adds the scheme to ``urllib.parse.uses_relative`` and
+    ``uses_netloc``, which affects URL joining for the whole process.
+    It is done when ``jsonschema_path.handlers`` registers the default
+    ``package`` handler, so ``package://`` base URIs work however they
+    are reached.
+    """
+    for schemes in (uses_relative, uses_netloc):
+        if PACKAGE_SCHEME not in schemes:
+            schemes.append(PACKAGE_SCHEME)
+
+
+def get_package_uri(package: str, resource: str) -> str:
+    """Return the ``package://`` URI of *resource* inside *package*."""
+    return f"{PACKAGE_SCHEME}://{package}/{quote(resource.lstrip('/'))}"
+
+
+class PackageResourceHandler(BaseFilePathHandler):
+    """Package resource handler.
+
+    Reads ``package://<package>/<resource>`` URIs through
+    ``importlib.resources``, so specs shipped inside installed packages,
+    wheels or zipapps are read in place, without extracting them to
+    files. Relative ``$ref``s resolve to resources of the same package
+    (see ``register_package_scheme``).
+    The resource root of each package is looked up once and reused.
+    """
+
+    allowed_schemes = (PACKAGE_SCHEME,)
+
+    def __init__(
+        self, *allowed_schemes: str, file_handler: FileHandler | None = None
+    ):
+        super().__init__(*allowed_schemes, file_handler=file_handler)
+        self._lock = threading.Lock()
+        self._roots: dict[str, Traversable] = {}
+
+    def _open(self, uri: str) -> ContextManager[SupportsReadBytes]:
+        parsed = urlsplit(uri)
+        path = posixpath.normpath(unquote(parsed.path)).lstrip("/")
+        if path in ("", "."):
+            raise FileNotFoundError(f"No such package resource: {uri}")
+
+        resource = self._get_root(parsed.netloc).joinpath(*path.split("/"))
+        return cast(ContextManager[SupportsReadBytes], resource.open("rb"))
+
+    def _get_root(self, package: str) -> Traversable:
+        root = self._roots.get(package)
+        if root is None:
+            root = files(package)
+            with self._lock:
+                root = self._roots.setdefault(package, root)
+        return root
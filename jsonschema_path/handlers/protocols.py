@@ -3,3 +3,7 @@ from typing import Protocol
 
 class SupportsRead(Protocol):
     def read(self, amount: int | None = 0) -> str: ...
+
+
+class SupportsReadBytes(Protocol):
+    def read(self, amount: int = -1, /) -> bytes: ...
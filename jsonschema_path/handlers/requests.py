@@ -1,18 +1,108 @@
 """JSONSchema spec handlers requests module."""
 
+import os
+import threading
 from contextlib import closing
 from io import StringIO
+from typing import Any
 from typing import ContextManager
+from typing import cast
+from weakref import WeakSet
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from jsonschema_path.handlers.caches import HttpCache
+from jsonschema_path.handlers.caches import HttpCacheEntry
+from jsonschema_path.handlers.caches import ResponseBodyStream
 from jsonschema_path.handlers.file import BaseFilePathHandler
 from jsonschema_path.handlers.file import FileHandler
 from jsonschema_path.handlers.protocols import SupportsRead
+from jsonschema_path.handlers.utils import get_charset
+from jsonschema_path.handlers.utils import is_http_uri
+
+UTF8_CHARSETS = ("utf-8", "utf8", "ascii", "us-ascii")
+
+
+class SessionFactory:
+    """Per-process pooled ``requests`` session.
+
+    The session keeps connections alive and pools them per host (up to
+    ``pool_maxsize`` each, across ``pool_connections`` hosts). With
+    ``pool_block`` the per-host limit is enforced by waiting for a free
+    connection instead of opening an extra, non-pooled one.
+
+    Pooled sockets must not be shared between processes, so a new
+    session is created on first use after ``os.fork()``.
+    """
+
+    _instances: "WeakSet[SessionFactory]" = WeakSet()
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._lock = threading.Lock()
+        self._session: requests.Session | None = None
+        self._instances.add(self)
+
+    def __call__(self) -> requests.Session:
+        session = self._session
+        if session is not None:
+            return session
+
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # Runs in the child, where the forking thread is the only one. A lock
+        # held by another thread at fork time stays locked in the child,
+        # so the inherited one is replaced rather than waited on.
+        for factory in list(cls._instances):
+            factory._lock = threading.Lock()
+            factory._session = None
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=SessionFactory._reset_after_fork)
+
+default_session_factory = SessionFactory()
+
+
+class ResponseStream(StringIO):
+    """Response body stream exposing the response headers."""
+
+    def __init__(self, text: str, headers: Any):
+        super().__init__(text)
+        self.headers = headers
 
 
 class UrlRequestsHandler(BaseFilePathHandler):
-    """URL (requests) scheme handler."""
+    """URL (requests) scheme handler.
+
+    Requests go through a pooled, fork-safe session from
+    ``session_factory`` (process-wide by default). With an ``http_cache``
+    responses are stored on disk and revalidated on later loads.
+    """
 
     def __init__(
         self,
@@ -20,14 +110,52 @@ class UrlRequestsHandler(BaseFilePathHandler):
         file_handler: FileHandler | None = None,
         timeout: int = 10,
         verify: bool | str | None = True,
+        session_factory: SessionFactory | None = None,
+        http_cache: HttpCache | None = None,
     ):
         super().__init__(*allowed_schemes, file_handler=file_handler)
         self.timeout = timeout
         self.verify = verify
+        self.session_factory = session_factory or default_session_factory
+        self.http_cache = http_cache
 
     def _open(self, uri: str) -> ContextManager[SupportsRead]:
-        response = requests.get(uri, timeout=self.timeout, verify=self.verify)
+        if self.http_cache is not None and is_http_uri(uri):
+            stream = self._open_cached(uri, self.http_cache)
+            return cast(ContextManager[SupportsRead], stream)
+
+        session = self.session_factory()
+        response = session.get(uri, timeout=self.timeout, verify=self.verify)
+        response.raise_for_status()
+
+        # Parse the raw body (which may be a compressed document) unless
+        # the server declares a charset the parsers cannot detect.
+        charset = get_charset(response.headers.get("Content-Type"))
+        if charset is not None and charset.lower() not in UTF8_CHARSETS:
+            data = ResponseStream(response.text, response.headers)
+            return closing(data)
+
+        body = ResponseBodyStream(response.content, response.headers)
+        return cast(ContextManager[SupportsRead], body)
+
+    def _open_cached(
+        self, uri: str, http_cache: HttpCache
+    ) -> ResponseBodyStream:
+        if http_cache.offline:
+            return http_cache.get_offline(uri).open()
+
+        entry = http_cache.get(uri)
+        session = self.session_factory()
+        response = session.get(
+            uri,
+            headers=entry.validators if entry is not None else None,
+            timeout=self.timeout,
+            verify=self.verify,
+        )
+        if entry is not None and response.status_code == 304:
+            return entry.open()
         response.raise_for_status()
 
-        data = StringIO(response.text)
-        return closing(data)
+        entry = HttpCacheEntry.from_headers(response.content, response.headers)
+        http_cache.set(uri, entry)
+        return entry.open()
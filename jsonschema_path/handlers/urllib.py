@@ -2,24 +2,64 @@
 
 from contextlib import closing
 from typing import ContextManager
+from typing import cast
+from urllib.error import HTTPError
+from urllib.request import Request
 from urllib.request import urlopen
 
+from jsonschema_path.handlers.caches import HttpCache
+from jsonschema_path.handlers.caches import HttpCacheEntry
+from jsonschema_path.handlers.caches import ResponseBodyStream
 from jsonschema_path.handlers.file import BaseFilePathHandler
 from jsonschema_path.handlers.file import FileHandler
 from jsonschema_path.handlers.protocols import SupportsRead
+from jsonschema_path.handlers.utils import is_http_uri
 
 
 class UrllibHandler(BaseFilePathHandler):
-    """URL (urllib) scheme handler."""
+    """URL (urllib) scheme handler.
+
+    With an ``http_cache`` HTTP responses are stored on disk and
+    revalidated on later loads.
+    """
 
     def __init__(
         self,
         *allowed_schemes: str,
         file_handler: FileHandler | None = None,
-        timeout: int = 10
+        timeout: int = 10,
+        http_cache: HttpCache | None = None,
     ):
         super().__init__(*allowed_schemes, file_handler=file_handler)
         self.timeout = timeout
+        self.http_cache = http_cache
 
     def _open(self, uri: str) -> ContextManager[SupportsRead]:
+        if self.http_cache is not None and is_http_uri(uri):
+            stream = self._open_cached(uri, self.http_cache)
+            return cast(ContextManager[SupportsRead], stream)
+
         return closing(urlopen(uri, timeout=self.timeout))
+
+    def _open_cached(
+        self, uri: str, http_cache: HttpCache
+    ) -> ResponseBodyStream:
+        if http_cache.offline:
+            return http_cache.get_offline(uri).open()
+
+        entry = http_cache.get(uri)
+        request = Request(
+            uri, headers=entry.validators if entry is not None else {}
+        )
+        try:
+            with urlopen(request, timeout=self.timeout) as response:
+                body = response.read()
+                headers = response.headers
+        except HTTPError as exc:
+            if entry is not None and exc.code == 304:
+                return entry.open()
+            raise
+
+        entry = HttpCacheEntry.from_headers(body, headers)
+        http_cache.set(uri, entry)
+        return entry.open()
@@ -1,9 +1,62 @@
+import bz2
+import gzip
+import lzma
 import os.path
 import urllib.parse
 import urllib.request
+from collections.abc import Iterator
+from functools import lru_cache
+from json import dumps
+from typing import Any
+from typing import BinaryIO
+from typing import cast
 
+from jsonschema_path.handlers.protocols import SupportsRead
 
+JSON_FORMAT = "json"
+JSON_LINES_FORMAT = "jsonl"
+YAML_FORMAT = "yaml"
+
+JSON_SUFFIXES = (".json",)
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+YAML_SUFFIXES = (".yaml", ".yml")
+JSON_LINES_MEDIA_TYPES = (
+    "application/jsonl",
+    "application/jsonlines",
+    "application/x-jsonlines",
+    "application/x-ndjson",
+)
+
+GZIP_COMPRESSION = "gzip"
+BZ2_COMPRESSION = "bz2"
+XZ_COMPRESSION = "xz"
+
+COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", GZIP_COMPRESSION),
+    (b"\xfd7zXZ\x00", XZ_COMPRESSION),
+)
+# "BZh" alone is plain text; bzip2 data follows it with a block size
+# digit and the magic of its first block (or of the end of the stream).
+BZ2_MAGIC = b"BZh"
+BZ2_BLOCK_SIZES = b"123456789"
+BZ2_BLOCK_MAGICS = (b"1AY&SY", b"\x17rE8P\x90")
+COMPRESSION_MAGIC_SIZE = 10
+COMPRESSION_SUFFIXES = (".gz", ".bz2", ".xz")
+
+URI_TO_PATH_CACHE_MAXSIZE = 4096
+
+JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+WHITESPACE = " \t\r\n"
+WHITESPACE_BYTES = b" \t\r\n"
+
+
+@lru_cache(maxsize=URI_TO_PATH_CACHE_MAXSIZE)
 def uri_to_path(uri: str) -> str:
+    """Return the local path of a ``file`` URI.
+
+    Results are memoised: the same ``$ref`` targets are converted over
+    and over while a spec is resolved."""
     parsed = urllib.parse.urlparse(uri)
     host = "{0}{0}{mnt}{0}".format(os.path.sep, mnt=parsed.netloc)
     return os.path.normpath(
@@ -12,3 +65,221 @@ def uri_to_path(uri: str) -> str:
             urllib.request.url2pathname(urllib.parse.unquote(parsed.path)),
         )
     )
+
+
+def is_http_uri(uri: str) -> bool:
+    return urllib.parse.urlsplit(uri).scheme in ("http", "https")
+
+
+def guess_format(
+    uri: str | None = None,
+    content_type: str | None = None,
+) -> str | None:
+    """Guess the document format from the URI suffix or the content type.
+
+    Returns ``None`` when neither hint is conclusive.
+    """
+    if uri:
+        path = urllib.parse.urlsplit(uri).path.lower()
+        if path.endswith(COMPRESSION_SUFFIXES):
+            path = os.path.splitext(path)[0]
+        if path.endswith(JSON_SUFFIXES):
+            return JSON_FORMAT
+        if path.endswith(JSON_LINES_SUFFIXES):
+            return JSON_LINES_FORMAT
+        if path.endswith(YAML_SUFFIXES):
+            return YAML_FORMAT
+
+    if content_type:
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        if media_type in JSON_LINES_MEDIA_TYPES:
+            return JSON_LINES_FORMAT
+        if media_type.endswith(("/json", "+json")):
+            return JSON_FORMAT
+        if media_type.endswith(("/yaml", "+yaml", "/x-yaml")):
+            return YAML_FORMAT
+
+    return None
+
+
+def get_charset(content_type: str | None) -> str | None:
+    """Return the ``charset`` parameter of a Content-Type header."""
+    if not content_type:
+        return None
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "charset":
+            return value.strip().strip("\"'") or None
+    return None
+
+
+def sniff_compression(prefix: bytes) -> str | None:
+    """Detect gzip, bzip2 or xz data from its magic bytes."""
+    for magic, compression in COMPRESSION_MAGIC:
+        if prefix.startswith(magic):
+            return compression
+    if (
+        prefix.startswith(BZ2_MAGIC)
+        and len(prefix) >= COMPRESSION_MAGIC_SIZE
+        and prefix[3] in BZ2_BLOCK_SIZES
+        and prefix[4:10] in BZ2_BLOCK_MAGICS
+    ):
+        return BZ2_COMPRESSION
+    return None
+
+
+def open_decompressed(stream: Any, compression: str) -> BinaryIO:
+    """Wrap a binary *stream* with a streaming decompressor.
+
+    Closing the result does not close *stream*.
+    """
+    decompressed: Any
+    if compression == GZIP_COMPRESSION:
+        decompressed = gzip.GzipFile(fileobj=stream, mode="rb")
+    elif compression == BZ2_COMPRESSION:
+        decompressed = bz2.BZ2File(stream)
+    elif compression == XZ_COMPRESSION:
+        decompressed = lzma.LZMAFile(stream)
+    else:
+        raise ValueError(f"Unsupported compression {compression}")
+    return cast(BinaryIO, decompressed)
+
+
+def sniff_format(prefix: str | bytes) -> str:
+    """Guess the document format from its first non-whitespace character.
+
+    Only a JSON object or array is treated as JSON; anything else
+    (including YAML flow collections, which fail JSON decoding and fall
+    back to YAML) is YAML.
+    """
+    if isinstance(prefix, bytes):
+        head = prefix.lstrip(WHITESPACE_BYTES)[:1]
+        return JSON_FORMAT if head in (b"{", b"[") else YAML_FORMAT
+    head_str = prefix.lstrip(WHITESPACE)[:1]
+    return JSON_FORMAT if head_str in ("{", "[") else YAML_FORMAT
+
+
+def read_prefix(stream: SupportsRead, chunk_size: int = 64) -> Any:
+    """Read from *stream* up to (and including) the first non-whitespace
+    chunk. The result is ``str`` or ``bytes`` depending on the stream."""
+    prefix = stream.read(chunk_size)
+    while prefix and not prefix.strip():
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        prefix += chunk
+    return prefix
+
+
+def iter_lines(stream: SupportsRead, chunk_size: int = 65536) -> Iterator[Any]:
+    """Yield the ``\\n`` separated lines of *stream*, without the
+    separators. The lines are ``str`` or ``bytes`` depending on the
+    stream."""
+    rest: Any = None
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if rest is None:
+            rest = chunk[:0]
+        lines = (rest + chunk).split(
+            b"\n" if isinstance(chunk, bytes) else "\n"
+        )
+        rest = lines.pop()
+        yield from lines
+    if rest:
+        yield rest
+
+
+class PrefixedStream:
+    """Read-only stream replaying an already consumed *prefix* before the
+    rest of the wrapped *stream*."""
+
+    def __init__(self, prefix: Any, stream: SupportsRead):
+        self.prefix = prefix
+        self.stream = stream
+
+    @property
+    def name(self) -> str:
+        return getattr(self.stream, "name", "<file>")
+
+    def read(self, amount: int | None = -1) -> Any:
+        prefix = self.prefix
+        if not prefix:
+            return self.stream.read(amount)
+
+        if amount is None or amount < 0:
+            self.prefix = prefix[:0]
+            return prefix + self.stream.read()
+
+        if amount <= len(prefix):
+            self.prefix = prefix[amount:]
+            return prefix[:amount]
+
+        self.prefix = prefix[:0]
+        return prefix + self.stream.read(amount - len(prefix))
+
+
+def _normalize_key(key: Any) -> str:
+    # Mirrors the key coercion of ``json.dumps``.
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, float):
+        return dumps(key)
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(
+        "keys must be str, int, float, bool or None, "
+        f"not {type(key).__name__}"
+    )
+
+
+def normalize_json_types(data: Any) -> Any:
+    """Coerce a loaded YAML document to JSON types in place.
+
+    Equivalent to ``loads(dumps(data))`` except that containers are
+    reused rather than copied, so subtrees shared through YAML
+    anchors/aliases stay shared.
+    """
+    done: set[int] = set()
+    active: set[int] = set()
+
+    def visit(node: Any) -> None:
+        if isinstance(node, JSON_SCALAR_TYPES):
+            return
+        node_id = id(node)
+        if node_id in done:
+            return
+        if node_id in active:
+            raise ValueError("Circular reference detected")
+
+        if isinstance(node, dict):
+            active.add(node_id)
+            if not all(isinstance(key, str) for key in node):
+                items = list(node.items())
+                node.clear()
+                for key, value in items:
+                    node[_normalize_key(key)] = value
+            for value in node.values():
+                visit(value)
+        elif isinstance(node, list):
+            active.add(node_id)
+            for item in node:
+                visit(item)
+        else:
+            raise TypeError(
+                f"Object of type {type(node).__name__} "
+                "is not JSON serializable"
+            )
+
+        active.discard(node_id)
+        done.add(node_id)
+
+    visit(data)
+    return data
@@ -0,0 +1,501 @@
+"""JSONSchema path lazy module.
+
+Lazy JSON documents are decoded one container at a time. A single
+structural scan over the raw bytes (usually a memory-mapped file) records
+the start and end offset of every object and array; ``LazyDict`` and
+``LazyList`` nodes then decode their direct children from those offsets
+on first access and turn into plain ``dict``/``list`` subclasses, so
+untouched subtrees are never decoded. The scan rejects (with
+``ValueError``) strings ``json.loads`` would reject and the non-standard
+``NaN``/``Infinity`` constants, so such documents are left to the eager
+parsers; other syntax errors inside a container are raised (as
+``ValueError``) when it is first accessed.
+
+YAML documents get the same treatment for nested block mappings, which
+are split into keys by indentation and parsed one mapping at a time.
+"""
+
+import json
+import mmap
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+from typing import BinaryIO
+
+from yaml import YAMLError
+
+# Strings as ``json.loads`` (strict) accepts them: no raw control
+# characters and only valid escapes.
+STRING_PATTERN = (
+    rb'"[^"\\\x00-\x1f]*'
+    rb'(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*"'
+)
+# Bytes JSON allows outside strings and brackets. Anything else (such as
+# the ``NaN`` and ``Infinity`` constants) fails the scan.
+TOKENS_PATTERN = rb"[ \t\n\r,:0-9.+\-eEtrufalsn]*"
+# Skips over strings and other bytes up to (and including) the next
+# bracket, so the scan loop only runs once per container boundary.
+STRUCTURE_RE = re.compile(
+    TOKENS_PATTERN + rb"(?:" + STRING_PATTERN + TOKENS_PATTERN + rb")*[\[\]{}]"
+)
+STRING_RE = re.compile(STRING_PATTERN)
+NUMBER_RE = re.compile(rb"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+WHITESPACE_RE = re.compile(rb"[ \t\n\r]*")
+
+COMPARISONS = frozenset(
+    ("__add__", "__eq__", "__ge__", "__gt__", "__le__", "__lt__", "__ne__")
+)
+CONSTANTS = {b"true": True, b"false": False, b"null": None}
+
+YAML_DOCUMENT_START_RE = re.compile(
+    r"\A(?:[ \t]*(?:#[^\n]*)?\n)*---[ \t]*(?:#[^\n]*)?\r?\n"
+)
+# Further documents, directives, and anchors (which aliases in other
+# parts of the document could refer to) disable lazy YAML decoding.
+YAML_UNSUPPORTED_RE = re.compile(
+    r"^(?:---|\.\.\.|%)|(?:^|[ \t\[{,])&[^\s,\[\]{}]+(?=[\s,\]}]|$)",
+    re.MULTILINE,
+)
+YAML_CONTENT_LINE_RE = re.compile(r"^( *)[^ #\r\n]", re.MULTILINE)
+YAML_KEY_RE = re.compile(
+    r"""(?:"[^"\\\n]*(?:\\.[^"\\\n]*)*"|'[^'\n]*(?:''[^'\n]*)*'"""
+    r"""|[^\s#'"{}\[\],&*!|>?%@`-][^\n]*?|-\S[^\n]*?)"""
+    r"[ \t]*:(?=[ \t]|\r?$)",
+    re.MULTILINE,
+)
+
+
+class LazyDocument:
+    """Source of lazily decoded containers."""
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+
+    def decode_object(self, start: int) -> list[tuple[str, Any]]:
+        raise NotImplementedError
+
+    def decode_array(self, start: int) -> list[Any]:
+        raise NotImplementedError
+
+
+class LazyJsonDocument(LazyDocument):
+    """Structural index of a JSON document held in ``data``."""
+
+    def __init__(self, data: Any):
+        super().__init__()
+        self.data = data
+        self.starts = array("q")
+        self.ends = array("q")
+        self._scan()
+
+    def get_end(self, start: int) -> int:
+        return self.ends[bisect_left(self.starts, start)]
+
+    def decode_value(self, pos: int) -> tuple[Any, int]:
+        """Decode the value at ``pos``; containers are returned lazy.
+
+        Returns the value and the offset following it.
+        """
+        data = self.data
+        char = data[pos]
+        if char == 0x7B:  # {
+            return LazyDict(self, pos), self.get_end(pos) + 1
+        if char == 0x5B:  # [
+            return LazyList(self, pos), self.get_end(pos) + 1
+        if char == 0x22:  # "
+            return self.decode_string(pos)
+        match = NUMBER_RE.match(data, pos)
+        if match is not None and match.end() > pos:
+            number = match.group()
+            end = match.end()
+            if b"." in number or b"e" in number or b"E" in number:
+                return float(number), end
+            return int(number), end
+        for constant, value in CONSTANTS.items():
+            if data[pos : pos + len(constant)] == constant:
+                return value, pos + len(constant)
+        raise self._error("Expecting value", pos)
+
+    def decode_string(self, pos: int) -> tuple[str, int]:
+        match = STRING_RE.match(self.data, pos)
+        if match is None:
+            raise self._error("Unterminated string", pos)
+        raw = match.group()
+        if b"\\" in raw:
+            return json.loads(raw), match.end()
+        return raw[1:-1].decode("utf-8"), match.end()
+
+    def decode_object(self, start: int) -> list[tuple[str, Any]]:
+        items = []
+        end = self.get_end(start)
+        pos = self._skip(start + 1)
+        while pos < end:
+            if self.data[pos] != 0x22:
+                raise self._error("Expecting property name", pos)
+            key, pos = self.decode_string(pos)
+            pos = self._skip(pos)
+            if self.data[pos] != 0x3A:  # :
+                raise self._error("Expecting ':' delimiter", pos)
+            value, pos = self.decode_value(self._skip(pos + 1))
+            items.append((key, value))
+            pos = self._skip_delimiter(pos, end)
+        return items
+
+    def decode_array(self, start: int) -> list[Any]:
+        items = []
+        end = self.get_end(start)
+        pos = self._skip(start + 1)
+        while pos < end:
+            value, pos = self.decode_value(pos)
+            items.append(value)
+            pos = self._skip_delimiter(pos, end)
+        return items
+
+    def _scan(self) -> None:
+        data = self.data
+        starts = self.starts
+        ends = self.ends
+        stack: list[int] = []
+        pos = -1
+        for match in STRUCTURE_RE.finditer(data):
+            if match.start() != pos + 1:
+                # Skipped bytes the pattern does not allow.
+                raise self._error("Invalid JSON", pos + 1)
+            pos = match.end() - 1
+            char = data[pos]
+            if char == 0x7B or char == 0x5B:
+                stack.append(len(starts))
+                starts.append(pos)
+                ends.append(-1)
+                continue
+            if not stack:
+                raise self._error("Unexpected closing bracket", pos)
+            index = stack.pop()
+            # {} and [] differ by 2 in ASCII.
+            if char - data[starts[index]] != 2:
+                raise self._error("Mismatched closing bracket", pos)
+            ends[index] = pos
+        if stack:
+            raise self._error("Unclosed bracket", starts[stack[-1]])
+
+    def _skip(self, pos: int) -> int:
+        match = WHITESPACE_RE.match(self.data, pos)
+        assert match is not None
+        return match.end()
+
+    def _skip_delimiter(self, pos: int, end: int) -> int:
+        pos = self._skip(pos)
+        if pos == end:
+            return pos
+        if self.data[pos] != 0x2C:  # ,
+            raise self._error("Expecting ',' delimiter", pos)
+        pos = self._skip(pos + 1)
+        if pos == end:
+            raise self._error("Illegal trailing comma", pos)
+        return pos
+
+    def _error(self, msg: str, pos: int) -> ValueError:
+        return ValueError(f"{msg}: char {pos}")
+
+
+class LazyYamlDocument(LazyDocument):
+    """Block mapping index of a YAML document held in ``text``.
+
+    A mapping is split into its keys by indentation alone. Values that are
+    nested block mappings stay lazy; all other values of one mapping are
+    parsed together with ``load``. Mappings the splitting cannot handle
+    are parsed with ``load`` as a whole.
+    """
+
+    def __init__(self, text: str, load: Callable[[str], Any]):
+        super().__init__()
+        self.text = text
+        self.load = load
+        self.ends: dict[int, int] = {}
+
+    def decode_object(self, start: int) -> list[tuple[str, Any]]:
+        text = self.text
+        end = self.ends[start]
+        first = YAML_CONTENT_LINE_RE.search(text, start, end)
+        if first is None:
+            return self._decode_eager(start, end)
+        indent = len(first.group(1))
+        keys = [
+            match.start()
+            for match in _get_key_line_re(indent).finditer(
+                text, first.start(), end
+            )
+        ]
+        if not keys or keys[0] != first.start():
+            return self._decode_eager(start, end)
+
+        pieces = []
+        children = []
+        for index, pos in enumerate(keys):
+            chunk_end = keys[index + 1] if index + 1 < len(keys) else end
+            line_end = text.find("\n", pos, chunk_end)
+            if line_end == -1:
+                line_end = chunk_end
+            child = self._find_child(pos, indent, line_end, chunk_end)
+            if child is None:
+                pieces.append(text[pos:chunk_end])
+            else:
+                # The key alone parses to ``None``; replaced below.
+                pieces.append(text[pos:line_end])
+                self.ends[child] = chunk_end
+            if not pieces[-1].endswith("\n"):
+                pieces.append("\n")
+            children.append(child)
+
+        try:
+            mapping = self.load("".join(pieces))
+        except YAMLError:
+            return self._decode_eager(start, end)
+        if not isinstance(mapping, dict) or len(mapping) != len(children):
+            # Duplicate or unusual keys.
+            return self._decode_eager(start, end)
+        return [
+            (key, value if child is None else LazyDict(self, child))
+            for (key, value), child in zip(mapping.items(), children)
+        ]
+
+    def _find_child(
+        self, pos: int, indent: int, line_end: int, end: int
+    ) -> int | None:
+        # Start of the nested block mapping value of the key line at
+        # ``pos``, if it has one.
+        text = self.text
+        match = YAML_KEY_RE.match(text, pos + indent, line_end)
+        if match is None:
+            return None
+        rest = text[match.end() : line_end].strip()
+        if rest and not rest.startswith("#"):
+            return None
+        first = YAML_CONTENT_LINE_RE.search(text, line_end, end)
+        if first is None or len(first.group(1)) <= indent:
+            return None
+        first_end = text.find("\n", first.start(), end)
+        if first_end == -1:
+            first_end = end
+        if YAML_KEY_RE.match(text, first.end() - 1, first_end) is None:
+            return None
+        return line_end + 1
+
+    def _decode_eager(self, start: int, end: int) -> list[tuple[str, Any]]:
+        data = self.load(self.text[start:end])
+        if not isinstance(data, dict):
+            raise ValueError(f"Expecting a mapping: char {start}")
+        return list(data.items())
+
+
+@lru_cache(maxsize=None)
+def _get_key_line_re(indent: int) -> re.Pattern[str]:
+    # Lines indented by exactly ``indent`` spaces, except comments and
+    # compact sequence entries.
+    return re.compile(
+        rf"^ {{{indent}}}(?=[^ #\r\n])(?!-(?:[ \t]|\r?$))", re.MULTILINE
+    )
+
+
+class LoadedDict(dict):  # type: ignore[type-arg]
+    """Materialised ``LazyDict``."""
+
+    __slots__ = ("_document", "_start")
+
+    def __reduce__(self) -> Any:
+        return dict, (dict(self),)
+
+
+class LoadedList(list):  # type: ignore[type-arg]
+    """Materialised ``LazyList``."""
+
+    __slots__ = ("_document", "_start")
+
+    def __reduce__(self) -> Any:
+        return list, (list(self),)
+
+
+def _materializing(base: type, name: str) -> Callable[..., Any]:
+    method = getattr(base, name)
+    # These read the other operand's storage directly.
+    reads_other = name in COMPARISONS
+
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        self._materialize()
+        if reads_other and isinstance(args[0], (LazyDict, LazyList)):
+            args[0]._materialize()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__qualname__ = f"{base.__name__}.{name}"
+    return wrapper
+
+
+class LazyDict(LoadedDict):
+    """JSON object decoded on first access."""
+
+    __slots__ = ()
+
+    def __init__(self, document: LazyDocument, start: int):
+        self._document = document
+        self._start = start
+
+    def _materialize(self) -> None:
+        document = self._document
+        with document.lock:
+            if type(self) is not LazyDict:
+                return
+            dict.update(self, document.decode_object(self._start))
+            self.__class__ = LoadedDict  # type: ignore[assignment]
+
+
+class LazyList(LoadedList):
+    """JSON array decoded on first access."""
+
+    __slots__ = ()
+
+    def __init__(self, document: LazyDocument, start: int):
+        self._document = document
+        self._start = start
+
+    def _materialize(self) -> None:
+        document = self._document
+        with document.lock:
+            if type(self) is not LazyList:
+                return
+            list.extend(self, document.decode_array(self._start))
+            self.__class__ = LoadedList  # type: ignore[assignment]
+
+
+for _name in (
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__getitem__",
+    "__ior__",
+    "__iter__",
+    "__len__",
+    "__ne__",
+    "__or__",
+    "__repr__",
+    "__reversed__",
+    "__ror__",
+    "__setitem__",
+    "clear",
+    "copy",
+    "get",
+    "items",
+    "keys",
+    "pop",
+    "popitem",
+    "setdefault",
+    "update",
+    "values",
+):
+    setattr(LazyDict, _name, _materializing(dict, _name))
+
+for _name in (
+    "__add__",
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__ge__",
+    "__getitem__",
+    "__gt__",
+    "__iadd__",
+    "__imul__",
+    "__iter__",
+    "__le__",
+    "__len__",
+    "__lt__",
+    "__mul__",
+    "__ne__",
+    "__repr__",
+    "__reversed__",
+    "__rmul__",
+    "__setitem__",
+    "append",
+    "clear",
+    "copy",
+    "count",
+    "extend",
+    "index",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    setattr(LazyList, _name, _materializing(list, _name))
+
+
+def materialize(value: Any) -> Any:
+    """Decode all lazy nodes below ``value`` and return it.
+
+    Needed before handing a lazy document to C-level serialisers such as
+    ``json.dumps`` or ``orjson``, which read the storage directly. Plain
+    containers never hold lazy nodes and are not walked, so this is cheap
+    for documents that were not loaded lazily.
+    """
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, LoadedDict):
+            stack.extend(node.values())
+        elif isinstance(node, LoadedList):
+            stack.extend(node)
+    return value
+
+
+def loads_lazy(data: Any) -> Any:
+    """Lazily decode the JSON document in a bytes-like ``data``.
+
+    The root container is decoded right away, its children on access.
+    """
+    document = LazyJsonDocument(data)
+    pos = document._skip(0)
+    if pos == len(data):
+        raise document._error("Expecting value", pos)
+    value, pos = document.decode_value(pos)
+    if document._skip(pos) != len(data):
+        raise document._error("Extra data", pos)
+    if isinstance(value, (LazyDict, LazyList)):
+        value._materialize()
+    return value
+
+
+def loads_lazy_yaml(text: str, load: Callable[[str], Any]) -> Any:
+    """Lazily decode the YAML document ``text`` using ``load`` to parse
+    its parts.
+
+    Documents that are not a block mapping, or that use anchors, are
+    parsed with ``load`` right away.
+    """
+    match = YAML_DOCUMENT_START_RE.match(text)
+    start = match.end() if match is not None else 0
+    if YAML_UNSUPPORTED_RE.search(text, start) is not None:
+        return load(text)
+    first = YAML_CONTENT_LINE_RE.search(text, start)
+    if first is None:
+        return load(text)
+    first_end = text.find("\n", first.start())
+    if first_end == -1:
+        first_end = len(text)
+    if YAML_KEY_RE.match(text, first.end() - 1, first_end) is None:
+        return load(text)
+
+    document = LazyYamlDocument(text, load)
+    document.ends[start] = len(text)
+    root = LazyDict(document, start)
+    root._materialize()
+    return root
+
+
+def load_lazy(fileobj: BinaryIO) -> Any:
+    """Lazily decode the JSON file ``fileobj`` through a memory map."""
+    data = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+    return loads_lazy(data)
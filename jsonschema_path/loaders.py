@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import cast
 
+from yaml.nodes import ScalarNode
+
 if TYPE_CHECKING:
     from yaml import SafeLoader
 else:
@@ -18,6 +20,11 @@ __all__ = [
     "SafeLoader",
 ]
 
+# Bounds of the plain scalar tag memo; long values (descriptions) are
+# rarely repeated.
+RESOLVE_CACHE_MAXSIZE = 4096
+RESOLVE_CACHE_MAX_LENGTH = 64
+
 
 SCIENTIFIC_FLOAT_RE = re.compile(
     r"""
@@ -64,15 +71,78 @@ class LimitedSafeLoader(type):
         )
 
 
+def merge_implicit_resolver(
+    loader: Any, tag: str, regexp: re.Pattern[str], first: Iterable[str]
+) -> None:
+    """Add an implicit resolver, folding ``regexp`` into an existing
+    resolver for the same ``tag`` so plain scalars are matched once."""
+    resolvers = loader.yaml_implicit_resolvers
+    for ch in first:
+        mappings = resolvers.setdefault(ch, [])
+        for index, (existing_tag, existing) in enumerate(mappings):
+            if existing_tag == tag:
+                merged = re.compile(
+                    f"(?:{existing.pattern})|(?:{regexp.pattern})",
+                    existing.flags | regexp.flags,
+                )
+                mappings[index] = (tag, merged)
+                break
+        else:
+            mappings.append((tag, regexp))
+
+
 class JsonschemaSafeLoader(
     metaclass=LimitedSafeLoader,
     exclude_resolvers={"tag:yaml.org,2002:timestamp"},
 ):
-    """A safe YAML loader that leaves timestamps as strings."""
+    """A safe YAML loader that leaves timestamps as strings.
+
+    Plain scalar tags are memoized per value: spec documents repeat the
+    same keys and keywords many times, and every resolution otherwise runs
+    Python-level regex matching even with the C parser. Strings, the most
+    common scalars, are constructed without the generic checks.
+    """
 
+    def resolve(self, kind: Any, value: Any, implicit: Any) -> Any:
+        # ``SafeLoader`` is added as a base by the metaclass.
+        base: Any = super()
+        if kind is not ScalarNode or not implicit[0]:
+            return base.resolve(kind, value, implicit)
 
-cast(type[SafeLoader], JsonschemaSafeLoader).add_implicit_resolver(  # type: ignore[no-untyped-call]
+        # One memo per loader class, as subclasses may change resolvers.
+        cls = type(self)
+        resolved_tags: dict[str, str] | None = cls.__dict__.get(
+            "_resolved_tags"
+        )
+        if resolved_tags is None:
+            resolved_tags = {}
+            setattr(cls, "_resolved_tags", resolved_tags)
+        try:
+            return resolved_tags[value]
+        except KeyError:
+            pass
+        tag = base.resolve(kind, value, implicit)
+        if (
+            len(value) <= RESOLVE_CACHE_MAX_LENGTH
+            and len(resolved_tags) < RESOLVE_CACHE_MAXSIZE
+            and not base.yaml_path_resolvers
+        ):
+            resolved_tags[value] = tag
+        return tag
+
+    def construct_yaml_str(self, node: Any) -> Any:
+        if type(node) is ScalarNode:
+            return node.value
+        base: Any = super()
+        return base.construct_yaml_str(node)
+
+
+cast(Any, JsonschemaSafeLoader).add_constructor(
+    "tag:yaml.org,2002:str", JsonschemaSafeLoader.construct_yaml_str
+)
+merge_implicit_resolver(
+    JsonschemaSafeLoader,
     "tag:yaml.org,2002:float",
     SCIENTIFIC_FLOAT_RE,
-    list("-+0123456789."),
+    "-+0123456789.",
 )
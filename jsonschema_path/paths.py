@@ -3,26 +3,50 @@
 from __future__ import annotations
 
 import os
+import re
 import warnings
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
 from collections.abc import Iterator
+from collections.abc import Mapping
 from collections.abc import Sequence
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 from typing import TypeVar
 from typing import overload
+from urllib.parse import urljoin
 
 from pathable import AccessorPath
+from referencing import Resource
 from referencing import Specification
 from referencing._core import Resolved
 from referencing.jsonschema import DRAFT202012
 
 from jsonschema_path.accessors import SchemaAccessor
+from jsonschema_path.caches import ResourceCache
+from jsonschema_path.handlers import UrlHandler
 from jsonschema_path.handlers import default_handlers
+from jsonschema_path.handlers import file_handler
+from jsonschema_path.handlers.archive import ZipArchiveHandler
+from jsonschema_path.handlers.caches import DocumentCache
+from jsonschema_path.handlers.file import FileHandler
+from jsonschema_path.handlers.file import FilePathHandler
+from jsonschema_path.handlers.package import get_package_uri
 from jsonschema_path.handlers.protocols import SupportsRead
+from jsonschema_path.handlers.protocols import SupportsReadBytes
+from jsonschema_path.lazy import materialize
+from jsonschema_path.readers import BytesReader
+from jsonschema_path.readers import DirectoryReader
 from jsonschema_path.readers import FilePathReader
 from jsonschema_path.readers import FileReader
 from jsonschema_path.readers import PathReader
+from jsonschema_path.retrievers import RetrievalPolicy
+from jsonschema_path.sourcemaps import SourceLocation
+from jsonschema_path.sourcemaps import SourceMap
+from jsonschema_path.typing import AsyncResolverHandlers
 from jsonschema_path.typing import ResolverHandlers
 from jsonschema_path.typing import Schema
 from jsonschema_path.typing import SchemaKey
@@ -35,6 +59,7 @@ TDefault = TypeVar("TDefault")
 TSchemaPath = TypeVar("TSchemaPath", bound="SchemaPath")
 
 SPEC_SEPARATOR = "#"
+ABSOLUTE_URI_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:")
 NOTSET = object()
 
 
@@ -107,6 +132,12 @@ class SchemaPath(AccessorPath[SchemaNode, SchemaKey, SchemaValue]):
         resolved_cache_maxsize: int = 0,
         spec_url: str | None = None,
         ref_resolver_handlers: ResolverHandlers | None = None,
+        prefetch: bool = False,
+        resource_cache: ResourceCache | None = None,
+        source_map: SourceMap | None = None,
+        resources: Mapping[str, Schema | Resource[Schema]] | None = None,
+        retrieval_policy: RetrievalPolicy | None = None,
+        async_handlers: AsyncResolverHandlers | None = None,
     ) -> TSchemaPath:
         if spec_url is not None:
             warnings.warn(
@@ -128,6 +159,12 @@ class SchemaPath(AccessorPath[SchemaNode, SchemaKey, SchemaValue]):
             base_uri=base_uri,
             handlers=handlers,
             resolved_cache_maxsize=resolved_cache_maxsize,
+            prefetch=prefetch,
+            resource_cache=resource_cache,
+            source_map=source_map,
+            resources=resources,
+            retrieval_policy=retrieval_policy,
+            async_handlers=async_handlers,
         )
 
         return cls(accessor, *args, separator=separator)
@@ -137,13 +174,27 @@ class SchemaPath(AccessorPath[SchemaNode, SchemaKey, SchemaValue]):
         cls: type[TSchemaPath],
         path: Path,
         resolved_cache_maxsize: int = 0,
+        document_cache: DocumentCache | None = None,
+        prefetch: bool = False,
+        resource_cache: ResourceCache | None = None,
+        lazy: bool = False,
+        source_map: SourceMap | None = None,
     ) -> TSchemaPath:
-        reader = PathReader(path)
+        reader = PathReader(
+            path,
+            document_cache=document_cache,
+            lazy=lazy,
+            source_map=source_map,
+        )
         data, base_uri = reader.read()
         return cls.from_dict(
             data,
             base_uri=base_uri,
+            handlers=cls._get_file_handlers(document_cache, lazy, source_map),
             resolved_cache_maxsize=resolved_cache_maxsize,
+            prefetch=prefetch,
+            resource_cache=resource_cache,
+            source_map=source_map,
         )
 
     @classmethod
@@ -151,22 +202,119 @@ class SchemaPath(AccessorPath[SchemaNode, SchemaKey, SchemaValue]):
         cls: type[TSchemaPath],
         file_path: str,
         resolved_cache_maxsize: int = 0,
+        document_cache: DocumentCache | None = None,
+        prefetch: bool = False,
+        resource_cache: ResourceCache | None = None,
+        lazy: bool = False,
+        source_map: SourceMap | None = None,
     ) -> TSchemaPath:
-        reader = FilePathReader(file_path)
+        reader = FilePathReader(
+            file_path,
+            document_cache=document_cache,
+            lazy=lazy,
+            source_map=source_map,
+        )
         data, base_uri = reader.read()
         return cls.from_dict(
             data,
             base_uri=base_uri,
+            handlers=cls._get_file_handlers(document_cache, lazy, source_map),
+            resolved_cache_maxsize=resolved_cache_maxsize,
+            prefetch=prefetch,
+            resource_cache=resource_cache,
+            source_map=source_map,
+        )
+
+    @classmethod
+    def from_archive(
+        cls: type[TSchemaPath],
+        archive_path: str | os.PathLike[str],
+        member: str,
+        resolved_cache_maxsize: int = 0,
+        prefetch: bool = False,
+        resource_cache: ResourceCache | None = None,
+        archive_handler: ZipArchiveHandler | None = None,
+    ) -> TSchemaPath:
+        """Load the *member* document of a zip archive.
+
+        Relative ``$ref``s are served from the same archive, through
+        ``archive_handler`` when given. The archive stays open while the
+        handler is in use; pass your own handler to close it (with
+        ``close()`` or a ``with`` block) when done with the spec.
+        """
+        handler = archive_handler
+        if handler is None:
+            handler = ZipArchiveHandler(archive_path)
+        elif handler.archive_path != os.path.abspath(archive_path):
+            raise ValueError(
+                f"archive_handler serves {handler.archive_path}, "
+                f"not {archive_path}"
+            )
+        base_uri = Path(handler.archive_path, member).as_uri()
+        data = handler(base_uri)
+        return cls.from_dict(
+            data,
+            base_uri=base_uri,
+            handlers={**default_handlers, "file": handler},
             resolved_cache_maxsize=resolved_cache_maxsize,
+            prefetch=prefetch,
+            resource_cache=resource_cache,
+        )
+
+    @classmethod
+    def from_package_resource(
+        cls: type[TSchemaPath],
+        package: str,
+        resource: str,
+        resolved_cache_maxsize: int = 0,
+        prefetch: bool = False,
+        resource_cache: ResourceCache | None = None,
+    ) -> TSchemaPath:
+        """Load the *resource* document shipped inside *package*.
+
+        The document is read through ``importlib.resources``, also from
+        wheels and zipapps, and relative ``$ref``s are served from the
+        same package.
+        """
+        base_uri = get_package_uri(package, resource)
+        data = default_handlers["package"](base_uri)
+        return cls.from_dict(
+            data,
+            base_uri=base_uri,
+            resolved_cache_maxsize=resolved_cache_maxsize,
+            prefetch=prefetch,
+            resource_cache=resource_cache,
+        )
+
+    @classmethod
+    def from_bytes(
+        cls: type[TSchemaPath],
+        data: bytes | memoryview,
+        base_uri: str = "",
+        resolved_cache_maxsize: int = 0,
+        prefetch: bool = False,
+        resource_cache: ResourceCache | None = None,
+    ) -> TSchemaPath:
+        """Load a JSON or YAML document from an in-memory buffer."""
+        reader = BytesReader(data)
+        schema, _ = reader.read()
+        return cls.from_dict(
+            schema,
+            base_uri=base_uri,
+            resolved_cache_maxsize=resolved_cache_maxsize,
+            prefetch=prefetch,
+            resource_cache=resource_cache,
         )
 
     @classmethod
     def from_file(
         cls: type[TSchemaPath],
-        fileobj: SupportsRead,
+        fileobj: SupportsRead | SupportsReadBytes,
         base_uri: str = "",
         spec_url: str | None = None,
         resolved_cache_maxsize: int = 0,
+        prefetch: bool = False,
+        resource_cache: ResourceCache | None = None,
     ) -> TSchemaPath:
         reader = FileReader(fileobj)
         data, _ = reader.read()
@@ -175,8 +323,160 @@ class SchemaPath(AccessorPath[SchemaNode, SchemaKey, SchemaValue]):
             base_uri=base_uri,
             spec_url=spec_url,
             resolved_cache_maxsize=resolved_cache_maxsize,
+            prefetch=prefetch,
+            resource_cache=resource_cache,
         )
 
+    @classmethod
+    def from_documents(
+        cls: type[TSchemaPath],
+        documents: Iterable[Schema],
+        uris: Iterable[str] | None = None,
+        base_uri: str = "",
+        specification: Specification[Schema] = DRAFT202012,
+        handlers: ResolverHandlers = default_handlers,
+        resolved_cache_maxsize: int = 0,
+        resource_cache: ResourceCache | None = None,
+    ) -> dict[str, TSchemaPath]:
+        """Load many documents into one shared registry.
+
+        Documents are registered under their ``uris`` when given,
+        otherwise under their ``$id`` resolved against ``base_uri``.
+        Returns the paths keyed by URI; ``$ref``s between the documents
+        resolve without retrieval, and retrieved documents are shared
+        (see ``SchemaAccessor.from_documents``).
+        """
+        if uris is None:
+            pairs: Iterable[tuple[str, Schema]] = (
+                (
+                    cls._get_document_uri(document, base_uri, specification),
+                    document,
+                )
+                for document in documents
+            )
+        else:
+            pairs = zip(uris, documents, strict=True)
+        accessors = SchemaAccessor.from_documents(
+            pairs,
+            specification=specification,
+            handlers=handlers,
+            resolved_cache_maxsize=resolved_cache_maxsize,
+            resource_cache=resource_cache,
+        )
+        return {uri: cls(accessor) for uri, accessor in accessors.items()}
+
+    @classmethod
+    def from_file_documents(
+        cls: type[TSchemaPath],
+        fileobj: SupportsRead | SupportsReadBytes,
+        uris: Iterable[str] | None = None,
+        base_uri: str = "",
+        specification: Specification[Schema] = DRAFT202012,
+        handlers: ResolverHandlers = default_handlers,
+        resolved_cache_maxsize: int = 0,
+        resource_cache: ResourceCache | None = None,
+    ) -> dict[str, TSchemaPath]:
+        """Load every document of a multi-document YAML or JSON Lines
+        stream into one shared registry (see :meth:`from_documents`).
+
+        The documents are parsed one at a time. JSON Lines are recognised
+        by the suffix of ``base_uri`` or of the file name.
+        """
+        name = getattr(fileobj, "name", None)
+        hint = base_uri or (name if isinstance(name, str) else None)
+        return cls.from_documents(
+            file_handler.iter_documents(fileobj, uri=hint),
+            uris=uris,
+            base_uri=base_uri,
+            specification=specification,
+            handlers=handlers,
+            resolved_cache_maxsize=resolved_cache_maxsize,
+            resource_cache=resource_cache,
+        )
+
+    @classmethod
+    def from_directory(
+        cls: type[TSchemaPath],
+        path: str | os.PathLike[str],
+        pattern: str | None = None,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+        specification: Specification[Schema] = DRAFT202012,
+        resolved_cache_maxsize: int = 0,
+        document_cache: DocumentCache | None = None,
+        resource_cache: ResourceCache | None = None,
+    ) -> dict[str, TSchemaPath]:
+        """Load the documents of a directory tree into one shared
+        registry (see :meth:`from_documents`).
+
+        Files matching the glob ``pattern`` (by default every JSON and
+        YAML file) are parsed in parallel, on ``executor`` or on a thread
+        pool of ``max_workers`` threads; pass a ``ProcessPoolExecutor``
+        to parse YAML on several cores. They are registered under their
+        ``file://`` URIs, so ``$ref``s between them resolve without
+        further I/O. Returns the paths keyed by URI, ordered by path.
+        """
+        reader = DirectoryReader(
+            path,
+            pattern=pattern,
+            document_cache=document_cache,
+            executor=executor,
+            max_workers=max_workers,
+        )
+        accessors = SchemaAccessor.from_documents(
+            reader.read(),
+            specification=specification,
+            handlers=cls._get_file_handlers(document_cache),
+            resolved_cache_maxsize=resolved_cache_maxsize,
+            resource_cache=resource_cache,
+        )
+        return {uri: cls(accessor) for uri, accessor in accessors.items()}
+
+    @classmethod
+    def _get_document_uri(
+        cls,
+        document: Schema,
+        base_uri: str,
+        specification: Specification[Schema],
+    ) -> str:
+        if not isinstance(document, Mapping):
+            raise ValueError(
+                "Cannot register a document that is not an object "
+                f"({type(document).__name__}) by its id; pass uris"
+            )
+        document_id = specification.id_of(document)
+        if not document_id:
+            raise ValueError(
+                "Cannot register a document without an id; pass uris"
+            )
+        if base_uri and not ABSOLUTE_URI_RE.match(document_id):
+            document_id = urljoin(base_uri, document_id)
+        return document_id.rstrip("#")
+
+    @classmethod
+    def _get_file_handlers(
+        cls,
+        document_cache: DocumentCache | None,
+        lazy: bool = False,
+        source_map: SourceMap | None = None,
+    ) -> ResolverHandlers:
+        if source_map is not None:
+            # Record the positions of referenced documents too.
+            file_handler = FileHandler(source_map=source_map)
+            return {
+                **default_handlers,
+                "http": UrlHandler("http", file_handler=file_handler),
+                "https": UrlHandler("https", file_handler=file_handler),
+                "file": FilePathHandler(file_handler=file_handler),
+            }
+        if document_cache is None and not lazy:
+            return default_handlers
+        # Serve local `$ref`s the same way as the root document.
+        return {
+            **default_handlers,
+            "file": FilePathHandler(document_cache=document_cache, lazy=lazy),
+        }
+
     @property
     def base_uri(self) -> str:
         assert isinstance(self.accessor, SchemaAccessor)
@@ -256,11 +556,35 @@ class SchemaPath(AccessorPath[SchemaNode, SchemaKey, SchemaValue]):
     def as_uri(self) -> str:
         return f"#/{str(self)}"
 
+    def source_location(self) -> SourceLocation | None:
+        """Return the URI, line and column the path's node is defined at.
+
+        Needs the ``source_map`` the documents were loaded with; returns
+        ``None`` without one, or for nodes the map does not know.
+        Objects and arrays reached through ``$ref`` are located at their
+        definition in the referenced document.
+        """
+        assert isinstance(self.accessor, SchemaAccessor)
+        source_map = self.accessor.source_map
+        if source_map is None:
+            return None
+
+        with self.resolve() as resolved:
+            node = resolved.contents
+        if isinstance(node, (dict, list)):
+            location = source_map.locate(node)
+            if location is not None:
+                return location
+        if not self.parts:
+            return None
+        with self.parent.resolve() as resolved:
+            return source_map.locate(resolved.contents, self.parts[-1])
+
     @contextmanager
     def open(self) -> Any:
         """Open the path."""
         with self.resolve() as resolved:
-            yield resolved.contents
+            yield materialize(resolved.contents)
 
     @contextmanager
     def resolve(self) -> Iterator[Resolved[SchemaNode]]:
@@ -268,3 +592,22 @@ class SchemaPath(AccessorPath[SchemaNode, SchemaKey, SchemaValue]):
         assert isinstance(self.accessor, SchemaAccessor)
         with self.accessor.resolve(self.parts) as resolved:
             yield resolved
+
+    async def aread_value(self) -> SchemaValue:
+        """Return the path's value, awaiting retrieval of referenced
+        documents instead of blocking the event loop."""
+        assert isinstance(self.accessor, SchemaAccessor)
+        return await self.accessor.aread(self.parts)
+
+    @asynccontextmanager
+    async def aopen(self) -> AsyncIterator[Any]:
+        """Open the path without blocking the event loop."""
+        async with self.aresolve() as resolved:
+            yield materialize(resolved.contents)
+
+    @asynccontextmanager
+    async def aresolve(self) -> AsyncIterator[Resolved[SchemaNode]]:
+        """Resolve the path without blocking the event loop."""
+        assert isinstance(self.accessor, SchemaAccessor)
+        async with self.accessor.aresolve(self.parts) as resolved:
+            yield resolved
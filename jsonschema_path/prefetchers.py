@@ -0,0 +1,108 @@
+"""JSONSchema spec prefetchers module."""
+
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Any
+from urllib.parse import urldefrag
+from urllib.parse import urljoin
+
+from referencing import Registry
+from referencing import Resource
+from referencing import Specification
+
+from jsonschema_path.typing import Schema
+from jsonschema_path.utils import is_ref
+
+PREFETCH_MAX_WORKERS = 8
+
+
+def _id_of(specification: Specification[Schema], node: Any) -> str | None:
+    try:
+        return specification.id_of(node)
+    except (AttributeError, TypeError):
+        # Legacy `id` keyword shadowed by a property named "id".
+        return None
+
+
+def scan_refs(
+    contents: Any,
+    base_uri: str,
+    specification: Specification[Schema],
+) -> tuple[set[str], set[str]]:
+    """Collect the documents a document refers to.
+
+    Returns the absolute URIs (without fragments) of all ``$ref``
+    targets and of all embedded resources (``$id``) in *contents*.
+    """
+    refs: set[str] = set()
+    ids: set[str] = {base_uri}
+    visited: set[int] = set()
+    stack: list[tuple[Any, str]] = [(contents, base_uri)]
+    while stack:
+        node, node_base_uri = stack.pop()
+        if isinstance(node, dict):
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            node_id = _id_of(specification, node)
+            if node_id is not None:
+                node_base_uri = urljoin(node_base_uri, node_id)
+                ids.add(urldefrag(node_base_uri).url)
+            if is_ref(node):
+                refs.add(urldefrag(urljoin(node_base_uri, node["$ref"])).url)
+            stack.extend((value, node_base_uri) for value in node.values())
+        elif isinstance(node, list):
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            stack.extend((item, node_base_uri) for item in node)
+    return refs, ids
+
+
+def prefetch_resources(
+    registry: Registry[Schema],
+    retrieve: Callable[[str], Resource[Schema]],
+    contents: Schema,
+    base_uri: str,
+    specification: Specification[Schema],
+    max_workers: int = PREFETCH_MAX_WORKERS,
+) -> Registry[Schema]:
+    """Retrieve every external document reachable from *contents*.
+
+    External ``$ref`` targets are followed transitively and retrieved
+    concurrently on a bounded thread pool; the returned registry
+    contains all of them. Prefetching is best effort: documents that
+    fail to retrieve are skipped and fail as usual on first lookup.
+    """
+    refs, known = scan_refs(contents, base_uri, specification)
+    known.update(registry)
+    seen = set(known)
+    resources: list[tuple[str, Resource[Schema]]] = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: dict[Future[Resource[Schema]], str] = {}
+
+        def submit(uris: set[str]) -> None:
+            for uri in uris - seen:
+                seen.add(uri)
+                if uri:
+                    futures[executor.submit(retrieve, uri)] = uri
+
+        submit(refs)
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                uri = futures.pop(future)
+                try:
+                    resource = future.result()
+                except Exception:
+                    continue
+                resources.append((uri, resource))
+                refs, ids = scan_refs(resource.contents, uri, specification)
+                seen.update(ids)
+                submit(refs)
+
+    return registry.with_resources(resources)
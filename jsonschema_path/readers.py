@@ -1,10 +1,23 @@
 """JSONSchema spec readers module."""
 
+import os
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 from jsonschema_path.handlers import all_urls_handler
 from jsonschema_path.handlers import file_handler
+from jsonschema_path.handlers.caches import DocumentCache
+from jsonschema_path.handlers.file import FileHandler
+from jsonschema_path.handlers.file import FilePathHandler
 from jsonschema_path.handlers.protocols import SupportsRead
+from jsonschema_path.handlers.protocols import SupportsReadBytes
+from jsonschema_path.handlers.utils import JSON_FORMAT
+from jsonschema_path.handlers.utils import YAML_FORMAT
+from jsonschema_path.handlers.utils import guess_format
+from jsonschema_path.sourcemaps import SourceMap
 from jsonschema_path.typing import Schema
 
 
@@ -14,26 +27,134 @@ class BaseReader:
 
 
 class FileReader(BaseReader):
-    def __init__(self, fileobj: SupportsRead):
+    def __init__(self, fileobj: SupportsRead | SupportsReadBytes):
         self.fileobj = fileobj
 
     def read(self) -> tuple[Schema, str]:
         return file_handler(self.fileobj), ""
 
 
+class BytesReader(BaseReader):
+    def __init__(self, data: bytes | memoryview):
+        self.data = data
+
+    def read(self) -> tuple[Schema, str]:
+        return file_handler.loads(self.data), ""
+
+
 class PathReader(BaseReader):
-    def __init__(self, path: Path):
+    def __init__(
+        self,
+        path: Path,
+        document_cache: DocumentCache | None = None,
+        lazy: bool = False,
+        source_map: SourceMap | None = None,
+    ):
         self.path = path
+        self.document_cache = document_cache
+        self.lazy = lazy
+        self.source_map = source_map
 
     def read(self) -> tuple[Schema, str]:
         if not self.path.is_file():
             raise OSError(f"No such file: {self.path}")
 
         uri = self.path.as_uri()
+        if self.source_map is not None:
+            handler = FilePathHandler(
+                file_handler=FileHandler(source_map=self.source_map)
+            )
+            return handler(uri), uri
+
+        if self.lazy:
+            handler = FilePathHandler(
+                document_cache=self.document_cache, lazy=True
+            )
+            return handler(uri), uri
+
+        if self.document_cache is not None:
+            data = self.document_cache.load(
+                self.path,
+                partial(self._parse, uri=uri),
+                key=file_handler.cache_key,
+            )
+            return data, uri
+
         return all_urls_handler(uri), uri
 
+    def _parse(self, content: bytes, uri: str) -> Any:
+        # Bytes, as read by ``all_urls_handler``; YAML detects the encoding.
+        return file_handler.loads(content, uri=uri)
+
 
 class FilePathReader(PathReader):
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        document_cache: DocumentCache | None = None,
+        lazy: bool = False,
+        source_map: SourceMap | None = None,
+    ):
         path = Path(file_path).absolute()
-        super().__init__(path)
+        super().__init__(
+            path,
+            document_cache=document_cache,
+            lazy=lazy,
+            source_map=source_map,
+        )
+
+
+def read_path(
+    path: Path, document_cache: DocumentCache | None = None
+) -> tuple[Schema, str]:
+    """Read the document at *path*; picklable for process pools."""
+    return PathReader(path, document_cache=document_cache).read()
+
+
+class DirectoryReader:
+    """Reads all documents of a directory tree in parallel.
+
+    Files matching the glob ``pattern`` (by default every JSON and YAML
+    file, also compressed ones) are read on ``executor``, or on a thread
+    pool of ``max_workers`` threads. YAML parsing holds the GIL, so a
+    ``ProcessPoolExecutor`` is needed to parse on several cores.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        pattern: str | None = None,
+        document_cache: DocumentCache | None = None,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+    ):
+        self.path = Path(path).absolute()
+        self.pattern = pattern
+        self.document_cache = document_cache
+        self.executor = executor
+        self.max_workers = max_workers
+
+    def read(self) -> list[tuple[str, Schema]]:
+        """Return ``(uri, document)`` pairs, ordered by path."""
+        if not self.path.is_dir():
+            raise OSError(f"No such directory: {self.path}")
+
+        paths = self._find_paths()
+        read = partial(read_path, document_cache=self.document_cache)
+        if self.executor is not None:
+            results = list(self.executor.map(read, paths, chunksize=4))
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(read, paths))
+        return [(uri, data) for data, uri in results]
+
+    def _find_paths(self) -> list[Path]:
+        if self.pattern is not None:
+            found = self.path.glob(self.pattern)
+        else:
+            found = (
+                path
+                for path in self.path.rglob("*")
+                if guess_format(path.name) in (JSON_FORMAT, YAML_FORMAT)
+            )
+        return sorted(path for path in found if path.is_file())
@@ -5,6 +5,7 @@ from typing import cast
 from pathable.types import LookupKey
 from pathable.types import LookupNode
 from referencing import Registry
+from referencing import Resource
 from referencing._core import Resolved
 from referencing._core import Resolver
 
@@ -94,6 +95,11 @@ class CachedPathResolver:
 
         return resolved
 
+    def add_resource(self, uri: str, resource: Resource[Schema]) -> None:
+        """Add a retrieved resource to the registry."""
+        registry = self.resolver._registry.with_resource(uri, resource)
+        self._sync_registry(cast(Registry[LookupNode], registry))
+
     def _sync_registry(self, registry: Registry[LookupNode]) -> bool:
         if registry is self.resolver._registry:
             return False
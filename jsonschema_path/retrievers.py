@@ -1,4 +1,20 @@
-from json import loads
+import asyncio
+import socket
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
+from functools import partial
+from typing import Any
+from typing import TypeVar
+from urllib.error import HTTPError
+from urllib.error import URLError
 from urllib.parse import urlsplit
 from urllib.request import urlopen
 
@@ -7,26 +23,370 @@ from referencing import Specification
 from referencing.typing import URI
 from referencing.typing import Retrieve
 
+from jsonschema_path.backends import JsonBackend
+from jsonschema_path.backends import get_default_json_backend
+from jsonschema_path.caches import ResourceCache
+from jsonschema_path.typing import AsyncResolverHandlers
 from jsonschema_path.typing import ResolverHandlers
 from jsonschema_path.typing import Schema
 
+T = TypeVar("T")
+
+# Limits of documents fetched by the fallback path.
+DEFAULT_FETCH_TIMEOUT = 30.0
+DEFAULT_FETCH_MAX_SIZE = 64 * 1024 * 1024
+FETCH_CHUNK_SIZE = 64 * 1024
+
+# Set while resolving asynchronously: documents that are not available
+# without I/O are requested with ``RetrievalDeferred`` instead.
+defer_retrieval: ContextVar[bool] = ContextVar(
+    "defer_retrieval", default=False
+)
+
+
+def _get_socket(response: Any) -> socket.socket | None:
+    # The socket of an ``http.client.HTTPResponse``, as returned by
+    # ``urlopen`` or wrapped by urllib3 (``_fp``) for requests.
+    response = getattr(response, "_fp", response)
+    raw = getattr(getattr(response, "fp", None), "raw", None)
+    sock = getattr(raw, "_sock", None)
+    return sock if isinstance(sock, socket.socket) else None
+
+
+def _shutdown(sock: socket.socket) -> None:
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+@contextmanager
+def _watchdog(
+    sock: socket.socket | None, deadline: float | None
+) -> Iterator[None]:
+    """Shut *sock* down when *deadline* passes, which interrupts a read
+    blocked on it."""
+    if sock is None or deadline is None:
+        yield
+        return
+    timer = threading.Timer(
+        max(0.0, deadline - time.monotonic()), _shutdown, (sock,)
+    )
+    timer.daemon = True
+    timer.start()
+    try:
+        yield
+    finally:
+        timer.cancel()
+
+
 USE_REQUESTS = False
 try:
-    import requests
+    from jsonschema_path.handlers.requests import default_session_factory
 except ImportError:
     pass
 else:
     USE_REQUESTS = True
 
+TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+    ConnectionError,
+    TimeoutError,
+    URLError,
+)
+try:
+    from requests.exceptions import ConnectionError as RequestsConnectionError
+    from requests.exceptions import Timeout as RequestsTimeout
+except ImportError:
+    pass
+else:
+    TRANSIENT_ERRORS += (RequestsConnectionError, RequestsTimeout)
+
+
+def _get_status_code(exc: BaseException) -> int | None:
+    if isinstance(exc, HTTPError):
+        return exc.code
+    # requests.HTTPError
+    status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Whether *exc* may not recur: connection errors, timeouts and
+    server (5xx) error responses. Client (4xx) error responses and other
+    errors, such as a missing file or an invalid document, will."""
+    status_code = _get_status_code(exc)
+    if status_code is not None:
+        return status_code >= 500
+    return isinstance(exc, TRANSIENT_ERRORS)
+
+
+@cache
+def get_bundled_resources() -> Mapping[str, Resource[Schema]]:
+    """Return the standard JSON Schema metaschemas and vocabularies of
+    ``jsonschema-specifications``, keyed by both their ``http`` and
+    ``https`` URIs, or nothing when it is not installed."""
+    try:
+        from jsonschema_specifications import REGISTRY
+    except ImportError:
+        return {}
+
+    resources = {}
+    for uri in REGISTRY:
+        resource = REGISTRY[uri]
+        scheme, separator, rest = uri.partition("://")
+        alias = ("https" if scheme == "http" else "http") + separator + rest
+        resources[uri] = resources[alias] = resource
+    return resources
+
+
+class RetrievalDeferred(Exception):
+    """Retrieval of ``uri`` was deferred to the caller (see
+    ``defer_retrieval``)."""
+
+    def __init__(self, uri: str):
+        super().__init__(uri)
+        self.uri = uri
+
+
+class DocumentTooLargeError(ValueError):
+    """Remote document exceeds the retriever's ``fetch_max_size``."""
+
+
+class RetrievalBlockedError(OSError):
+    """Retrieval was not attempted: the URI failed recently or the
+    circuit of its host is open. The last failure is the ``__cause__``."""
+
+
+class RetrievalPolicy:
+    """Failure handling for remote document retrieval.
+
+    A policy, which can be shared by any number of retrievers:
+
+    * retries transient errors (for which ``retry_if`` is true, by
+      default ``is_transient_error``) up to ``retries`` times, sleeping
+      ``backoff`` seconds before the first retry and doubling the delay
+      for each further one, up to ``max_backoff``;
+    * remembers failed URIs for ``negative_ttl`` seconds and fails
+      lookups of them fast, without retrieving;
+    * opens the circuit of a host after ``failure_threshold``
+      consecutive transient failures, failing every retrieval from
+      that host fast for ``reset_timeout`` seconds. Retrievals are let
+      through again after that; the first success closes the circuit and
+      the next transient failure opens it again.
+
+    Failing fast raises ``RetrievalBlockedError``. Only URIs with one of
+    the ``schemes`` are subject to the policy.
+    """
+
+    def __init__(
+        self,
+        retries: int = 2,
+        backoff: float = 0.1,
+        max_backoff: float = 2.0,
+        negative_ttl: float = 30.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        retry_if: Callable[[BaseException], bool] = is_transient_error,
+        schemes: tuple[str, ...] = ("http", "https"),
+    ):
+        if retries < 0:
+            raise ValueError("retries must be >= 0")
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.negative_ttl = negative_ttl
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.retry_if = retry_if
+        self.schemes = schemes
+        self._lock = threading.Lock()
+        # URI -> (expiry, failure)
+        self._failed_uris: dict[str, tuple[float, BaseException]] = {}
+        # Host -> consecutive failures, open-until time and last failure.
+        self._host_failures: dict[str, int] = {}
+        self._open_circuits: dict[str, tuple[float, BaseException]] = {}
+
+    def __call__(self, uri: str, retrieve: Callable[[str], T]) -> T:
+        """Retrieve *uri* with ``retrieve`` under the policy."""
+        parts = urlsplit(uri)
+        if parts.scheme not in self.schemes:
+            return retrieve(uri)
+
+        host = parts.netloc
+        self._check(uri, host)
+        delay = self.backoff
+        attempt = 0
+        while True:
+            try:
+                result = retrieve(uri)
+            except Exception as exc:
+                if not self.retry_if(exc):
+                    # The host responded; only the document is bad.
+                    self._add_failure(uri, None, exc)
+                    raise
+                if attempt < self.retries:
+                    attempt += 1
+                    time.sleep(delay)
+                    delay = min(delay * 2, self.max_backoff)
+                    continue
+                self._add_failure(uri, host, exc)
+                raise
+            self._add_success(host)
+            return result
+
+    def reset(self) -> None:
+        """Forget all failures and close all circuits."""
+        with self._lock:
+            self._failed_uris.clear()
+            self._host_failures.clear()
+            self._open_circuits.clear()
+
+    def _check(self, uri: str, host: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            failed = self._failed_uris.get(uri)
+            if failed is not None:
+                if failed[0] > now:
+                    raise RetrievalBlockedError(
+                        f"Retrieval of {uri} failed recently"
+                    ) from failed[1]
+                del self._failed_uris[uri]
+
+            circuit = self._open_circuits.get(host)
+            if circuit is not None:
+                if circuit[0] > now:
+                    raise RetrievalBlockedError(
+                        f"Circuit for {host} is open"
+                    ) from circuit[1]
+                del self._open_circuits[host]
+
+    def _add_failure(
+        self, uri: str, host: str | None, exc: BaseException
+    ) -> None:
+        now = time.monotonic()
+        with self._lock:
+            failed_uris = self._failed_uris
+            for expired in [
+                key for key, value in failed_uris.items() if value[0] <= now
+            ]:
+                del failed_uris[expired]
+            if self.negative_ttl > 0:
+                failed_uris[uri] = (now + self.negative_ttl, exc)
+
+            if host is None:
+                return
+            failures = self._host_failures.get(host, 0) + 1
+            self._host_failures[host] = failures
+            if failures >= self.failure_threshold:
+                self._open_circuits[host] = (now + self.reset_timeout, exc)
+
+    def _add_success(self, host: str) -> None:
+        if host not in self._host_failures:
+            return
+        with self._lock:
+            self._host_failures.pop(host, None)
+
 
 class SchemaRetriever(Retrieve[Schema]):
+    """Retrieves documents through the scheme handlers.
+
+    Concurrent calls for the same URI are coalesced: one retrieval runs
+    and the other callers wait for its result (or exception). With a
+    ``resource_cache`` retrieved resources are shared with every other
+    retriever using the same cache.
+
+    Documents fetched by the fallback path (schemes without a handler)
+    are decoded with ``json_backend``, or the process-wide default. The
+    body is streamed in chunks and the fetch fails with ``TimeoutError``
+    once it takes longer than ``fetch_timeout`` seconds overall, or with
+    ``DocumentTooLargeError`` once the body exceeds ``fetch_max_size``
+    bytes. ``None`` disables either limit.
+
+    ``bundled_resources`` are served before any cache or handler is
+    consulted. By default these are the standard JSON Schema metaschemas
+    bundled with ``jsonschema-specifications`` when it is installed (the
+    ``specifications`` extra), loaded on first retrieval, so ``$ref``s to
+    them resolve offline.
+    Pass an empty mapping to retrieve them like any other document.
+
+    With a ``policy`` (see ``RetrievalPolicy``) failed retrievals are
+    retried, remembered and failed fast.
+    """
+
     def __init__(
-        self, handlers: ResolverHandlers, specification: Specification[Schema]
+        self,
+        handlers: ResolverHandlers,
+        specification: Specification[Schema],
+        resource_cache: ResourceCache | None = None,
+        json_backend: JsonBackend | None = None,
+        bundled_resources: Mapping[str, Resource[Schema]] | None = None,
+        policy: RetrievalPolicy | None = None,
+        fetch_timeout: float | None = DEFAULT_FETCH_TIMEOUT,
+        fetch_max_size: int | None = DEFAULT_FETCH_MAX_SIZE,
     ):
         self.handlers = handlers
         self.specification = specification
+        self.resource_cache = resource_cache
+        self.json_backend = json_backend
+        self.bundled_resources = bundled_resources
+        self.policy = policy
+        self.fetch_timeout = fetch_timeout
+        self.fetch_max_size = fetch_max_size
+        self._lock = threading.Lock()
+        self._in_flight: dict[URI, Future[Resource[Schema]]] = {}
 
     def __call__(self, uri: URI) -> Resource[Schema]:
+        available = self.get_available(uri)
+        if available is not None:
+            return available
+        if defer_retrieval.get():
+            raise RetrievalDeferred(uri)
+
+        with self._lock:
+            future = self._in_flight.get(uri)
+            if future is not None:
+                leader = False
+            else:
+                leader = True
+                future = self._in_flight[uri] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            if self.policy is None:
+                resource = self._retrieve(uri)
+            else:
+                resource = self.policy(uri, self._retrieve)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            if self.resource_cache is not None:
+                self.resource_cache.set(uri, self.specification, resource)
+            future.set_result(resource)
+            return resource
+        finally:
+            with self._lock:
+                del self._in_flight[uri]
+
+    def get_available(self, uri: URI) -> Resource[Schema] | None:
+        """Return the bundled or cached resource of *uri*, if any,
+        without retrieving it."""
+        bundled_resources = self.bundled_resources
+        if bundled_resources is None:
+            bundled_resources = get_bundled_resources()
+        bundled = bundled_resources.get(uri)
+        if bundled is not None:
+            return bundled
+
+        if self.resource_cache is not None:
+            return self.resource_cache.get(uri, self.specification)
+        return None
+
+    def _retrieve(self, uri: URI) -> Resource[Schema]:
         scheme = urlsplit(uri).scheme
         if scheme in self.handlers:
             handler = self.handlers[scheme]
@@ -34,13 +394,132 @@ class SchemaRetriever(Retrieve[Schema]):
             return self.specification.create_resource(contents)
 
         else:
-            if scheme in ["http", "https"] and USE_REQUESTS:
-                # Requests has support for detecting the correct encoding of
-                # json over http
-                contents = requests.get(uri).json()
-                return self.specification.create_resource(contents)
-
-            # Otherwise, pass off to urllib and assume utf-8
-            with urlopen(uri) as url:
-                contents = loads(url.read().decode("utf-8"))
-                return self.specification.create_resource(contents)
+            # JSON bytes are utf-8 (or a BOM-detected utf-16/32), so the
+            # body is decoded in place, without a text copy.
+            json_backend = self.json_backend or get_default_json_backend()
+            body = self._fetch(uri, scheme)
+            contents = json_backend.loads(memoryview(body))
+            return self.specification.create_resource(contents)
+
+    def _fetch(self, uri: URI, scheme: str) -> bytearray:
+        deadline = None
+        if self.fetch_timeout is not None:
+            deadline = time.monotonic() + self.fetch_timeout
+
+        if scheme in ["http", "https"] and USE_REQUESTS:
+            response = default_session_factory().get(
+                uri, stream=True, timeout=self.fetch_timeout
+            )
+            with response:
+                response.raise_for_status()
+                self._check_length(uri, response.headers)
+                chunks = response.iter_content(FETCH_CHUNK_SIZE)
+                with _watchdog(_get_socket(response.raw), deadline):
+                    return self._read_body(uri, chunks, deadline)
+
+        with urlopen(uri, timeout=self.fetch_timeout) as url:
+            self._check_length(uri, getattr(url, "headers", None))
+            chunks = iter(lambda: url.read(FETCH_CHUNK_SIZE), b"")
+            with _watchdog(_get_socket(url), deadline):
+                return self._read_body(uri, chunks, deadline)
+
+    def _check_length(self, uri: URI, headers: Any) -> None:
+        # Fail before reading a body declared too large.
+        if self.fetch_max_size is None or headers is None:
+            return
+        length = headers.get("Content-Length")
+        if length is not None and length.isdigit():
+            if int(length) > self.fetch_max_size:
+                raise DocumentTooLargeError(
+                    f"{uri} exceeds {self.fetch_max_size} bytes"
+                )
+
+    def _read_body(
+        self, uri: URI, chunks: Iterable[bytes], deadline: float | None
+    ) -> bytearray:
+        # A read blocks until its chunk is filled, so a server trickling
+        # bytes is cut off by the watchdog shutting the socket down; the
+        # interrupted read fails (or ends early) and the deadline check
+        # turns that into a timeout.
+        max_size = self.fetch_max_size
+        body = bytearray()
+        chunks = iter(chunks)
+        while True:
+            try:
+                chunk = next(chunks, None)
+            except Exception as exc:
+                self._check_deadline(uri, deadline, exc)
+                raise
+            self._check_deadline(uri, deadline)
+            if chunk is None:
+                return body
+            body += chunk
+            if max_size is not None and len(body) > max_size:
+                raise DocumentTooLargeError(f"{uri} exceeds {max_size} bytes")
+
+    def _check_deadline(
+        self,
+        uri: URI,
+        deadline: float | None,
+        cause: BaseException | None = None,
+    ) -> None:
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"Fetching {uri} exceeded {self.fetch_timeout} seconds"
+            ) from cause
+
+
+class AsyncSchemaRetriever:
+    """Retrieves documents without blocking the event loop.
+
+    Documents of schemes with an async handler (a callable returning an
+    awaitable document) are retrieved on the loop; concurrent calls for
+    the same URI are coalesced. Everything else is retrieved by the sync
+    ``retriever`` in a worker thread, with its handlers, cache, policy
+    and fetch limits. Bundled and cached resources are returned
+    directly.
+    """
+
+    def __init__(
+        self,
+        retriever: SchemaRetriever,
+        handlers: AsyncResolverHandlers | None = None,
+    ):
+        self.retriever = retriever
+        self.handlers = handlers or {}
+        self._in_flight: dict[URI, asyncio.Task[Resource[Schema]]] = {}
+
+    async def __call__(self, uri: URI) -> Resource[Schema]:
+        available = self.retriever.get_available(uri)
+        if available is not None:
+            return available
+
+        scheme = urlsplit(uri).scheme
+        if scheme not in self.handlers:
+            return await asyncio.to_thread(self.retriever, uri)
+
+        # The handler runs in its own task, shielded from every caller,
+        # so cancelling one caller does not fail the others.
+        task = self._in_flight.get(uri)
+        if task is None:
+            task = asyncio.ensure_future(self._retrieve(scheme, uri))
+            self._in_flight[uri] = task
+            task.add_done_callback(partial(self._finish, uri))
+        return await asyncio.shield(task)
+
+    async def _retrieve(self, scheme: str, uri: URI) -> Resource[Schema]:
+        contents = await self.handlers[scheme](uri)
+        resource = self.retriever.specification.create_resource(contents)
+        resource_cache = self.retriever.resource_cache
+        if resource_cache is not None:
+            resource_cache.set(uri, self.retriever.specification, resource)
+        return resource
+
+    def _finish(
+        self, uri: URI, task: "asyncio.Task[Resource[Schema]]"
+    ) -> None:
+        if self._in_flight.get(uri) is task:
+            del self._in_flight[uri]
+        if not task.cancelled():
+            # Do not warn about an exception nobody waited for.
+            task.exception()
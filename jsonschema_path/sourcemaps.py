@@ -0,0 +1,310 @@
+"""JSONSchema path source maps module.
+
+A ``SourceMap`` records where the nodes of loaded documents are defined,
+as 1-based line and column numbers. Positions are collected during the
+one parse of a document, from the YAML node marks or by a JSON decoder
+that keeps track of offsets, and stored in a single flat ``array``
+indexed by the identity of each object and array. Scalars are located
+through their parent container.
+
+Members of an object are located at their key, array items at their
+first character and document roots at their first node.
+"""
+
+import json
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from yaml.nodes import MappingNode
+from yaml.nodes import Node
+from yaml.nodes import ScalarNode
+from yaml.nodes import SequenceNode
+
+NEWLINE_RE = re.compile(r"\n")
+WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+NOTSET = object()
+
+# Containers paired with their own position followed by the positions of
+# their members, as flat ``line, column`` pairs (``0, 0`` when unknown).
+LocatedNodes = list[tuple[Any, Sequence[int]]]
+
+
+@dataclass(frozen=True)
+class SourceLocation:
+    uri: str
+    line: int
+    column: int
+
+
+class SourceMap:
+    """Source positions of the nodes of loaded documents.
+
+    Fill it by loading documents with a ``FileHandler`` given the map,
+    for example through ``SchemaPath.from_file_path(..., source_map=...)``.
+    Loaded documents are kept alive by the map, so node identities stay
+    valid; nodes replaced or resized after loading are not located.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._documents: list[Any] = []
+        self._uris: list[str] = []
+        # Per node: document index, member count, then line/column pairs.
+        self._positions = array("I")
+        self._offsets: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def add(self, document: Any, uri: str, nodes: LocatedNodes) -> None:
+        """Record the positions of the ``nodes`` of ``document``."""
+        with self._lock:
+            document_index = len(self._documents)
+            self._documents.append(document)
+            self._uris.append(uri)
+            positions = self._positions
+            offsets = self._offsets
+            for node, node_positions in nodes:
+                offsets[id(node)] = len(positions)
+                positions.append(document_index)
+                positions.append(len(node_positions) // 2 - 1)
+                positions.extend(node_positions)
+
+    def locate(self, node: Any, key: Any = NOTSET) -> SourceLocation | None:
+        """Return where ``node`` (or its member ``key``) is defined, or
+        ``None`` when the map does not know it."""
+        offset = self._offsets.get(id(node))
+        if offset is None:
+            return None
+
+        positions = self._positions
+        slot = 0
+        if key is not NOTSET:
+            index = self._get_member_index(node, key, positions[offset + 1])
+            if index is None:
+                return None
+            slot = index + 1
+
+        line = positions[offset + 2 + 2 * slot]
+        if not line:
+            return None
+        return SourceLocation(
+            self._uris[positions[offset]],
+            line,
+            positions[offset + 3 + 2 * slot],
+        )
+
+    def _get_member_index(self, node: Any, key: Any, count: int) -> int | None:
+        if len(node) != count:
+            return None
+        if isinstance(node, list):
+            if isinstance(key, int) and 0 <= key < count:
+                return key
+            return None
+        for index, member in enumerate(node):
+            if member == key:
+                return index
+        return None
+
+
+class JsonLocator:
+    """JSON decoder recording the position of every object and array.
+
+    Scalars are decoded with the standard library decoder; ``NaN`` and
+    ``Infinity`` are rejected as they are not JSON.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.line_starts = array("q", [0])
+        self.line_starts.extend(m.end() for m in NEWLINE_RE.finditer(text))
+        self.nodes: LocatedNodes = []
+        self._decoder = json.JSONDecoder(parse_constant=_reject_constant)
+
+    def decode(self) -> Any:
+        text = self.text
+        pos = self._skip(0)
+        value, end = self.decode_value(pos, pos)
+        end = self._skip(end)
+        if end != len(text):
+            raise json.JSONDecodeError("Extra data", text, end)
+        return value
+
+    def decode_value(self, pos: int, location: int) -> tuple[Any, int]:
+        """Decode the value at ``pos``, located at ``location``.
+
+        Returns the value and the offset following it.
+        """
+        char = self.text[pos : pos + 1]
+        if char == "{":
+            return self.decode_object(pos, location)
+        if char == "[":
+            return self.decode_array(pos, location)
+        return self._decoder.raw_decode(self.text, pos)
+
+    def decode_object(self, start: int, location: int) -> tuple[Any, int]:
+        text = self.text
+        data: dict[str, Any] = {}
+        keys: dict[str, int] = {}
+        pos = self._skip(start + 1)
+        if text[pos : pos + 1] != "}":
+            while True:
+                if text[pos : pos + 1] != '"':
+                    raise json.JSONDecodeError(
+                        "Expecting property name enclosed in double quotes",
+                        text,
+                        pos,
+                    )
+                key, end = self._decoder.raw_decode(text, pos)
+                end = self._skip(end)
+                if text[end : end + 1] != ":":
+                    raise json.JSONDecodeError(
+                        "Expecting ':' delimiter", text, end
+                    )
+                value, end = self.decode_value(self._skip(end + 1), pos)
+                data[key] = value
+                keys[key] = pos
+                pos, closed = self._skip_delimiter(end, "}")
+                if closed:
+                    break
+        else:
+            pos += 1
+        self._add(data, location, keys.values())
+        return data, pos
+
+    def decode_array(self, start: int, location: int) -> tuple[Any, int]:
+        text = self.text
+        data: list[Any] = []
+        items: list[int] = []
+        pos = self._skip(start + 1)
+        if text[pos : pos + 1] != "]":
+            while True:
+                value, end = self.decode_value(pos, pos)
+                data.append(value)
+                items.append(pos)
+                pos, closed = self._skip_delimiter(end, "]")
+                if closed:
+                    break
+        else:
+            pos += 1
+        self._add(data, location, items)
+        return data, pos
+
+    def get_position(self, offset: int) -> tuple[int, int]:
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1] + 1
+
+    def _add(self, node: Any, location: int, members: Iterable[int]) -> None:
+        positions = array("I", self.get_position(location))
+        for offset in members:
+            positions.extend(self.get_position(offset))
+        self.nodes.append((node, positions))
+
+    def _skip(self, pos: int) -> int:
+        match = WHITESPACE_RE.match(self.text, pos)
+        assert match is not None
+        return match.end()
+
+    def _skip_delimiter(self, pos: int, closing: str) -> tuple[int, bool]:
+        # Returns the next member offset, or the offset following
+        # ``closing`` at the end of the container.
+        text = self.text
+        pos = self._skip(pos)
+        char = text[pos : pos + 1]
+        if char == closing:
+            return pos + 1, True
+        if char != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+        return self._skip(pos + 1), False
+
+
+def _reject_constant(name: str) -> Any:
+    raise ValueError(f"Out of range float values are not JSON: {name}")
+
+
+def loads_json_located(data: str | bytes) -> tuple[Any, LocatedNodes]:
+    """Decode a JSON document and the positions of its containers."""
+    if isinstance(data, str):
+        if data.startswith("\ufeff"):
+            raise json.JSONDecodeError(
+                "Unexpected UTF-8 BOM (decode using utf-8-sig)", data, 0
+            )
+        text = data
+    else:
+        text = data.decode(json.detect_encoding(data), "surrogatepass")
+    locator = JsonLocator(text)
+    return locator.decode(), locator.nodes
+
+
+def load_yaml_located(
+    content: str | bytes,
+    loader: Any,
+    normalize: Callable[[Any], Any],
+) -> tuple[Any, LocatedNodes]:
+    """Load a YAML document and the positions of its containers.
+
+    The document is composed and constructed by ``loader`` once, as
+    ``yaml.load`` does, then passed through ``normalize``; positions are
+    read from the composed nodes.
+    """
+    yaml_loader = loader(content)
+    try:
+        node = yaml_loader.get_single_node()
+        data = None
+        if node is not None:
+            data = yaml_loader.construct_document(node)
+    finally:
+        yaml_loader.dispose()
+
+    data = normalize(data)
+    nodes: LocatedNodes = []
+    if node is not None:
+        _locate_yaml_node(node, data, _get_mark_position(node), nodes)
+    return data, nodes
+
+
+def _get_mark_position(node: Node) -> tuple[int, int]:
+    mark = node.start_mark
+    return mark.line + 1, mark.column + 1
+
+
+def _locate_yaml_node(
+    node: Node, data: Any, location: tuple[int, int], nodes: LocatedNodes
+) -> None:
+    positions = array("I", location)
+    if isinstance(data, dict) and isinstance(node, MappingNode):
+        # Later duplicate keys win, as in the constructed mapping.
+        pairs = {
+            key_node.value: (key_node, value_node)
+            for key_node, value_node in node.value
+            if isinstance(key_node, ScalarNode)
+        }
+        for key, value in data.items():
+            pair = pairs.get(key)
+            if pair is None:
+                # E.g. a key normalised from a non-string scalar.
+                positions.extend((0, 0))
+                continue
+            key_position = _get_mark_position(pair[0])
+            positions.extend(key_position)
+            _locate_yaml_node(pair[1], value, key_position, nodes)
+    elif (
+        isinstance(data, list)
+        and isinstance(node, SequenceNode)
+        and len(data) == len(node.value)
+    ):
+        for item_node, item in zip(node.value, data):
+            item_position = _get_mark_position(item_node)
+            positions.extend(item_position)
+            _locate_yaml_node(item_node, item, item_position, nodes)
+    else:
+        return
+    nodes.append((data, positions))
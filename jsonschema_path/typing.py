@@ -8,6 +8,7 @@ from pathable.types import LookupNode as SchemaNode
 from pathable.types import LookupValue as SchemaValue
 
 __all__ = [
+    "AsyncResolverHandlers",
     "ResolverHandlers",
     "Schema",
     "SchemaNode",
@@ -16,6 +17,7 @@ __all__ = [
 ]
 
 ResolverHandlers = Mapping[str, Any]
+AsyncResolverHandlers = Mapping[str, Any]
 Schema = Mapping[str, Any]
 
 
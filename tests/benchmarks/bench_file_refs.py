@@ -0,0 +1,118 @@
+"""Benchmarks for resolving local ``file`` references.
+
+Focus areas:
+- cold loads of a spec split over hundreds of local files
+- the default ``file`` handler against the ``urlopen`` based one
+"""
+
+import argparse
+import json
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from jsonschema_path import SchemaPath
+from jsonschema_path.handlers.file import FilePathHandler
+from jsonschema_path.handlers.urllib import UrllibHandler
+from jsonschema_path.typing import ResolverHandlers
+
+try:
+    # Prefer module execution: `python -m tests.benchmarks.bench_file_refs`
+    from .bench_utils import BenchmarkResult
+    from .bench_utils import add_common_args
+    from .bench_utils import default_meta
+    from .bench_utils import results_to_json
+    from .bench_utils import run_benchmark
+    from .bench_utils import write_json
+except ImportError:  # pragma: no cover
+    # Allow direct execution: `python tests/benchmarks/bench_file_refs.py`
+    from bench_utils import BenchmarkResult  # type: ignore[no-redef]
+    from bench_utils import add_common_args  # type: ignore[no-redef]
+    from bench_utils import default_meta  # type: ignore[no-redef]
+    from bench_utils import results_to_json  # type: ignore[no-redef]
+    from bench_utils import run_benchmark  # type: ignore[no-redef]
+    from bench_utils import write_json  # type: ignore[no-redef]
+
+
+def _write_spec(directory: Path, n: int) -> dict[str, Any]:
+    """Write *n* schema files, each referencing the next one, and return
+    the root document referencing all of them."""
+    schemas_dir = directory / "schemas"
+    schemas_dir.mkdir()
+    for i in range(n):
+        schema: dict[str, Any] = {
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": "string"},
+            },
+        }
+        if i + 1 < n:
+            schema["properties"]["next"] = {"$ref": f"schema{i + 1}.json"}
+        (schemas_dir / f"schema{i}.json").write_text(json.dumps(schema))
+    return {
+        "components": {
+            "schemas": {
+                f"Schema{i}": {"$ref": f"schemas/schema{i}.json"}
+                for i in range(n)
+            },
+        },
+    }
+
+
+def _load_all(root: dict[str, Any], base_uri: str, handlers: Any) -> None:
+    # A new SchemaPath has an empty registry, so every file is read.
+    path = SchemaPath.from_dict(root, base_uri=base_uri, handlers=handlers)
+    for schema_path in path / "components" / "schemas":
+        with schema_path.open():
+            pass
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    add_common_args(parser)
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    repeats: int = args.repeats
+    warmup_loops: int = args.warmup_loops
+
+    results: list[BenchmarkResult] = []
+    sizes = [100, 500] if not args.quick else [100]
+    handlers: dict[str, ResolverHandlers] = {
+        "urllib": {"file": UrllibHandler("file")},
+        "filepath": {"file": FilePathHandler()},
+    }
+
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            root = _write_spec(directory, n)
+            base_uri = (directory / "openapi.json").as_uri()
+
+            loops = max(1, 1_000 // n)
+            if args.quick:
+                loops = min(loops, 5)
+
+            for name, file_handlers in handlers.items():
+
+                def do_load(_handlers: Any = file_handlers) -> None:
+                    _load_all(root, base_uri, _handlers)
+
+                results.append(
+                    run_benchmark(
+                        f"file_refs.{name}.files{n}",
+                        do_load,
+                        loops=loops,
+                        repeats=repeats,
+                        warmup_loops=warmup_loops,
+                    )
+                )
+
+    payload = results_to_json(results=results, meta=default_meta())
+    write_json(args.output, payload)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
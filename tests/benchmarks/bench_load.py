@@ -0,0 +1,111 @@
+"""Benchmarks for YAML document loading.
+
+Focus areas:
+- scalar-heavy specs (types, formats, numbers) through JsonschemaSafeLoader
+- the full FileHandler path (load and JSON normalisation)
+"""
+
+import argparse
+from collections.abc import Iterable
+from io import StringIO
+from typing import Any
+
+import yaml
+
+from jsonschema_path.handlers.file import FileHandler
+from jsonschema_path.loaders import JsonschemaSafeLoader
+
+try:
+    # Prefer module execution: `python -m tests.benchmarks.bench_load ...`
+    from .bench_utils import BenchmarkResult
+    from .bench_utils import add_common_args
+    from .bench_utils import default_meta
+    from .bench_utils import results_to_json
+    from .bench_utils import run_benchmark
+    from .bench_utils import write_json
+except ImportError:  # pragma: no cover
+    # Allow direct execution: `python tests/benchmarks/bench_load.py ...`
+    from bench_utils import BenchmarkResult  # type: ignore[no-redef]
+    from bench_utils import add_common_args  # type: ignore[no-redef]
+    from bench_utils import default_meta  # type: ignore[no-redef]
+    from bench_utils import results_to_json  # type: ignore[no-redef]
+    from bench_utils import run_benchmark  # type: ignore[no-redef]
+    from bench_utils import write_json  # type: ignore[no-redef]
+
+
+def _build_spec(n: int) -> str:
+    schemas: dict[str, Any] = {}
+    for i in range(n):
+        schemas[f"Schema{i}"] = {
+            "type": "object",
+            "required": ["id", "name"],
+            "properties": {
+                "id": {"type": "integer", "format": "int64", "minimum": 1},
+                "name": {"type": "string", "maxLength": 255},
+                "price": {"type": "number", "multipleOf": 0.01},
+                "ratio": {"type": "number", "maximum": 1e3},
+                "created": {"type": "string", "example": "2024-01-01"},
+                "active": {"type": "boolean", "default": True},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+        }
+    spec = {
+        "openapi": "3.1.0",
+        "info": {"title": "Bench", "version": "1.0.0"},
+        "components": {"schemas": schemas},
+    }
+    return yaml.safe_dump(spec, sort_keys=False)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    add_common_args(parser)
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    repeats: int = args.repeats
+    warmup_loops: int = args.warmup_loops
+
+    results: list[BenchmarkResult] = []
+    sizes = [10, 100, 1_000] if not args.quick else [10, 100]
+    file_handler = FileHandler()
+
+    for n in sizes:
+        text = _build_spec(n)
+
+        loops = max(1, 1_000 // n)
+        if args.quick:
+            loops = min(loops, 10)
+
+        def do_yaml_load(_text: str = text) -> None:
+            yaml.load(_text, JsonschemaSafeLoader)
+
+        results.append(
+            run_benchmark(
+                f"load.yaml_load.size{n}",
+                do_yaml_load,
+                loops=loops,
+                repeats=repeats,
+                warmup_loops=warmup_loops,
+            )
+        )
+
+        def do_file_handler(_text: str = text) -> None:
+            file_handler(StringIO(_text))
+
+        results.append(
+            run_benchmark(
+                f"load.FileHandler.size{n}",
+                do_file_handler,
+                loops=loops,
+                repeats=repeats,
+                warmup_loops=warmup_loops,
+            )
+        )
+
+    payload = results_to_json(results=results, meta=default_meta())
+    write_json(args.output, payload)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
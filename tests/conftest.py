@@ -1,6 +1,10 @@
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 from json import dumps
 from os import unlink
 from tempfile import NamedTemporaryFile
+from threading import Thread
 
 import pytest
 
@@ -19,3 +23,58 @@ def create_file():
     yield create
     for tf in files:
         unlink(tf.name)
+
+
+@pytest.fixture
+def http_server():
+    """Local HTTP/1.1 server serving JSON documents.
+
+    Set ``server.documents[path] = document`` to publish; requests are
+    recorded in ``server.requests`` as ``(client_address, path, headers)``.
+    Responses carry an ``ETag`` and honour ``If-None-Match``.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            server.requests.append(
+                (self.client_address, self.path, dict(self.headers))
+            )
+            document = server.documents.get(self.path)
+            if document is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = dumps(document).encode("utf-8")
+            etag = f'"{sha256(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.documents = {}
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    thread = Thread(
+        target=server.serve_forever,
+        kwargs={"poll_interval": 0.01},
+        daemon=True,
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -1,10 +1,20 @@
 from io import BytesIO
 from json import dumps
+from pathlib import Path
 from unittest import mock
+from zipfile import ZipFile
 
+import pytest
 import responses
+from yaml import load
 
 from jsonschema_path import SchemaPath
+from jsonschema_path.caches import ResourceCache
+from jsonschema_path.handlers.archive import ZipArchiveHandler
+from jsonschema_path.handlers.caches import DocumentCache
+from jsonschema_path.handlers.requests import SessionFactory
+from jsonschema_path.handlers.requests import UrlRequestsHandler
+from jsonschema_path.lazy import LazyDict
 
 
 class TestSchemaPathFromDict:
@@ -35,6 +45,126 @@ class TestSchemaPathFromFilePath:
 
         assert "paths" in path
 
+    def test_file_path_document_cache(
+        self, data_resource_path_getter, tmp_path
+    ):
+        fp = data_resource_path_getter(
+            "data/v3.0/petstore-separate/spec/openapi.yaml"
+        )
+        document_cache = DocumentCache(tmp_path)
+
+        def read_pet_required():
+            path = SchemaPath.from_file_path(fp, document_cache=document_cache)
+            schema_path = (
+                path
+                / "paths"
+                / "/pets"
+                / "get"
+                / "responses"
+                / "200"
+                / "content"
+                / "application/json"
+                / "schema"
+            )
+            return (schema_path / "items" / "required").read_value()
+
+        read_pet_required()
+        with mock.patch("jsonschema_path.handlers.file.load") as load_mock:
+            required = read_pet_required()
+
+        load_mock.assert_not_called()
+        assert required == ["id", "name"]
+
+    def test_file_path_prefetch(self, data_resource_path_getter):
+        fp = data_resource_path_getter(
+            "data/v3.0/petstore-separate/spec/openapi.yaml"
+        )
+        path = SchemaPath.from_file_path(fp, prefetch=True)
+
+        registry = path.accessor._path_resolver.resolver._registry
+        spec_dir = Path(fp).parent
+        assert set(registry) == {
+            spec_dir.joinpath("openapi.yaml").as_uri(),
+            spec_dir.joinpath("schemas/Pets.yaml").as_uri(),
+            spec_dir.joinpath("schemas/Pet.yaml").as_uri(),
+            spec_dir.parent.joinpath("common/schemas/Error.yaml").as_uri(),
+        }
+
+    def test_file_path_resource_cache(self, data_resource_path_getter):
+        fp = data_resource_path_getter(
+            "data/v3.0/petstore-separate/spec/openapi.yaml"
+        )
+        resource_cache = ResourceCache()
+        paths = [
+            SchemaPath.from_file_path(fp, resource_cache=resource_cache)
+            for _ in range(2)
+        ]
+
+        with mock.patch(
+            "jsonschema_path.handlers.file.load",
+            wraps=load,
+        ) as load_mock:
+            errors = [
+                (
+                    path
+                    / "paths#/pets#get#responses#default#content"
+                    / "application/json#schema"
+                ).read_value()
+                for path in paths
+            ]
+
+        assert errors[0] is errors[1]
+        assert load_mock.call_count == 1
+
+    def test_file_path_lazy(self, tmp_path):
+        tmp_path.joinpath("defs.json").write_text(
+            dumps({"pet": {"type": "object"}, "tag": {"type": "string"}})
+        )
+        tmp_path.joinpath("openapi.json").write_text(
+            dumps({"schema": {"$ref": "defs.json#/pet"}, "other": {}})
+        )
+
+        path = SchemaPath.from_file_path(
+            str(tmp_path / "openapi.json"), lazy=True
+        )
+
+        with (path / "schema").open() as schema:
+            assert schema == {"type": "object"}
+        registry = path.accessor._path_resolver.resolver._registry
+        defs = registry[(tmp_path / "defs.json").as_uri()].contents
+        assert type(dict.__getitem__(defs, "tag")) is LazyDict
+
+    def test_file_path_lazy_serializable(self, tmp_path):
+        document = {"components": {"schemas": {"Pet": {"type": "object"}}}}
+        tmp_path.joinpath("openapi.json").write_text(dumps(document))
+
+        path = SchemaPath.from_file_path(
+            str(tmp_path / "openapi.json"), lazy=True
+        )
+
+        assert dumps((path / "components").read_value()) == dumps(
+            document["components"]
+        )
+        with (path / "components").open() as components:
+            assert dumps(components) == dumps(document["components"])
+
+    def test_file_path_lazy_yaml(self, data_resource_path_getter):
+        fp = data_resource_path_getter(
+            "data/v3.0/petstore-separate/spec/openapi.yaml"
+        )
+        path = SchemaPath.from_file_path(fp, lazy=True)
+
+        schema_path = (
+            path
+            / "paths#/pets#get#responses#default#content"
+            / "application/json#schema#properties"
+        )
+        with schema_path.open() as properties:
+            assert properties == {
+                "code": {"format": "int32", "type": "integer"},
+                "message": {"type": "string"},
+            }
+
     def test_file_path_relative(self):
         fp = "tests/integration/data/v3.0/petstore-separate/spec/openapi.yaml"
         path = SchemaPath.from_file_path(fp)
@@ -42,6 +172,55 @@ class TestSchemaPathFromFilePath:
         assert "paths" in path
 
 
+class TestSchemaPathFromArchive:
+    def test_archive(self, data_resource_path_getter, tmp_path):
+        data_dir = Path(
+            data_resource_path_getter("data/v3.0/petstore-separate")
+        )
+        archive_path = tmp_path / "petstore.zip"
+        with ZipFile(archive_path, "w") as zf:
+            for file_path in data_dir.rglob("*.yaml"):
+                zf.write(file_path, file_path.relative_to(data_dir))
+
+        path = SchemaPath.from_archive(archive_path, "spec/openapi.yaml")
+
+        assert path.base_uri == (archive_path / "spec/openapi.yaml").as_uri()
+        schema_path = (
+            path
+            / "paths#/pets#get#responses#default#content"
+            / "application/json#schema#properties"
+        )
+        with schema_path.open() as properties:
+            assert properties == {
+                "code": {"format": "int32", "type": "integer"},
+                "message": {"type": "string"},
+            }
+
+    def test_archive_handler(self, tmp_path):
+        archive_path = tmp_path / "bundle.zip"
+        with ZipFile(archive_path, "w") as zf:
+            zf.writestr("openapi.json", '{"$ref": "pet.yaml"}')
+            zf.writestr("pet.yaml", "type: string\n")
+
+        with ZipArchiveHandler(archive_path) as handler:
+            path = SchemaPath.from_archive(
+                archive_path, "openapi.json", archive_handler=handler
+            )
+            assert (path / "type").read_str() == "string"
+
+        assert handler._zipfile is None
+
+    def test_archive_handler_mismatch(self, tmp_path):
+        handler = ZipArchiveHandler(tmp_path / "other.zip")
+
+        with pytest.raises(ValueError):
+            SchemaPath.from_archive(
+                tmp_path / "bundle.zip",
+                "openapi.json",
+                archive_handler=handler,
+            )
+
+
 class TestSchemaPathFromFile:
     def test_ref_recursive(self, data_resource_path_getter):
         fp = data_resource_path_getter(
@@ -302,6 +481,32 @@ class TestSchemaPathOpen:
             assert contents == expected_contents
             assert id(resolved.contents) == id(contents)
 
+    def test_remote_connection_reused(self, http_server):
+        schema = {
+            "properties": {
+                f"prop{i}": {"$ref": f"{http_server.url}/defs{i}.json"}
+                for i in range(5)
+            },
+        }
+        for i in range(5):
+            http_server.documents[f"/defs{i}.json"] = {"type": "string"}
+        path = SchemaPath.from_dict(
+            schema,
+            handlers={
+                "http": UrlRequestsHandler(
+                    "http", session_factory=SessionFactory()
+                ),
+            },
+        )
+
+        for i in range(5):
+            prop_path = path / "properties" / f"prop{i}"
+            assert (prop_path / "type").read_value() == "string"
+
+        client_addresses = {request[0] for request in http_server.requests}
+        assert len(http_server.requests) == 5
+        assert len(client_addresses) == 1
+
     @mock.patch("jsonschema_path.retrievers.USE_REQUESTS", False)
     @mock.patch("jsonschema_path.retrievers.urlopen")
     def test_remote_fallback_urllib(self, mock_urlopen, defs):
@@ -313,7 +518,7 @@ class TestSchemaPathOpen:
             },
         }
         data_bytes = dumps(defs).encode()
-        mock_urlopen.side_effect = lambda m: BytesIO(data_bytes)
+        mock_urlopen.side_effect = lambda m, timeout: BytesIO(data_bytes)
         path = SchemaPath.from_dict(schema, handlers={})
 
         assert "properties" in path
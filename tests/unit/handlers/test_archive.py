@@ -0,0 +1,108 @@
+import threading
+from pathlib import Path
+from unittest import mock
+from zipfile import ZipFile
+
+import pytest
+
+from jsonschema_path.handlers.archive import ZipArchiveHandler
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive_path = tmp_path / "bundle.zip"
+    with ZipFile(archive_path, "w") as zf:
+        zf.writestr("spec/openapi.json", '{"type": "object"}')
+        zf.writestr("spec/schemas/pet.yaml", "type: string\n")
+    return archive_path
+
+
+class TestZipArchiveHandler:
+    def test_member(self, archive):
+        handler = ZipArchiveHandler(archive)
+        uri = Path(archive, "spec/schemas/pet.yaml").as_uri()
+
+        result = handler(uri)
+
+        assert result == {"type": "string"}
+
+    def test_member_name(self, archive):
+        handler = ZipArchiveHandler(archive)
+
+        name = handler.get_member_name(
+            Path(archive, "spec/schemas/../openapi.json").as_uri()
+        )
+
+        assert name == "spec/openapi.json"
+
+    def test_archive_opened_once(self, archive):
+        handler = ZipArchiveHandler(archive)
+
+        with mock.patch(
+            "jsonschema_path.handlers.archive.ZipFile",
+            wraps=ZipFile,
+        ) as zipfile_mock:
+            handler(Path(archive, "spec/openapi.json").as_uri())
+            handler(Path(archive, "spec/schemas/pet.yaml").as_uri())
+
+        zipfile_mock.assert_called_once()
+
+    def test_missing_member(self, archive):
+        handler = ZipArchiveHandler(archive)
+
+        with pytest.raises(FileNotFoundError):
+            handler(Path(archive, "spec/missing.yaml").as_uri())
+
+    def test_outside_archive(self, archive):
+        fallback_handler = mock.Mock(return_value={})
+        handler = ZipArchiveHandler(archive, fallback_handler=fallback_handler)
+        uri = Path(archive.parent, "other.yaml").as_uri()
+
+        result = handler(uri)
+
+        fallback_handler.assert_called_once_with(uri)
+        assert result == {}
+
+    def test_invalid_scheme(self, archive):
+        handler = ZipArchiveHandler(archive)
+
+        with pytest.raises(ValueError):
+            handler("http://example.com/bundle.zip/openapi.json")
+
+    def test_close(self, archive):
+        handler = ZipArchiveHandler(archive)
+        uri = Path(archive, "spec/openapi.json").as_uri()
+        handler(uri)
+
+        handler.close()
+
+        assert handler(uri) == {"type": "object"}
+
+    def test_context_manager(self, archive):
+        with ZipArchiveHandler(archive) as handler:
+            handler(Path(archive, "spec/openapi.json").as_uri())
+            zipfile = handler._zipfile
+
+        assert handler._zipfile is None
+        assert zipfile.fp is None
+
+    def test_close_while_opening(self, archive):
+        handler = ZipArchiveHandler(archive)
+        uri = Path(archive, "spec/openapi.json").as_uri()
+        zipfile_open = ZipFile.open
+        closing = []
+
+        def open_member(zipfile, *args, **kwargs):
+            # Another thread closes the handler while a member is opened.
+            thread = threading.Thread(target=handler.close)
+            thread.start()
+            thread.join(0.1)
+            closing.append(thread)
+            return zipfile_open(zipfile, *args, **kwargs)
+
+        with mock.patch.object(ZipFile, "open", open_member):
+            result = handler(uri)
+        closing[0].join()
+
+        assert result == {"type": "object"}
+        assert handler._zipfile is None
@@ -0,0 +1,125 @@
+import os
+from json import loads
+from unittest import mock
+
+import pytest
+
+from jsonschema_path.handlers.caches import DocumentCache
+from jsonschema_path.handlers.caches import HttpCache
+from jsonschema_path.handlers.caches import HttpCacheEntry
+
+
+class TestDocumentCache:
+    def test_miss_then_hit(self, tmp_path):
+        document = tmp_path / "schema.json"
+        document.write_text('{"type": "object"}')
+        cache = DocumentCache(tmp_path / "cache")
+        parse = mock.Mock(side_effect=loads)
+
+        first = cache.load(document, parse)
+        second = cache.load(document, parse)
+
+        assert first == second == {"type": "object"}
+        parse.assert_called_once_with(b'{"type": "object"}')
+
+    def test_modified_file_reparsed(self, tmp_path):
+        document = tmp_path / "schema.json"
+        document.write_text('{"type": "object"}')
+        cache = DocumentCache(tmp_path / "cache")
+        cache.load(document, loads)
+
+        document.write_text('{"type": "string"}')
+        stat = document.stat()
+        os.utime(document, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        result = cache.load(document, loads)
+
+        assert result == {"type": "string"}
+
+    def test_key(self, tmp_path):
+        document = tmp_path / "schema.json"
+        document.write_text('{"type": "object"}')
+        cache = DocumentCache(tmp_path / "cache")
+        parse = mock.Mock(side_effect=loads)
+
+        cache.load(document, parse, key="a")
+        cache.load(document, parse, key="b")
+
+        assert parse.call_count == 2
+
+    def test_corrupted_entry(self, tmp_path):
+        document = tmp_path / "schema.json"
+        document.write_text('{"type": "object"}')
+        cache_dir = tmp_path / "cache"
+        cache = DocumentCache(cache_dir)
+        cache.load(document, loads)
+        (entry,) = cache_dir.iterdir()
+        entry.write_bytes(b"\x00garbage")
+
+        result = cache.load(document, loads)
+
+        assert result == {"type": "object"}
+        assert cache.load(document, mock.Mock()) == {"type": "object"}
+
+    def test_shared_subtrees(self, tmp_path):
+        document = tmp_path / "schema.json"
+        document.write_text("{}")
+        shared = {"type": "string"}
+        cache = DocumentCache(tmp_path / "cache")
+        cache.load(document, lambda content: {"a": shared, "b": shared})
+
+        result = cache.load(document, mock.Mock())
+
+        assert result["a"] is result["b"]
+
+    def test_clear(self, tmp_path):
+        document = tmp_path / "schema.json"
+        document.write_text("{}")
+        cache_dir = tmp_path / "cache"
+        cache = DocumentCache(cache_dir)
+        cache.load(document, loads)
+
+        cache.clear()
+
+        assert list(cache_dir.iterdir()) == []
+
+
+class TestHttpCacheEntry:
+    def test_validators(self):
+        entry = HttpCacheEntry(
+            b"{}", etag='"abc"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT"
+        )
+
+        assert entry.validators == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+
+    def test_open(self):
+        entry = HttpCacheEntry(b"{}", content_type="application/json")
+
+        stream = entry.open()
+
+        assert stream.read() == b"{}"
+        assert stream.headers == {"Content-Type": "application/json"}
+
+
+class TestHttpCache:
+    def test_get_missing(self, tmp_path):
+        cache = HttpCache(tmp_path)
+
+        assert cache.get("https://example.com/defs.json") is None
+
+    def test_set_get(self, tmp_path):
+        cache = HttpCache(tmp_path)
+        entry = HttpCacheEntry(b"{}", etag='"abc"')
+
+        cache.set("https://example.com/defs.json", entry)
+
+        assert cache.get("https://example.com/defs.json") == entry
+        assert cache.get("https://example.com/other.json") is None
+
+    def test_get_offline_missing(self, tmp_path):
+        cache = HttpCache(tmp_path, offline=True)
+
+        with pytest.raises(LookupError):
+            cache.get_offline("https://example.com/defs.json")
@@ -1,10 +1,22 @@
+import bz2
+import gzip
+import lzma
+from io import BytesIO
 from io import StringIO
 from pathlib import Path
+from unittest import mock
 
 import pytest
+from yaml import YAMLError
 
+from jsonschema_path.backends import JsonBackend
+from jsonschema_path.handlers import default_handlers
+from jsonschema_path.handlers.caches import DocumentCache
 from jsonschema_path.handlers.file import FileHandler
 from jsonschema_path.handlers.file import FilePathHandler
+from jsonschema_path.handlers.utils import sniff_compression
+from jsonschema_path.lazy import LazyDict
+from jsonschema_path.lazy import LoadedDict
 
 
 class TestFileHandler:
@@ -51,6 +63,333 @@ class TestFileHandler:
         assert result["maximum"] == "1_0e2"
         assert type(result["maximum"]) is str
 
+    def test_repeated_scalars_resolve_consistently(self):
+        yaml_data = (
+            "a: [1e2, '1e2', 2024-01-01, true, null, 10, 1.5, x]\n"
+            "b: [1e2, '1e2', 2024-01-01, true, null, 10, 1.5, x]\n"
+        )
+        handler = FileHandler()
+
+        for _ in range(2):
+            result = handler(StringIO(yaml_data))
+
+            expected = [100.0, "1e2", "2024-01-01", True, None, 10, 1.5, "x"]
+            assert result["a"] == expected
+            assert result["b"] == expected
+            assert type(result["a"][0]) is float
+
+    def test_explicit_str_tag(self):
+        result = FileHandler()(StringIO("maximum: !!str 1e2"))
+
+        assert result["maximum"] == "1e2"
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            '{"type": "object", "maximum": 1e2}',
+            '  \n\t[{"type": "object", "maximum": 1e2}]',
+        ],
+    )
+    def test_json_skips_yaml(self, data):
+        handler = FileHandler()
+
+        with mock.patch.object(handler, "_load") as load_mock:
+            result = handler(StringIO(data))
+
+        load_mock.assert_not_called()
+        assert result in (
+            {"type": "object", "maximum": 100.0},
+            [{"type": "object", "maximum": 100.0}],
+        )
+
+    def test_json_bytes(self):
+        result = FileHandler()(BytesIO(b' {"type": "object"}'))
+
+        assert result == {"type": "object"}
+
+    def test_yaml_flow_mapping_falls_back(self):
+        result = FileHandler()(StringIO("{type: object, created: 2024-01-01}"))
+
+        assert result == {"type": "object", "created": "2024-01-01"}
+
+    def test_json_constant_falls_back(self):
+        result = FileHandler()(StringIO('{"maximum": NaN}'))
+
+        assert result == {"maximum": "NaN"}
+
+    @pytest.mark.parametrize(
+        ("uri", "content_type"),
+        [
+            ("file:///spec/openapi.yaml", None),
+            (None, "application/yaml"),
+        ],
+    )
+    def test_yaml_hint_skips_json(self, uri, content_type):
+        json_backend = mock.Mock(wraps=JsonBackend())
+        handler = FileHandler(json_backend=json_backend)
+
+        result = handler(
+            StringIO('{"type": "object"}'),
+            uri=uri,
+            content_type=content_type,
+        )
+
+        assert result == {"type": "object"}
+        # Only the normalising round-trip decode.
+        json_backend.loads.assert_called_once_with('{"type": "object"}')
+
+    @pytest.mark.parametrize(
+        ("uri", "content_type"),
+        [
+            ("file:///spec/openapi.json", None),
+            (None, "application/schema+json; charset=utf-8"),
+        ],
+    )
+    def test_json_hint(self, uri, content_type):
+        handler = FileHandler()
+
+        with mock.patch.object(handler, "_load") as load_mock:
+            result = handler(
+                StringIO('\n{"type": "object"}'),
+                uri=uri,
+                content_type=content_type,
+            )
+
+        load_mock.assert_not_called()
+        assert result == {"type": "object"}
+
+    def test_json_backend(self):
+        json_backend = mock.Mock(wraps=JsonBackend())
+        handler = FileHandler(json_backend=json_backend)
+
+        result = handler(StringIO('{"type": "object"}'))
+
+        assert result == {"type": "object"}
+        json_backend.loads.assert_called_once_with(
+            '{"type": "object"}', allow_nan=False
+        )
+
+    def test_json_hint_invalid_json_falls_back(self):
+        result = FileHandler()(
+            StringIO("type: object"), uri="file:///spec/openapi.json"
+        )
+
+        assert result == {"type": "object"}
+
+    def test_detect_json_disabled(self):
+        handler = FileHandler(detect_json=False)
+
+        with mock.patch.object(
+            handler, "_load", return_value={"type": "object"}
+        ) as load_mock:
+            result = handler(StringIO('{"type": "object"}'))
+
+        load_mock.assert_called_once()
+        assert result == {"type": "object"}
+
+
+class TestFileHandlerLoads:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            '{"type": "object"}',
+            b'{"type": "object"}',
+            memoryview(b'{"type": "object"}'),
+            memoryview(b"type: object\n"),
+            memoryview(gzip.compress(b"type: object\n")),
+        ],
+    )
+    def test_buffer(self, data):
+        result = FileHandler().loads(data)
+
+        assert result == {"type": "object"}
+
+    def test_bytes_stream_parsed_in_place(self):
+        handler = FileHandler()
+        data = b'{"type": "object"}'
+
+        with mock.patch.object(handler, "loads", wraps=handler.loads) as m:
+            result = handler(BytesIO(data), uri="file:///spec.json")
+
+        m.assert_called_once_with(
+            data, uri="file:///spec.json", content_type=None
+        )
+        assert result == {"type": "object"}
+
+
+class TestFileHandlerIterDocuments:
+    def test_yaml_stream(self):
+        stream = StringIO("type: object\n---\ntype: string\n...\n---\n1\n")
+
+        result = list(FileHandler().iter_documents(stream))
+
+        assert result == [{"type": "object"}, {"type": "string"}, 1]
+
+    def test_yaml_stream_empty_documents(self):
+        stream = StringIO("---\ntype: object\n---\n---\ntype: string\n---\n")
+
+        result = list(FileHandler().iter_documents(stream))
+
+        assert result == [{"type": "object"}, {"type": "string"}]
+
+    @pytest.mark.parametrize(
+        ("uri", "content_type"),
+        [
+            ("file:///schemas.jsonl", None),
+            ("file:///schemas.ndjson", None),
+            (None, "application/x-ndjson"),
+        ],
+    )
+    def test_json_lines(self, uri, content_type):
+        stream = BytesIO(b'{"type": "object"}\n\n{"type": "string"}')
+
+        result = list(
+            FileHandler().iter_documents(
+                stream, uri=uri, content_type=content_type
+            )
+        )
+
+        assert result == [{"type": "object"}, {"type": "string"}]
+
+    def test_compressed_json_lines(self):
+        data = b'{"a": 1}\r\n{"a": 2}\r\n'
+        stream = BytesIO(gzip.compress(data))
+
+        result = list(
+            FileHandler().iter_documents(stream, uri="file:///s.jsonl.gz")
+        )
+
+        assert result == [{"a": 1}, {"a": 2}]
+
+
+class TestFileHandlerCompression:
+    @pytest.mark.parametrize(
+        "compress", [gzip.compress, bz2.compress, lzma.compress]
+    )
+    @pytest.mark.parametrize(
+        "data", [b'{"type": "object"}', b"type: object\n"]
+    )
+    def test_decompressed(self, compress, data):
+        result = FileHandler()(BytesIO(compress(data)))
+
+        assert result == {"type": "object"}
+
+    def test_suffix_hint(self):
+        data = gzip.compress(b"type: object\n")
+
+        result = FileHandler()(BytesIO(data), uri="file:///spec.yaml.gz")
+
+        assert result == {"type": "object"}
+
+    @pytest.mark.parametrize(
+        "data", [b"BZh: value\n", b"BZh9: value\n", b"BZh91AY: value\n"]
+    )
+    def test_bz2_magic_text_not_decompressed(self, data):
+        key = data.split(b":")[0].decode()
+
+        result = FileHandler()(BytesIO(data))
+
+        assert result == {key: "value"}
+
+    def test_empty_bz2(self):
+        data = bz2.compress(b"")
+
+        assert sniff_compression(data) == "bz2"
+
+    def test_text_stream_not_decompressed(self):
+        result = FileHandler()(StringIO("BZh: value"))
+
+        assert result == {"BZh": "value"}
+
+
+class TestFileHandlerLazy:
+    yaml_data = (
+        "info:\n"
+        "  title: Pets\n"
+        "components:\n"
+        "  schemas:\n"
+        "    Pet:\n"
+        "      type: object\n"
+        "    Tag:\n"
+        "      type: string\n"
+    )
+
+    def test_yaml(self):
+        result = FileHandler(lazy=True)(StringIO(self.yaml_data))
+
+        schemas = result["components"]["schemas"]
+        assert schemas["Pet"] == {"type": "object"}
+        assert type(dict.__getitem__(schemas, "Tag")) is LazyDict
+        assert result == FileHandler()(StringIO(self.yaml_data))
+
+    def test_yaml_anchors_not_lazy(self):
+        data = "defs:\n  pet: &pet\n    type: object\na: *pet\n"
+
+        result = FileHandler(lazy=True)(StringIO(data))
+
+        assert type(result) is dict
+        assert result["a"] == {"type": "object"}
+
+    def test_json(self):
+        data = b'{"defs": {"pet": {"type": "object"}}}'
+
+        result = FileHandler(lazy=True)(BytesIO(data))
+
+        assert type(dict.__getitem__(result, "defs")) is LazyDict
+        assert result == {"defs": {"pet": {"type": "object"}}}
+
+    def test_json_constants(self):
+        data = b'{"a": [NaN, Infinity]}'
+
+        result = FileHandler(lazy=True)(BytesIO(data))
+
+        assert result == FileHandler()(BytesIO(data))
+
+    def test_json_control_character(self):
+        data = b'{"a": ["\x01"]}'
+
+        with pytest.raises(YAMLError):
+            FileHandler()(BytesIO(data))
+        with pytest.raises(YAMLError):
+            FileHandler(lazy=True)(BytesIO(data))
+
+
+class TestFileHandlerPreserveAliases:
+    yaml_data = (
+        "defs:\n"
+        "  pet: &pet {type: object, properties: {1: {type: string}}}\n"
+        "a: *pet\n"
+        "b: [*pet, *pet]\n"
+        "c: {null: 1, true: 2, 1.5: 3}\n"
+    )
+
+    def test_aliases_shared(self):
+        result = FileHandler(preserve_aliases=True)(StringIO(self.yaml_data))
+
+        assert result["a"] is result["defs"]["pet"]
+        assert result["b"][0] is result["b"][1] is result["a"]
+
+    def test_matches_round_trip(self):
+        expected = FileHandler()(StringIO(self.yaml_data))
+
+        result = FileHandler(preserve_aliases=True)(StringIO(self.yaml_data))
+
+        assert result == expected
+        assert list(result["c"]) == ["null", "true", "1.5"]
+        assert expected["a"] is not expected["defs"]["pet"]
+
+    def test_unsupported_type(self):
+        handler = FileHandler(preserve_aliases=True)
+
+        with pytest.raises(TypeError):
+            handler(StringIO("created: !!timestamp 2024-01-01"))
+
+    def test_recursive_alias(self):
+        handler = FileHandler(preserve_aliases=True)
+
+        with pytest.raises(ValueError):
+            handler(StringIO("a: &a [*a]"))
+
 
 class TestFilePathHandler:
     def test_invalid_scheme(self):
@@ -68,3 +407,153 @@ class TestFilePathHandler:
         result = handler(test_file_uri)
 
         assert result == {}
+
+    def test_document_cache(self, create_file, tmp_path):
+        test_file = create_file({"type": "object"})
+        test_file_uri = Path(test_file).as_uri()
+        handler = FilePathHandler(document_cache=DocumentCache(tmp_path))
+        handler(test_file_uri)
+
+        with mock.patch.object(handler, "_parse") as parse_mock:
+            result = handler(test_file_uri)
+
+        parse_mock.assert_not_called()
+        assert result == {"type": "object"}
+
+    def test_document_cache_shared(self, tmp_path):
+        test_file = tmp_path / "spec.yaml"
+        test_file.write_text("defs: &pet {type: object}\na: *pet\n")
+        document_cache = DocumentCache(tmp_path / "cache")
+        handler = FilePathHandler(document_cache=document_cache)
+        aliases_handler = FilePathHandler(
+            document_cache=document_cache,
+            file_handler=FileHandler(preserve_aliases=True),
+        )
+
+        result = handler(test_file.as_uri())
+        aliases_result = aliases_handler(test_file.as_uri())
+
+        assert result["a"] is not result["defs"]
+        assert aliases_result["a"] is aliases_result["defs"]
+
+    def test_utf8_bom(self, tmp_path):
+        test_file = tmp_path / "spec.json"
+        test_file.write_bytes(b'\xef\xbb\xbf{"title": "caf\xc3\xa9"}')
+        handler = FilePathHandler()
+
+        result = handler(test_file.as_uri())
+
+        assert result == {"title": "caf\xe9"}
+
+    def test_encoding(self, tmp_path):
+        test_file = tmp_path / "spec.yaml"
+        test_file.write_bytes("title: caf\xe9\n".encode("latin-1"))
+        handler = FilePathHandler(encoding="latin-1")
+
+        result = handler(test_file.as_uri())
+
+        assert result == {"title": "caf\xe9"}
+
+    def test_compressed(self, tmp_path):
+        test_file = tmp_path / "spec.json.gz"
+        test_file.write_bytes(gzip.compress(b'{"type": "object"}'))
+        handler = FilePathHandler()
+
+        result = handler(test_file.as_uri())
+
+        assert result == {"type": "object"}
+
+    def test_compressed_document_cache(self, tmp_path):
+        test_file = tmp_path / "spec.yaml.xz"
+        test_file.write_bytes(lzma.compress(b"type: object\n"))
+        handler = FilePathHandler(
+            document_cache=DocumentCache(tmp_path / "cache")
+        )
+
+        result = handler(test_file.as_uri())
+
+        assert result == {"type": "object"}
+
+    def test_compressed_encoding(self, tmp_path):
+        test_file = tmp_path / "spec.yaml.gz"
+        test_file.write_bytes(
+            gzip.compress("title: caf\xe9\n".encode("latin-1"))
+        )
+        handler = FilePathHandler(encoding="latin-1")
+
+        result = handler(test_file.as_uri())
+
+        assert result == {"title": "caf\xe9"}
+
+    def test_missing(self, tmp_path):
+        handler = FilePathHandler()
+
+        with pytest.raises(FileNotFoundError):
+            handler((tmp_path / "missing.json").as_uri())
+
+    def test_default_handler(self):
+        assert type(default_handlers["file"]) is FilePathHandler
+
+
+class TestFilePathHandlerFileHandlerSubclass:
+    def test_call_overridden(self, tmp_path):
+        class UpperFileHandler(FileHandler):
+            def __call__(self, stream):
+                return {"text": stream.read().upper()}
+
+        test_file = tmp_path / "spec.json"
+        test_file.write_text('{"type": "object"}')
+        handler = FilePathHandler(
+            file_handler=UpperFileHandler(),
+            document_cache=DocumentCache(tmp_path / "cache"),
+        )
+
+        result = handler(test_file.as_uri())
+
+        assert result == {"text": '{"TYPE": "OBJECT"}'}
+
+    def test_load_overridden(self, tmp_path):
+        class TextFileHandler(FileHandler):
+            def _load(self, stream):
+                return {"text": stream.read()}
+
+        test_file = tmp_path / "spec.json"
+        test_file.write_text('{"type": "object"}')
+        handler = FilePathHandler(file_handler=TextFileHandler())
+
+        result = handler(test_file.as_uri())
+
+        assert result == {"text": '{"type": "object"}'}
+
+
+class TestFilePathHandlerLazy:
+    def test_json(self, tmp_path):
+        test_file = tmp_path / "spec.json"
+        test_file.write_text('{"defs": {"pet": {"type": "object"}}}')
+        handler = FilePathHandler(lazy=True)
+
+        result = handler(test_file.as_uri())
+
+        assert type(result) is LoadedDict
+        assert type(dict.__getitem__(result, "defs")) is LazyDict
+        assert result == {"defs": {"pet": {"type": "object"}}}
+
+    @pytest.mark.parametrize(
+        ("name", "content"),
+        [
+            ("spec.yaml", "defs: {}\n"),
+            ("spec", "{defs: {}}"),
+            ("spec.json.gz", gzip.compress(b'{"defs": {}}')),
+        ],
+    )
+    def test_other_formats(self, tmp_path, name, content):
+        test_file = tmp_path / name
+        if isinstance(content, bytes):
+            test_file.write_bytes(content)
+        else:
+            test_file.write_text(content)
+        handler = FilePathHandler(lazy=True)
+
+        result = handler(test_file.as_uri())
+
+        assert result == {"defs": {}}
@@ -0,0 +1,125 @@
+import os
+import subprocess
+import sys
+from urllib.parse import urljoin
+from urllib.parse import uses_netloc
+from urllib.parse import uses_relative
+from zipfile import ZipFile
+
+import pytest
+
+from jsonschema_path.handlers.package import PACKAGE_SCHEME
+from jsonschema_path.handlers.package import PackageResourceHandler
+from jsonschema_path.handlers.package import get_package_uri
+
+FILES = {
+    "specpkg/__init__.py": "",
+    "specpkg/openapi.json": '{"$ref": "schemas/pet.yaml"}',
+    "specpkg/schemas/pet.yaml": "type: string\n",
+}
+
+
+@pytest.fixture(params=["directory", "zipapp"])
+def package(request, tmp_path, monkeypatch):
+    if request.param == "directory":
+        for name, content in FILES.items():
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        sys_path = str(tmp_path)
+    else:
+        archive = tmp_path / "app.zip"
+        with ZipFile(archive, "w") as zf:
+            for name, content in FILES.items():
+                zf.writestr(name, content)
+        sys_path = str(archive)
+    monkeypatch.syspath_prepend(sys_path)
+    yield "specpkg"
+    sys.modules.pop("specpkg", None)
+
+
+class TestGetPackageUri:
+    def test_uri(self):
+        uri = get_package_uri("specpkg.v1", "/schemas/a pet.yaml")
+
+        assert uri == "package://specpkg.v1/schemas/a%20pet.yaml"
+
+    def test_relative_ref(self):
+        uri = get_package_uri("specpkg", "schemas/pet.yaml")
+
+        assert (
+            urljoin(uri, "../common.json") == "package://specpkg/common.json"
+        )
+
+
+class TestRegisterPackageScheme:
+    def test_registered_on_import(self):
+        code = (
+            "import urllib.parse, jsonschema_path\n"
+            "assert 'package' in urllib.parse.uses_relative\n"
+            "assert 'package' in urllib.parse.uses_netloc\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_from_dict_relative_ref(self, tmp_path):
+        for name, content in FILES.items():
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        # A fresh process, so nothing has touched package URIs before.
+        code = (
+            "from jsonschema_path import SchemaPath\n"
+            "path = SchemaPath.from_dict(\n"
+            "    {'a': {'$ref': 'schemas/pet.yaml'}},\n"
+            "    base_uri='package://specpkg/openapi.json',\n"
+            ")\n"
+            "assert (path / 'a').read_value() == {'type': 'string'}\n"
+        )
+
+        subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            env={
+                **os.environ,
+                "PYTHONPATH": os.pathsep.join([str(tmp_path)] + sys.path),
+            },
+        )
+
+    def test_registered(self):
+        assert PACKAGE_SCHEME in uses_relative
+        assert PACKAGE_SCHEME in uses_netloc
+
+
+class TestPackageResourceHandler:
+    def test_resource(self, package):
+        handler = PackageResourceHandler()
+
+        result = handler(get_package_uri(package, "schemas/pet.yaml"))
+
+        assert result == {"type": "string"}
+
+    def test_json(self, package):
+        handler = PackageResourceHandler()
+
+        result = handler(get_package_uri(package, "openapi.json"))
+
+        assert result == {"$ref": "schemas/pet.yaml"}
+
+    def test_missing(self, package):
+        handler = PackageResourceHandler()
+
+        with pytest.raises(FileNotFoundError):
+            handler(get_package_uri(package, "missing.yaml"))
+
+    def test_package_root(self, package):
+        handler = PackageResourceHandler()
+
+        with pytest.raises(FileNotFoundError):
+            handler(f"package://{package}/")
+
+    def test_invalid_scheme(self):
+        handler = PackageResourceHandler()
+
+        with pytest.raises(ValueError):
+            handler("file:///specpkg/openapi.json")
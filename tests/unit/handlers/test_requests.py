@@ -0,0 +1,147 @@
+import gzip
+import os
+from unittest import mock
+
+import pytest
+import responses
+
+from jsonschema_path.handlers.caches import HttpCache
+from jsonschema_path.handlers.requests import SessionFactory
+from jsonschema_path.handlers.requests import UrlRequestsHandler
+
+
+class TestSessionFactory:
+    def test_reused(self):
+        factory = SessionFactory()
+
+        assert factory() is factory()
+
+    def test_pool_config(self):
+        factory = SessionFactory(pool_maxsize=3, pool_block=True)
+
+        adapter = factory().get_adapter("https://example.com")
+
+        assert adapter._pool_maxsize == 3
+        assert adapter._pool_block is True
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_new_session_after_fork(self):
+        factory = SessionFactory()
+        session = factory()
+        # Held by "another thread" at fork time.
+        factory._lock.acquire()
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            forked_session = factory()
+            os._exit(0 if forked_session is not session else 1)
+        factory._lock.release()
+        _, status = os.waitpid(pid, 0)
+
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert factory() is session
+
+
+class TestUrlRequestsHandler:
+    @responses.activate
+    def test_session_factory(self):
+        responses.add(
+            responses.GET,
+            "https://example.com/defs.json",
+            json={"type": "object"},
+        )
+        factory = SessionFactory()
+        handler = UrlRequestsHandler("https", session_factory=factory)
+
+        with mock.patch.object(
+            factory, "_create_session", wraps=factory._create_session
+        ) as create_mock:
+            first = handler("https://example.com/defs.json")
+            second = handler("https://example.com/defs.json")
+
+        assert first == second == {"type": "object"}
+        create_mock.assert_called_once_with()
+
+    @responses.activate
+    def test_compressed(self):
+        responses.add(
+            responses.GET,
+            "https://example.com/defs.json.gz",
+            body=gzip.compress(b'{"type": "object"}'),
+            content_type="application/gzip",
+        )
+        handler = UrlRequestsHandler("https")
+
+        result = handler("https://example.com/defs.json.gz")
+
+        assert result == {"type": "object"}
+
+    @responses.activate
+    def test_declared_charset(self):
+        responses.add(
+            responses.GET,
+            "https://example.com/defs.yaml",
+            body="title: caf\xe9\n".encode("latin-1"),
+            content_type="application/yaml; charset=latin-1",
+        )
+        handler = UrlRequestsHandler("https")
+
+        result = handler("https://example.com/defs.yaml")
+
+        assert result == {"title": "caf\xe9"}
+
+
+class TestUrlRequestsHandlerHttpCache:
+    def test_revalidated(self, http_server, tmp_path):
+        http_server.documents["/defs.json"] = {"type": "object"}
+        uri = f"{http_server.url}/defs.json"
+        http_cache = HttpCache(tmp_path)
+        UrlRequestsHandler(
+            "http", session_factory=SessionFactory(), http_cache=http_cache
+        )(uri)
+
+        result = UrlRequestsHandler(
+            "http", session_factory=SessionFactory(), http_cache=http_cache
+        )(uri)
+
+        assert result == {"type": "object"}
+        first_headers, second_headers = (
+            headers for _, _, headers in http_server.requests
+        )
+        assert "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"] == http_cache.get(uri).etag
+
+    def test_updated(self, http_server, tmp_path):
+        http_server.documents["/defs.json"] = {"type": "object"}
+        uri = f"{http_server.url}/defs.json"
+        http_cache = HttpCache(tmp_path)
+        handler = UrlRequestsHandler(
+            "http", session_factory=SessionFactory(), http_cache=http_cache
+        )
+        handler(uri)
+        http_server.documents["/defs.json"] = {"type": "string"}
+
+        result = handler(uri)
+
+        assert result == {"type": "string"}
+
+    def test_offline(self, http_server, tmp_path):
+        http_server.documents["/defs.json"] = {"type": "object"}
+        uri = f"{http_server.url}/defs.json"
+        UrlRequestsHandler(
+            "http",
+            session_factory=SessionFactory(),
+            http_cache=HttpCache(tmp_path),
+        )(uri)
+        handler = UrlRequestsHandler(
+            "http",
+            session_factory=SessionFactory(),
+            http_cache=HttpCache(tmp_path, offline=True),
+        )
+
+        result = handler(uri)
+
+        assert result == {"type": "object"}
+        assert len(http_server.requests) == 1
+        with pytest.raises(LookupError):
+            handler(f"{http_server.url}/other.json")
@@ -0,0 +1,48 @@
+import pytest
+
+from jsonschema_path.handlers.caches import HttpCache
+from jsonschema_path.handlers.urllib import UrllibHandler
+
+
+class TestUrllibHandlerHttpCache:
+    def test_revalidated(self, http_server, tmp_path):
+        http_server.documents["/defs.json"] = {"type": "object"}
+        uri = f"{http_server.url}/defs.json"
+        http_cache = HttpCache(tmp_path)
+        UrllibHandler("http", http_cache=http_cache)(uri)
+
+        result = UrllibHandler("http", http_cache=http_cache)(uri)
+
+        assert result == {"type": "object"}
+        first_headers, second_headers = (
+            headers for _, _, headers in http_server.requests
+        )
+        assert "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"] == http_cache.get(uri).etag
+
+    def test_updated(self, http_server, tmp_path):
+        http_server.documents["/defs.json"] = {"type": "object"}
+        uri = f"{http_server.url}/defs.json"
+        http_cache = HttpCache(tmp_path)
+        handler = UrllibHandler("http", http_cache=http_cache)
+        handler(uri)
+        http_server.documents["/defs.json"] = {"type": "string"}
+
+        result = handler(uri)
+
+        assert result == {"type": "string"}
+
+    def test_offline(self, http_server, tmp_path):
+        http_server.documents["/defs.json"] = {"type": "object"}
+        uri = f"{http_server.url}/defs.json"
+        UrllibHandler("http", http_cache=HttpCache(tmp_path))(uri)
+        handler = UrllibHandler(
+            "http", http_cache=HttpCache(tmp_path, offline=True)
+        )
+
+        result = handler(uri)
+
+        assert result == {"type": "object"}
+        assert len(http_server.requests) == 1
+        with pytest.raises(LookupError):
+            handler(f"{http_server.url}/other.json")
@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 import pytest
 from referencing import Registry
+from referencing.jsonschema import DRAFT4
 from referencing.jsonschema import DRAFT202012
 
 from jsonschema_path import SchemaPath
@@ -33,6 +34,40 @@ class TestSchemaAccessorOpen:
         retrieve.assert_called_once_with("x://testref")
 
 
+class TestSchemaAccessorFromSchemaResources:
+    def test_documents_not_retrieved(self):
+        retrieve = Mock()
+        accessor = SchemaAccessor.from_schema(
+            {"$ref": "x://pet#/Pet"},
+            handlers={"x": retrieve},
+            resources={"x://pet": {"Pet": {"type": "object"}}},
+        )
+
+        assert accessor.read(["type"]) == "object"
+        retrieve.assert_not_called()
+
+    def test_prebuilt_resource(self):
+        retrieve = Mock()
+        resource = DRAFT4.create_resource({"id": "x://pet", "type": "object"})
+        accessor = SchemaAccessor.from_schema(
+            {"$ref": "x://pet"},
+            handlers={"x": retrieve},
+            resources={"x://pet": resource},
+        )
+
+        assert accessor.read(["type"]) == "object"
+        retrieve.assert_not_called()
+
+    def test_base_document_wins(self):
+        accessor = SchemaAccessor.from_schema(
+            {"type": "string"},
+            base_uri="x://root",
+            resources={"x://root": {"type": "object"}},
+        )
+
+        assert accessor.read(["type"]) == "string"
+
+
 class TestSchemaAccessorKeys:
     def test_dereferences_once(self):
         retrieve = Mock(return_value={"value": "tested"})
@@ -0,0 +1,66 @@
+import math
+
+import pytest
+
+from jsonschema_path.backends import JsonBackend
+from jsonschema_path.backends import OrjsonBackend
+from jsonschema_path.backends import get_default_json_backend
+from jsonschema_path.backends import set_default_json_backend
+
+
+class TestJsonBackend:
+    def test_loads(self):
+        result = JsonBackend().loads(b'{"maximum": 1e2}')
+
+        assert result == {"maximum": 100.0}
+
+    def test_loads_nan(self):
+        result = JsonBackend().loads('{"maximum": NaN}')
+
+        assert math.isnan(result["maximum"])
+
+    def test_loads_nan_disallowed(self):
+        with pytest.raises(ValueError):
+            JsonBackend().loads('{"maximum": NaN}', allow_nan=False)
+
+    def test_dumps(self):
+        result = JsonBackend().dumps({1: None})
+
+        assert result == '{"1": null}'
+
+
+class TestOrjsonBackend:
+    @pytest.fixture(autouse=True)
+    def require_orjson(self):
+        pytest.importorskip("orjson")
+
+    def test_loads(self):
+        result = OrjsonBackend().loads(memoryview(b'{"maximum": 1e2}'))
+
+        assert result == {"maximum": 100.0}
+
+    def test_loads_big_int(self):
+        result = OrjsonBackend().loads("[123456789012345678901234567890]")
+
+        assert result == [123456789012345678901234567890]
+
+    def test_loads_nan(self):
+        result = OrjsonBackend().loads('{"maximum": NaN}')
+
+        assert math.isnan(result["maximum"])
+
+    def test_loads_nan_disallowed(self):
+        with pytest.raises(ValueError):
+            OrjsonBackend().loads('{"maximum": NaN}', allow_nan=False)
+
+
+class TestDefaultJsonBackend:
+    def test_set(self):
+        default = get_default_json_backend()
+        backend = JsonBackend()
+
+        set_default_json_backend(backend)
+        try:
+            assert get_default_json_backend() is backend
+        finally:
+            set_default_json_backend(default)
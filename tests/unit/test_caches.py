@@ -0,0 +1,74 @@
+import pytest
+from referencing.jsonschema import DRAFT4
+from referencing.jsonschema import DRAFT202012
+
+from jsonschema_path.caches import ResourceCache
+from jsonschema_path.caches import normalize_uri
+
+
+class TestNormalizeUri:
+    def test_normalized(self):
+        result = normalize_uri("HTTPS://Example.COM/Defs.json#/Info")
+
+        assert result == "https://example.com/Defs.json"
+
+
+class TestResourceCache:
+    def test_negative_maxsize(self):
+        with pytest.raises(ValueError):
+            ResourceCache(maxsize=-1)
+
+    def test_get_set(self):
+        cache = ResourceCache()
+        resource = DRAFT202012.create_resource({"type": "object"})
+
+        cache.set("https://example.com/defs.json", DRAFT202012, resource)
+
+        assert cache.get("https://EXAMPLE.com/defs.json#", DRAFT202012) is (
+            resource
+        )
+        assert cache.get("https://example.com/defs.json", DRAFT4) is None
+
+    def test_lru_eviction(self):
+        cache = ResourceCache(maxsize=2)
+        resource = DRAFT202012.create_resource({})
+        cache.set("file:///a.yaml", DRAFT202012, resource)
+        cache.set("file:///b.yaml", DRAFT202012, resource)
+        cache.get("file:///a.yaml", DRAFT202012)
+
+        cache.set("file:///c.yaml", DRAFT202012, resource)
+
+        assert len(cache) == 2
+        assert cache.get("file:///a.yaml", DRAFT202012) is resource
+        assert cache.get("file:///b.yaml", DRAFT202012) is None
+
+    def test_disabled(self):
+        cache = ResourceCache(maxsize=0)
+
+        cache.set(
+            "file:///a.yaml", DRAFT202012, DRAFT202012.create_resource({})
+        )
+
+        assert len(cache) == 0
+
+    def test_invalidate(self):
+        cache = ResourceCache()
+        resource = DRAFT202012.create_resource({})
+        cache.set("file:///a.yaml", DRAFT202012, resource)
+        cache.set("file:///a.yaml", DRAFT4, resource)
+        cache.set("file:///b.yaml", DRAFT202012, resource)
+
+        cache.invalidate("file:///a.yaml")
+
+        assert len(cache) == 1
+        assert cache.get("file:///b.yaml", DRAFT202012) is resource
+
+    def test_clear(self):
+        cache = ResourceCache()
+        cache.set(
+            "file:///a.yaml", DRAFT202012, DRAFT202012.create_resource({})
+        )
+
+        cache.clear()
+
+        assert len(cache) == 0
@@ -0,0 +1,138 @@
+import copy
+import json
+import pickle
+
+import pytest
+import yaml
+
+from jsonschema_path.lazy import LazyDict
+from jsonschema_path.lazy import LazyList
+from jsonschema_path.lazy import LoadedDict
+from jsonschema_path.lazy import loads_lazy
+from jsonschema_path.lazy import loads_lazy_yaml
+from jsonschema_path.lazy import materialize
+from jsonschema_path.loaders import JsonschemaSafeLoader
+
+DOCUMENT = {
+    "info": {"title": 'Pets "[v1]" {\\u00e9}', "version": "1.0"},
+    "schemas": {
+        "Pet": {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": {"type": "integer", "minimum": -1e3}},
+        },
+        "Tags": {"type": "array", "items": [], "enum": [1, 2.5, True, None]},
+    },
+}
+
+
+@pytest.fixture
+def data():
+    return json.dumps(DOCUMENT).encode("utf-8")
+
+
+class TestLoadsLazy:
+    def test_equal(self, data):
+        result = loads_lazy(data)
+
+        assert result == DOCUMENT
+        assert DOCUMENT == result
+
+    def test_children_lazy(self, data):
+        result = loads_lazy(data)
+
+        assert type(result) is LoadedDict
+        assert type(dict.__getitem__(result, "schemas")) is LazyDict
+        assert type(result["schemas"]["Tags"]["items"]) is LazyList
+
+    def test_materialized_on_access(self, data):
+        result = loads_lazy(data)
+
+        pet = result["schemas"]["Pet"]
+
+        assert pet["properties"]["id"]["minimum"] == -1000.0
+        assert type(pet) is LoadedDict
+        assert type(dict.__getitem__(result["schemas"], "Tags")) is LazyDict
+
+    def test_lazy_nodes_equal(self, data):
+        assert loads_lazy(data) == loads_lazy(data)
+        assert loads_lazy(b"[[1], [2]]") < loads_lazy(b"[[1], [3]]")
+
+    def test_serializable(self, data):
+        result = loads_lazy(data)
+
+        assert json.loads(json.dumps(materialize(result))) == DOCUMENT
+        assert pickle.loads(pickle.dumps(loads_lazy(data))) == DOCUMENT
+        assert copy.deepcopy(loads_lazy(data)) == DOCUMENT
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b'{"a": [1}',
+            b'{"a": 1',
+            b'{"a": 1}}',
+            b"[1] 2",
+            b"{a: 1}",
+            b'[["\x01"]]',
+            b'[["\\q"]]',
+            b"[[NaN]]",
+            b'[{"a": -Infinity}]',
+        ],
+    )
+    def test_invalid(self, data):
+        with pytest.raises(ValueError):
+            loads_lazy(data)
+
+    @pytest.mark.parametrize(
+        "data", [b'[{"a" 1}]', b"[[1 2]]", b"[[1,]]", b"[[tru]]"]
+    )
+    def test_invalid_raised_on_access(self, data):
+        result = loads_lazy(data)
+
+        with pytest.raises(ValueError):
+            result[0][0]
+
+
+class TestLoadsLazyYaml:
+    @staticmethod
+    def load(text):
+        return json.loads(json.dumps(yaml.load(text, JsonschemaSafeLoader)))
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "a:\n  b:\n    c: 1\n  d: [1,\n    2]\n",
+            "---\na:\n  b: 1\n",
+            "# comment\na:\n\n  b:\n# comment\n    c: d\n  e: f\n",
+            "a:\n  'b c':\n    d: |\n      e:\n      f\n  200:\n    g: h\n",
+            "a:\n- b: 1\n- c: 2\n",
+            "a:\n  b: 1\na:\n  c: 2\n",
+            "a:\n  b: [1,\n2]\n  c: 3\n",
+            "- a\n- b\n",
+            "{a: 1}",
+            "",
+        ],
+    )
+    def test_equal(self, text):
+        result = loads_lazy_yaml(text, self.load)
+
+        assert result == self.load(text)
+
+    def test_children_lazy(self):
+        text = "a:\n  b:\n    c: 1\nd:\n  e: 2\nf: 3\n"
+
+        result = loads_lazy_yaml(text, self.load)
+
+        assert type(result) is LoadedDict
+        assert type(dict.__getitem__(result, "d")) is LazyDict
+        assert result["a"]["b"] == {"c": 1}
+        assert type(dict.__getitem__(result, "d")) is LazyDict
+
+    def test_anchors_not_lazy(self):
+        text = "a: &a\n  b: 1\nc: *a\n"
+
+        result = loads_lazy_yaml(text, self.load)
+
+        assert type(result) is dict
+        assert result == {"a": {"b": 1}, "c": {"b": 1}}
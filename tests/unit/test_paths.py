@@ -1,3 +1,7 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from io import StringIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
@@ -6,10 +10,15 @@ from typing import cast
 from unittest import mock
 
 import pytest
+import yaml
 from referencing import Specification
+from referencing.exceptions import Unresolvable
 
 from jsonschema_path.accessors import SchemaAccessor
 from jsonschema_path.paths import SchemaPath
+from jsonschema_path.retrievers import RetrievalPolicy
+from jsonschema_path.sourcemaps import SourceLocation
+from jsonschema_path.sourcemaps import SourceMap
 
 
 class TestSchemaPathFromDict:
@@ -52,6 +61,31 @@ class TestSchemaPathFromDict:
 
         assert_sp(sp, schema, handlers=handlers)
 
+    def test_resources(self):
+        handlers = {"x": mock.Mock()}
+
+        sp = SchemaPath.from_dict(
+            {"$ref": "x://pet"},
+            handlers=handlers,
+            resources={"x://pet": {"type": "object"}},
+        )
+
+        assert (sp / "type").read_str() == "object"
+        handlers["x"].assert_not_called()
+
+    def test_retrieval_policy(self):
+        handlers = {"https": mock.Mock(return_value={"type": "object"})}
+        policy = mock.Mock(wraps=RetrievalPolicy())
+
+        sp = SchemaPath.from_dict(
+            {"$ref": "https://example.com/pet.json"},
+            handlers=handlers,
+            retrieval_policy=policy,
+        )
+
+        assert (sp / "type").read_str() == "object"
+        policy.assert_called_once()
+
     def test_resolved_cache_maxsize(self):
         sp = SchemaPath.from_dict(
             {"name": "test"},
@@ -168,6 +202,196 @@ class TestSchemaPathFromFile:
         assert type((sp // "maximum").read_value()) is float
 
 
+class TestSchemaPathFromBytes:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b'{"type": "object"}',
+            memoryview(b"type: object\n"),
+        ],
+    )
+    def test_no_kwargs(self, data, assert_sp):
+        sp = SchemaPath.from_bytes(data)
+
+        assert_sp(sp, {"type": "object"}, base_uri="")
+
+    def test_base_uri(self, assert_sp):
+        sp = SchemaPath.from_bytes(
+            b'{"type": "object"}', base_uri="file:///spec.json"
+        )
+
+        assert_sp(sp, {"type": "object"}, base_uri="file:///spec.json")
+
+
+class TestSchemaPathFromDocuments:
+    def test_ids(self):
+        documents = [
+            {"$id": "https://example.com/a.json", "$ref": "b.json"},
+            {"$id": "b.json", "type": "string"},
+        ]
+
+        result = SchemaPath.from_documents(
+            documents, base_uri="https://example.com/"
+        )
+
+        assert list(result) == [
+            "https://example.com/a.json",
+            "https://example.com/b.json",
+        ]
+        with mock.patch("jsonschema_path.handlers.UrlHandler.__call__") as h:
+            a = result["https://example.com/a.json"]
+            assert (a / "type").read_str() == "string"
+        h.assert_not_called()
+
+    def test_uris(self):
+        result = SchemaPath.from_documents(
+            [{"type": "object"}, {"type": "string"}],
+            uris=["file:///a.json", "file:///b.json"],
+        )
+
+        assert (result["file:///b.json"] / "type").read_str() == "string"
+        assert result["file:///b.json"].base_uri == "file:///b.json"
+
+    def test_no_id(self):
+        with pytest.raises(ValueError):
+            SchemaPath.from_documents([{"type": "object"}])
+
+    def test_not_object(self):
+        with pytest.raises(ValueError, match="not an object"):
+            SchemaPath.from_documents([["type", "object"]])
+
+    def test_shared_resource_cache(self):
+        result = SchemaPath.from_documents(
+            [{"$ref": "file:///ext.json"}, {"$ref": "file:///ext.json"}],
+            uris=["file:///a.json", "file:///b.json"],
+            handlers={"file": mock.Mock(return_value={"type": "integer"})},
+        )
+
+        for path in result.values():
+            assert (path / "type").read_str() == "integer"
+        accessor = result["file:///a.json"].accessor
+        retrieve = accessor._path_resolver.resolver._registry._retrieve
+        assert retrieve.handlers["file"].call_count == 1
+
+
+class TestSchemaPathFromFileDocuments:
+    def test_json_lines(self):
+        stream = BytesIO(
+            b'{"$id": "https://example.com/a.json", "type": "object"}\n'
+            b'{"$id": "https://example.com/b.json", "type": "string"}\n'
+        )
+
+        result = SchemaPath.from_file_documents(
+            stream, base_uri="file:///schemas.jsonl"
+        )
+
+        assert (result["https://example.com/b.json"] / "type").read_str() == (
+            "string"
+        )
+
+    def test_yaml_stream(self):
+        stream = StringIO("type: object\n---\ntype: string\n")
+
+        result = SchemaPath.from_file_documents(
+            stream, uris=["file:///a.yaml", "file:///b.yaml"]
+        )
+
+        assert (result["file:///a.yaml"] / "type").read_str() == "object"
+
+    def test_yaml_stream_trailing_document(self):
+        stream = StringIO(
+            "$id: http://x/a\n---\n$id: http://x/b\n$ref: a\n---\n"
+        )
+
+        result = SchemaPath.from_file_documents(stream)
+
+        assert list(result) == ["http://x/a", "http://x/b"]
+
+    def test_yaml_stream_trailing_document_uris(self):
+        stream = StringIO("type: object\n---\ntype: string\n---\n")
+
+        result = SchemaPath.from_file_documents(
+            stream, uris=["file:///a.yaml", "file:///b.yaml"]
+        )
+
+        assert (result["file:///b.yaml"] / "type").read_str() == "string"
+
+
+class TestSchemaPathFromDirectory:
+    @pytest.fixture
+    def specs(self, tmp_path):
+        (tmp_path / "billing").mkdir()
+        (tmp_path / "billing" / "openapi.yaml").write_text(
+            "type: object\n"
+            "properties:\n"
+            "  user:\n"
+            "    $ref: ../users/openapi.json#/$defs/User\n"
+        )
+        (tmp_path / "users").mkdir()
+        (tmp_path / "users" / "openapi.json").write_text(
+            '{"$defs": {"User": {"type": "string"}}}'
+        )
+        (tmp_path / "README.md").write_text("# Specs\n")
+        return tmp_path
+
+    def test_cross_file_refs(self, specs):
+        result = SchemaPath.from_directory(specs)
+
+        assert list(result) == [
+            (specs / "billing" / "openapi.yaml").as_uri(),
+            (specs / "users" / "openapi.json").as_uri(),
+        ]
+        billing = result[(specs / "billing" / "openapi.yaml").as_uri()]
+        with mock.patch("builtins.open") as open_mock:
+            user = billing / "properties" / "user" / "type"
+            assert user.read_str() == "string"
+        open_mock.assert_not_called()
+
+    def test_pattern(self, specs):
+        result = SchemaPath.from_directory(specs, pattern="users/*.json")
+
+        assert list(result) == [(specs / "users" / "openapi.json").as_uri()]
+
+    def test_refs_outside_pattern(self, specs):
+        result = SchemaPath.from_directory(specs, pattern="billing/*.yaml")
+
+        billing = result[(specs / "billing" / "openapi.yaml").as_uri()]
+        user = billing / "properties" / "user" / "type"
+        assert user.read_str() == "string"
+
+    def test_process_pool(self, specs):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            result = SchemaPath.from_directory(specs, executor=executor)
+
+        users = result[(specs / "users" / "openapi.json").as_uri()]
+        assert (users / "$defs" / "User" / "type").read_str() == "string"
+
+    def test_invalid_document(self, specs):
+        (specs / "broken.yaml").write_text("type: [\n")
+
+        with pytest.raises(yaml.YAMLError):
+            SchemaPath.from_directory(specs)
+
+    def test_missing_directory(self, tmp_path):
+        with pytest.raises(OSError):
+            SchemaPath.from_directory(tmp_path / "missing")
+
+
+class TestSchemaPathFromPackageResource:
+    def test_relative_ref(self, tmp_path, monkeypatch):
+        package = tmp_path / "specpkg_paths"
+        (package / "schemas").mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        (package / "openapi.yaml").write_text("$ref: schemas/pet.json\n")
+        (package / "schemas" / "pet.json").write_text('{"type": "object"}')
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        sp = SchemaPath.from_package_resource("specpkg_paths", "openapi.yaml")
+
+        assert sp.base_uri == "package://specpkg_paths/openapi.yaml"
+        assert (sp / "type").read_str() == "object"
+
+
 class TestSchemaPathFromPath:
     def test_file_no_exist(self, create_file):
         schema_file_path_str = "/invalid/file"
@@ -394,6 +618,197 @@ class TestSchemaPathHelpers:
         assert child.read_value() == 1
 
 
+class TestSchemaPathSourceLocation:
+    def test_no_source_map(self):
+        sp = SchemaPath.from_dict({"type": "object"})
+
+        assert (sp / "type").source_location() is None
+
+    def test_file_path(self, tmp_path):
+        spec = tmp_path / "spec.yaml"
+        spec.write_text(
+            "components:\n"
+            "  schemas:\n"
+            "    Pet:\n"
+            "      $ref: 'pet.json#/Pet'\n"
+            "    Tag:\n"
+            "      required: [id]\n"
+        )
+        pet = tmp_path / "pet.json"
+        pet.write_text('{\n  "Pet": {\n    "type": "object"\n  }\n}\n')
+
+        sp = SchemaPath.from_file_path(str(spec), source_map=SourceMap())
+
+        schemas = sp / "components" / "schemas"
+        assert sp.source_location() == SourceLocation(spec.as_uri(), 1, 1)
+        assert (schemas / "Tag").source_location() == SourceLocation(
+            spec.as_uri(), 5, 5
+        )
+        assert (schemas / "Tag" / "required" / 0).source_location() == (
+            SourceLocation(spec.as_uri(), 6, 18)
+        )
+        assert (schemas / "Pet").source_location() == SourceLocation(
+            pet.as_uri(), 2, 3
+        )
+        assert (schemas / "Pet" / "type").source_location() == (
+            SourceLocation(pet.as_uri(), 3, 5)
+        )
+
+
+class TestSchemaPathAsync:
+    SCHEMA = {
+        "properties": {
+            "pet": {"$ref": "https://example.com/pet.json"},
+            "name": {"type": "string"},
+        },
+    }
+
+    def test_aread_value(self):
+        async def handler(uri):
+            return {"type": "object", "properties": {"id": {}}}
+
+        sp = SchemaPath.from_dict(
+            self.SCHEMA, handlers={}, async_handlers={"https": handler}
+        )
+        path = sp / "properties" / "pet" / "type"
+
+        assert asyncio.run(path.aread_value()) == "object"
+        # The retrieved document is now in the registry.
+        assert path.read_value() == "object"
+
+    def test_aopen(self):
+        async def handler(uri):
+            return {"type": "object"}
+
+        sp = SchemaPath.from_dict(
+            self.SCHEMA, handlers={}, async_handlers={"https": handler}
+        )
+
+        async def main():
+            async with (sp / "properties" / "pet").aopen() as contents:
+                return contents
+
+        assert asyncio.run(main()) == {"type": "object"}
+
+    def test_aresolve(self):
+        async def handler(uri):
+            return {"type": "object"}
+
+        sp = SchemaPath.from_dict(
+            self.SCHEMA, handlers={}, async_handlers={"https": handler}
+        )
+
+        async def main():
+            async with (sp / "properties" / "pet").aresolve() as resolved:
+                return resolved
+
+        resolved = asyncio.run(main())
+
+        assert resolved.contents == {"type": "object"}
+        assert resolved.resolver._base_uri == "https://example.com/pet.json"
+
+    def test_loop_not_blocked(self):
+        async def main():
+            release = asyncio.Event()
+
+            async def handler(uri):
+                await release.wait()
+                return {"type": "object"}
+
+            sp = SchemaPath.from_dict(
+                self.SCHEMA, handlers={}, async_handlers={"https": handler}
+            )
+            task = asyncio.create_task(
+                (sp / "properties" / "pet" / "type").aread_value()
+            )
+            await asyncio.sleep(0)
+            assert not task.done()
+            release.set()
+            return await task
+
+        assert asyncio.run(main()) == "object"
+
+    def test_cancelled_reader(self):
+        async def handler(uri):
+            await asyncio.sleep(0.01)
+            return {"type": "object"}
+
+        sp = SchemaPath.from_dict(
+            {"$ref": "mem://pet"}, handlers={}, async_handlers={"mem": handler}
+        )
+
+        async def main():
+            first = asyncio.create_task((sp / "type").aread_value())
+            second = asyncio.create_task((sp / "type").aread_value())
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(main()) == "object"
+
+    def test_sync_handler_in_thread(self):
+        threads = []
+
+        def handler(uri):
+            threads.append(threading.get_ident())
+            return {"type": "object"}
+
+        sp = SchemaPath.from_dict(self.SCHEMA, handlers={"https": handler})
+
+        result = asyncio.run(
+            (sp / "properties" / "pet" / "type").aread_value()
+        )
+
+        assert result == "object"
+        assert threads != [threading.get_ident()]
+
+    def test_chained_refs(self):
+        documents = {
+            "https://example.com/pet.json": {
+                "$ref": "https://example.com/animal.json"
+            },
+            "https://example.com/animal.json": {"type": "object"},
+        }
+        handler = mock.AsyncMock(side_effect=documents.__getitem__)
+
+        sp = SchemaPath.from_dict(
+            self.SCHEMA, handlers={}, async_handlers={"https": handler}
+        )
+
+        path = sp / "properties" / "pet" / "type"
+        assert asyncio.run(path.aread_value()) == "object"
+        assert handler.await_count == 2
+
+    def test_local(self):
+        sp = SchemaPath.from_dict(self.SCHEMA, handlers={})
+
+        path = sp / "properties" / "name" / "type"
+        assert asyncio.run(path.aread_value()) == "string"
+
+    def test_error(self):
+        async def handler(uri):
+            raise OSError("unreachable")
+
+        sp = SchemaPath.from_dict(
+            self.SCHEMA, handlers={}, async_handlers={"https": handler}
+        )
+
+        with pytest.raises(Unresolvable) as exc_info:
+            asyncio.run((sp / "properties" / "pet" / "type").aread_value())
+
+        assert isinstance(exc_info.value.__cause__.__cause__, OSError)
+
+    def test_without_async_retriever(self):
+        accessor = SchemaAccessor.from_schema(self.SCHEMA, handlers={})
+        accessor.async_retriever = None
+        sp = SchemaPath(accessor)
+
+        path = sp / "properties" / "name" / "type"
+        assert asyncio.run(path.aread_value()) == "string"
+
+
 class TestSchemaPathParseArgs:
     def test_flattens_schema_path(self):
         base = SchemaPath.from_dict({"a": {"b": 1}}) // "a"
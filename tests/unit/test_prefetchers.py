@@ -0,0 +1,95 @@
+from unittest import mock
+
+from referencing import Registry
+from referencing.jsonschema import DRAFT4
+from referencing.jsonschema import DRAFT202012
+
+from jsonschema_path.prefetchers import prefetch_resources
+from jsonschema_path.prefetchers import scan_refs
+
+
+class TestScanRefs:
+    def test_refs(self):
+        schema = {
+            "properties": {
+                "local": {"$ref": "#/$defs/Local"},
+                "relative": {"$ref": "common.yaml#/Error"},
+                "absolute": {"$ref": "https://example.com/defs.json"},
+                "items": [{"$ref": "other.yaml"}],
+            },
+        }
+
+        refs, ids = scan_refs(schema, "file:///spec/openapi.yaml", DRAFT202012)
+
+        assert refs == {
+            "file:///spec/openapi.yaml",
+            "file:///spec/common.yaml",
+            "https://example.com/defs.json",
+            "file:///spec/other.yaml",
+        }
+        assert ids == {"file:///spec/openapi.yaml"}
+
+    def test_embedded_ids(self):
+        schema = {
+            "$defs": {
+                "pet": {
+                    "$id": "https://example.com/pet",
+                    "properties": {"tag": {"$ref": "tag"}},
+                },
+            },
+        }
+
+        refs, ids = scan_refs(schema, "", DRAFT202012)
+
+        assert refs == {"https://example.com/tag"}
+        assert ids == {"", "https://example.com/pet"}
+
+    def test_legacy_id_property(self):
+        schema = {"properties": {"id": {"type": "integer"}}}
+
+        refs, ids = scan_refs(schema, "", DRAFT4)
+
+        assert refs == set()
+
+
+class TestPrefetchResources:
+    def test_transitive(self):
+        documents = {
+            "file:///spec/a.yaml": {"$ref": "b.yaml"},
+            "file:///spec/b.yaml": {"$ref": "a.yaml#/type"},
+        }
+        retrieve = mock.Mock(
+            side_effect=lambda uri: DRAFT202012.create_resource(documents[uri])
+        )
+        schema = {"properties": {"a": {"$ref": "a.yaml"}}}
+        registry = Registry().with_resource(
+            "file:///spec/openapi.yaml", DRAFT202012.create_resource(schema)
+        )
+
+        registry = prefetch_resources(
+            registry,
+            retrieve,
+            schema,
+            "file:///spec/openapi.yaml",
+            DRAFT202012,
+        )
+
+        assert registry.contents("file:///spec/a.yaml") == {"$ref": "b.yaml"}
+        assert registry.contents("file:///spec/b.yaml") == {
+            "$ref": "a.yaml#/type"
+        }
+        assert retrieve.call_count == 2
+
+    def test_failed_retrieval_skipped(self):
+        retrieve = mock.Mock(side_effect=OSError)
+        schema = {"$ref": "https://example.com/defs.json"}
+        registry = Registry().with_resource(
+            "", DRAFT202012.create_resource(schema)
+        )
+
+        result = prefetch_resources(
+            registry, retrieve, schema, "", DRAFT202012
+        )
+
+        assert list(result) == [""]
+        retrieve.assert_called_once_with("https://example.com/defs.json")
@@ -0,0 +1,690 @@
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from io import BytesIO
+from unittest import mock
+from urllib.error import HTTPError
+
+import pytest
+from referencing.jsonschema import DRAFT202012
+
+from jsonschema_path.caches import ResourceCache
+from jsonschema_path.retrievers import AsyncSchemaRetriever
+from jsonschema_path.retrievers import DocumentTooLargeError
+from jsonschema_path.retrievers import RetrievalBlockedError
+from jsonschema_path.retrievers import RetrievalDeferred
+from jsonschema_path.retrievers import RetrievalPolicy
+from jsonschema_path.retrievers import SchemaRetriever
+from jsonschema_path.retrievers import defer_retrieval
+from jsonschema_path.retrievers import get_bundled_resources
+from jsonschema_path.retrievers import is_transient_error
+
+
+class TestSchemaRetriever:
+    def test_handler(self):
+        handler = mock.Mock(return_value={"type": "object"})
+        retriever = SchemaRetriever({"file": handler}, DRAFT202012)
+
+        resource = retriever("file:///spec/defs.yaml")
+
+        assert resource.contents == {"type": "object"}
+        handler.assert_called_once_with("file:///spec/defs.yaml")
+
+    def test_concurrent_calls_coalesced(self):
+        release = threading.Event()
+
+        def handler(uri):
+            release.wait(5)
+            return {"type": "object"}
+
+        handler_mock = mock.Mock(side_effect=handler)
+        retriever = SchemaRetriever({"file": handler_mock}, DRAFT202012)
+        entered = threading.Semaphore(0)
+        lock = retriever._lock
+
+        class CountingLock:
+            def __enter__(self):
+                lock.acquire()
+                entered.release()
+
+            def __exit__(self, *args):
+                lock.release()
+
+        retriever._lock = CountingLock()
+        uri = "file:///spec/defs.yaml"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(retriever, uri) for _ in range(4)]
+            # Every caller has registered before the leader finishes.
+            for _ in range(4):
+                entered.acquire(timeout=5)
+            release.set()
+            resources = [f.result() for f in futures]
+
+        handler_mock.assert_called_once_with(uri)
+        assert all(resource is resources[0] for resource in resources)
+        assert retriever._in_flight == {}
+
+    def test_sequential_calls_not_coalesced(self):
+        handler = mock.Mock(return_value={"type": "object"})
+        retriever = SchemaRetriever({"file": handler}, DRAFT202012)
+
+        retriever("file:///spec/defs.yaml")
+        retriever("file:///spec/defs.yaml")
+
+        assert handler.call_count == 2
+
+    def test_error_propagated(self):
+        handler = mock.Mock(side_effect=OSError)
+        retriever = SchemaRetriever({"file": handler}, DRAFT202012)
+
+        with pytest.raises(OSError):
+            retriever("file:///spec/defs.yaml")
+
+        assert retriever._in_flight == {}
+
+    def test_resource_cache_shared(self):
+        handler = mock.Mock(return_value={"type": "object"})
+        resource_cache = ResourceCache()
+        retriever = SchemaRetriever(
+            {"file": handler}, DRAFT202012, resource_cache=resource_cache
+        )
+        other_retriever = SchemaRetriever(
+            {"file": handler}, DRAFT202012, resource_cache=resource_cache
+        )
+
+        resource = retriever("file:///spec/defs.yaml")
+        other_resource = other_retriever("file:///spec/defs.yaml")
+
+        assert other_resource is resource
+        handler.assert_called_once_with("file:///spec/defs.yaml")
+
+
+class TestSchemaRetrieverBundledResources:
+    @pytest.mark.parametrize(
+        "uri",
+        [
+            "https://json-schema.org/draft/2020-12/schema",
+            "https://json-schema.org/draft/2020-12/meta/core",
+            "http://json-schema.org/draft-07/schema",
+            "https://json-schema.org/draft-04/schema",
+        ],
+    )
+    def test_served_offline(self, uri):
+        pytest.importorskip("jsonschema_specifications")
+        handler = mock.Mock()
+        retriever = SchemaRetriever(
+            {"http": handler, "https": handler}, DRAFT202012
+        )
+
+        resource = retriever(uri)
+
+        assert "properties" in resource.contents
+        handler.assert_not_called()
+
+    def test_custom(self):
+        handler = mock.Mock()
+        bundled = DRAFT202012.create_resource({"type": "object"})
+        retriever = SchemaRetriever(
+            {"https": handler},
+            DRAFT202012,
+            bundled_resources={"https://example.com/meta": bundled},
+        )
+
+        assert retriever("https://example.com/meta") is bundled
+        handler.assert_not_called()
+
+    def test_disabled(self):
+        handler = mock.Mock(return_value={"type": "object"})
+        retriever = SchemaRetriever(
+            {"https": handler}, DRAFT202012, bundled_resources={}
+        )
+
+        retriever("https://json-schema.org/draft/2020-12/schema")
+
+        handler.assert_called_once()
+
+    def test_not_installed(self):
+        with mock.patch.dict(sys.modules, {"jsonschema_specifications": None}):
+            assert get_bundled_resources.__wrapped__() == {}
+
+
+@pytest.fixture
+def trickling_server():
+    """HTTP server sending a 50 byte body one byte every 0.2 seconds."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b'{"type": "string", "description": "' + b"x" * 32 + b'"}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            try:
+                for index in range(len(body)):
+                    self.wfile.write(body[index : index + 1])
+                    self.wfile.flush()
+                    time.sleep(0.2)
+            except OSError:
+                pass
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever,
+        kwargs={"poll_interval": 0.01},
+        daemon=True,
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestSchemaRetrieverFetch:
+    @pytest.mark.parametrize("use_requests", [True, False])
+    def test_remote(self, http_server, use_requests):
+        if use_requests:
+            pytest.importorskip("requests")
+        http_server.documents["/defs.json"] = {"type": "object"}
+        retriever = SchemaRetriever({}, DRAFT202012, bundled_resources={})
+
+        with mock.patch(
+            "jsonschema_path.retrievers.USE_REQUESTS", use_requests
+        ):
+            resource = retriever(f"{http_server.url}/defs.json")
+
+        assert resource.contents == {"type": "object"}
+
+    @pytest.mark.parametrize("use_requests", [True, False])
+    def test_declared_length_too_large(self, http_server, use_requests):
+        if use_requests:
+            pytest.importorskip("requests")
+        http_server.documents["/defs.json"] = {"type": "object"}
+        retriever = SchemaRetriever(
+            {}, DRAFT202012, bundled_resources={}, fetch_max_size=10
+        )
+
+        with mock.patch(
+            "jsonschema_path.retrievers.USE_REQUESTS", use_requests
+        ):
+            with pytest.raises(DocumentTooLargeError):
+                retriever(f"{http_server.url}/defs.json")
+
+    def test_http_error(self, http_server):
+        pytest.importorskip("requests")
+        retriever = SchemaRetriever({}, DRAFT202012, bundled_resources={})
+
+        with mock.patch("jsonschema_path.retrievers.USE_REQUESTS", True):
+            with pytest.raises(OSError):
+                retriever(f"{http_server.url}/missing.json")
+
+    @pytest.mark.parametrize("use_requests", [True, False])
+    def test_trickling_body_deadline(self, trickling_server, use_requests):
+        if use_requests:
+            pytest.importorskip("requests")
+        retriever = SchemaRetriever(
+            {}, DRAFT202012, bundled_resources={}, fetch_timeout=0.5
+        )
+        start = time.monotonic()
+
+        with mock.patch(
+            "jsonschema_path.retrievers.USE_REQUESTS", use_requests
+        ):
+            with pytest.raises(TimeoutError):
+                retriever(f"{trickling_server}/defs.json")
+
+        assert time.monotonic() - start < 2.0
+
+    @mock.patch("jsonschema_path.retrievers.FETCH_CHUNK_SIZE", 4)
+    @mock.patch("jsonschema_path.retrievers.urlopen")
+    def test_streamed_body_too_large(self, mock_urlopen):
+        stream = mock.MagicMock()
+        stream.__enter__.return_value = BytesIO(b'{"type": "object"}')
+        mock_urlopen.return_value = stream
+        retriever = SchemaRetriever({}, DRAFT202012, fetch_max_size=10)
+
+        with pytest.raises(DocumentTooLargeError):
+            retriever("ftp://example.com/defs.json")
+
+        assert stream.__enter__.return_value.tell() == 12
+
+    @mock.patch("jsonschema_path.retrievers.FETCH_CHUNK_SIZE", 4)
+    @mock.patch("jsonschema_path.retrievers.urlopen")
+    def test_deadline(self, mock_urlopen):
+        now = [100.0]
+        stream = BytesIO(b'{"type": "object"}')
+
+        def read(amount):
+            now[0] += 1.0
+            return BytesIO.read(stream, amount)
+
+        stream.read = read
+        mock_urlopen.return_value = stream
+        retriever = SchemaRetriever({}, DRAFT202012, fetch_timeout=2.5)
+
+        with mock.patch(
+            "jsonschema_path.retrievers.time.monotonic",
+            side_effect=lambda: now[0],
+        ):
+            with pytest.raises(TimeoutError):
+                retriever("ftp://example.com/defs.json")
+
+        mock_urlopen.assert_called_once_with(
+            "ftp://example.com/defs.json", timeout=2.5
+        )
+        assert now[0] == 103.0
+
+    @mock.patch("jsonschema_path.retrievers.FETCH_CHUNK_SIZE", 4)
+    @mock.patch("jsonschema_path.retrievers.urlopen")
+    def test_unbounded(self, mock_urlopen):
+        mock_urlopen.return_value = BytesIO(b'{"type": "object"}')
+        retriever = SchemaRetriever(
+            {}, DRAFT202012, fetch_timeout=None, fetch_max_size=None
+        )
+
+        resource = retriever("ftp://example.com/defs.json")
+
+        assert resource.contents == {"type": "object"}
+        mock_urlopen.assert_called_once_with(
+            "ftp://example.com/defs.json", timeout=None
+        )
+
+
+class TestRetrievalPolicy:
+    @pytest.fixture
+    def clock(self):
+        now = [100.0]
+        with mock.patch(
+            "jsonschema_path.retrievers.time.monotonic",
+            side_effect=lambda: now[0],
+        ), mock.patch("jsonschema_path.retrievers.time.sleep") as sleep:
+            sleep.side_effect = lambda delay: now.__setitem__(
+                0, now[0] + delay
+            )
+            yield now
+
+    def test_success(self, clock):
+        retrieve = mock.Mock(return_value="document")
+        policy = RetrievalPolicy()
+
+        result = policy("https://example.com/a.json", retrieve)
+
+        assert result == "document"
+        retrieve.assert_called_once_with("https://example.com/a.json")
+
+    def test_retries_with_backoff(self, clock):
+        retrieve = mock.Mock(
+            side_effect=[
+                ConnectionResetError("reset"),
+                ConnectionResetError("reset"),
+                "document",
+            ]
+        )
+        policy = RetrievalPolicy(retries=2, backoff=0.5)
+
+        result = policy("https://example.com/a.json", retrieve)
+
+        assert result == "document"
+        assert retrieve.call_count == 3
+        assert clock[0] == 101.5
+
+    def test_backoff_capped(self, clock):
+        retrieve = mock.Mock(side_effect=ConnectionResetError("reset"))
+        policy = RetrievalPolicy(retries=3, backoff=1.0, max_backoff=1.5)
+
+        with pytest.raises(OSError):
+            policy("https://example.com/a.json", retrieve)
+
+        assert retrieve.call_count == 4
+        assert clock[0] == 104.0
+
+    def test_other_errors_not_retried(self, clock):
+        retrieve = mock.Mock(side_effect=ValueError("invalid document"))
+        policy = RetrievalPolicy()
+
+        with pytest.raises(ValueError):
+            policy("https://example.com/a.json", retrieve)
+
+        retrieve.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            HTTPError(
+                "https://example.com/a.json", 404, "Not Found", {}, None
+            ),
+            FileNotFoundError("missing"),
+            PermissionError("denied"),
+        ],
+    )
+    def test_client_errors_not_retried(self, clock, error):
+        retrieve = mock.Mock(side_effect=error)
+        policy = RetrievalPolicy(failure_threshold=1)
+
+        with pytest.raises(type(error)):
+            policy("https://example.com/a.json", retrieve)
+
+        retrieve.assert_called_once()
+        retrieve.side_effect = None
+        retrieve.return_value = "document"
+        assert policy("https://example.com/b.json", retrieve) == "document"
+
+    def test_server_errors_retried(self, clock):
+        error = HTTPError(
+            "https://example.com/a.json", 503, "Unavailable", {}, None
+        )
+        retrieve = mock.Mock(side_effect=[error, "document"])
+        policy = RetrievalPolicy()
+
+        assert policy("https://example.com/a.json", retrieve) == "document"
+        assert retrieve.call_count == 2
+
+    def test_not_found_does_not_open_circuit(self, http_server):
+        pytest.importorskip("requests")
+        from jsonschema_path.handlers.requests import UrlRequestsHandler
+
+        http_server.documents["/valid.json"] = {"type": "object"}
+        retriever = SchemaRetriever(
+            {"http": UrlRequestsHandler("http")},
+            DRAFT202012,
+            policy=RetrievalPolicy(failure_threshold=3),
+        )
+        for name in ("a", "b", "c"):
+            with pytest.raises(OSError):
+                retriever(f"{http_server.url}/{name}.json")
+
+        resource = retriever(f"{http_server.url}/valid.json")
+
+        assert resource.contents == {"type": "object"}
+        assert len(http_server.requests) == 4
+
+    def test_negative_cache(self, clock):
+        error = ValueError("invalid document")
+        retrieve = mock.Mock(side_effect=error)
+        policy = RetrievalPolicy(negative_ttl=10.0)
+        uri = "https://example.com/a.json"
+        with pytest.raises(ValueError):
+            policy(uri, retrieve)
+
+        with pytest.raises(RetrievalBlockedError) as exc_info:
+            policy(uri, retrieve)
+
+        assert exc_info.value.__cause__ is error
+        retrieve.assert_called_once()
+
+        clock[0] += 10.0
+        retrieve.side_effect = None
+        retrieve.return_value = "document"
+        assert policy(uri, retrieve) == "document"
+
+    def test_circuit_breaker(self, clock):
+        retrieve = mock.Mock(side_effect=ConnectionRefusedError("unreachable"))
+        policy = RetrievalPolicy(
+            retries=0, failure_threshold=2, reset_timeout=30.0
+        )
+        for name in ("a", "b"):
+            with pytest.raises(OSError):
+                policy(f"https://example.com/{name}.json", retrieve)
+
+        with pytest.raises(RetrievalBlockedError):
+            policy("https://example.com/c.json", retrieve)
+        assert retrieve.call_count == 2
+
+        retrieve.side_effect = None
+        retrieve.return_value = "document"
+        assert policy("https://other.com/c.json", retrieve) == "document"
+
+        clock[0] += 30.0
+        assert policy("https://example.com/c.json", retrieve) == "document"
+
+    def test_circuit_reopens_after_failed_trial(self, clock):
+        retrieve = mock.Mock(side_effect=ConnectionRefusedError("unreachable"))
+        policy = RetrievalPolicy(
+            retries=0, negative_ttl=0, failure_threshold=1
+        )
+        uri = "https://example.com/a.json"
+        with pytest.raises(OSError):
+            policy(uri, retrieve)
+        clock[0] += 30.0
+
+        with pytest.raises(OSError):
+            policy(uri, retrieve)
+
+        with pytest.raises(RetrievalBlockedError):
+            policy(uri, retrieve)
+        assert retrieve.call_count == 2
+
+    def test_success_resets_failures(self, clock):
+        retrieve = mock.Mock(side_effect=ConnectionRefusedError("unreachable"))
+        policy = RetrievalPolicy(
+            retries=0, negative_ttl=0, failure_threshold=2
+        )
+        uri = "https://example.com/a.json"
+        with pytest.raises(OSError):
+            policy(uri, retrieve)
+        retrieve.side_effect = None
+        policy(uri, retrieve)
+        retrieve.side_effect = ConnectionRefusedError("unreachable")
+
+        with pytest.raises(OSError):
+            policy(uri, retrieve)
+
+        with pytest.raises(OSError):
+            policy(uri, retrieve)
+
+    def test_other_schemes_bypassed(self, clock):
+        retrieve = mock.Mock(side_effect=ConnectionRefusedError("unreachable"))
+        policy = RetrievalPolicy(retries=2, failure_threshold=1)
+
+        for _ in range(2):
+            with pytest.raises(OSError):
+                policy("file:///spec/a.yaml", retrieve)
+
+        assert retrieve.call_count == 2
+
+    def test_reset(self, clock):
+        retrieve = mock.Mock(side_effect=ConnectionRefusedError("unreachable"))
+        policy = RetrievalPolicy(retries=0, failure_threshold=1)
+        uri = "https://example.com/a.json"
+        with pytest.raises(OSError):
+            policy(uri, retrieve)
+
+        policy.reset()
+
+        retrieve.side_effect = None
+        retrieve.return_value = "document"
+        assert policy(uri, retrieve) == "document"
+
+    def test_retriever(self, clock):
+        handler = mock.Mock(side_effect=ConnectionRefusedError("unreachable"))
+        retriever = SchemaRetriever(
+            {"https": handler},
+            DRAFT202012,
+            policy=RetrievalPolicy(retries=1),
+        )
+        uri = "https://example.com/a.json"
+        with pytest.raises(OSError):
+            retriever(uri)
+
+        with pytest.raises(RetrievalBlockedError):
+            retriever(uri)
+        assert handler.call_count == 2
+
+
+class TestIsTransientError:
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (ConnectionResetError(), True),
+            (TimeoutError(), True),
+            (HTTPError("http://x/", 500, "Error", {}, None), True),
+            (HTTPError("http://x/", 404, "Not Found", {}, None), False),
+            (FileNotFoundError(), False),
+            (OSError(), False),
+            (ValueError(), False),
+        ],
+    )
+    def test_errors(self, error, expected):
+        assert is_transient_error(error) is expected
+
+    @pytest.mark.parametrize(
+        ("status_code", "expected"), [(502, True), (404, False)]
+    )
+    def test_requests_http_error(self, status_code, expected):
+        requests = pytest.importorskip("requests")
+        response = requests.Response()
+        response.status_code = status_code
+
+        error = requests.HTTPError(response=response)
+
+        assert is_transient_error(error) is expected
+
+    def test_requests_connection_error(self):
+        requests = pytest.importorskip("requests")
+
+        assert is_transient_error(requests.ConnectionError()) is True
+
+
+class TestSchemaRetrieverDeferRetrieval:
+    def test_deferred(self):
+        handler = mock.Mock(return_value={"type": "object"})
+        retriever = SchemaRetriever({"file": handler}, DRAFT202012)
+        token = defer_retrieval.set(True)
+        try:
+            with pytest.raises(RetrievalDeferred) as exc_info:
+                retriever("file:///spec/defs.yaml")
+        finally:
+            defer_retrieval.reset(token)
+
+        assert exc_info.value.uri == "file:///spec/defs.yaml"
+        handler.assert_not_called()
+
+    def test_cached_not_deferred(self):
+        handler = mock.Mock(return_value={"type": "object"})
+        retriever = SchemaRetriever(
+            {"file": handler}, DRAFT202012, resource_cache=ResourceCache()
+        )
+        resource = retriever("file:///spec/defs.yaml")
+        token = defer_retrieval.set(True)
+        try:
+            assert retriever("file:///spec/defs.yaml") is resource
+        finally:
+            defer_retrieval.reset(token)
+
+
+class TestAsyncSchemaRetriever:
+    def test_async_handler(self):
+        async def handler(uri):
+            await asyncio.sleep(0)
+            return {"type": "object"}
+
+        resource_cache = ResourceCache()
+        retriever = AsyncSchemaRetriever(
+            SchemaRetriever({}, DRAFT202012, resource_cache=resource_cache),
+            {"https": handler},
+        )
+
+        resource = asyncio.run(retriever("https://example.com/defs.json"))
+
+        assert resource.contents == {"type": "object"}
+        cached = resource_cache.get(
+            "https://example.com/defs.json", DRAFT202012
+        )
+        assert cached is resource
+
+    def test_sync_handler_in_thread(self):
+        threads = []
+
+        def handler(uri):
+            threads.append(threading.get_ident())
+            return {"type": "object"}
+
+        retriever = AsyncSchemaRetriever(
+            SchemaRetriever({"file": handler}, DRAFT202012)
+        )
+
+        resource = asyncio.run(retriever("file:///spec/defs.yaml"))
+
+        assert resource.contents == {"type": "object"}
+        assert threads != [threading.get_ident()]
+
+    def test_concurrent_calls_coalesced(self):
+        calls = []
+
+        async def handler(uri):
+            calls.append(uri)
+            await asyncio.sleep(0.01)
+            return {"type": "object"}
+
+        retriever = AsyncSchemaRetriever(
+            SchemaRetriever({}, DRAFT202012), {"https": handler}
+        )
+
+        async def main():
+            return await asyncio.gather(
+                *(retriever("https://example.com/defs.json") for _ in range(3))
+            )
+
+        resources = asyncio.run(main())
+
+        assert calls == ["https://example.com/defs.json"]
+        assert resources[0] is resources[1] is resources[2]
+
+    def test_cancelled_caller(self):
+        calls = []
+
+        async def handler(uri):
+            calls.append(uri)
+            await asyncio.sleep(0.01)
+            return {"type": "object"}
+
+        retriever = AsyncSchemaRetriever(
+            SchemaRetriever({}, DRAFT202012), {"mem": handler}
+        )
+
+        async def main():
+            first = asyncio.create_task(retriever("mem://defs"))
+            second = asyncio.create_task(retriever("mem://defs"))
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        resource = asyncio.run(main())
+
+        assert resource.contents == {"type": "object"}
+        assert calls == ["mem://defs"]
+
+    def test_error_propagated(self):
+        async def handler(uri):
+            await asyncio.sleep(0.01)
+            raise OSError("unreachable")
+
+        retriever = AsyncSchemaRetriever(
+            SchemaRetriever({}, DRAFT202012), {"https": handler}
+        )
+
+        async def main():
+            return await asyncio.gather(
+                *(
+                    retriever("https://example.com/defs.json")
+                    for _ in range(2)
+                ),
+                return_exceptions=True,
+            )
+
+        errors = asyncio.run(main())
+
+        assert all(isinstance(error, OSError) for error in errors)
+        assert retriever._in_flight == {}
@@ -0,0 +1,154 @@
+import json
+
+import pytest
+
+from jsonschema_path.handlers.file import FileHandler
+from jsonschema_path.sourcemaps import SourceLocation
+from jsonschema_path.sourcemaps import SourceMap
+from jsonschema_path.sourcemaps import loads_json_located
+
+JSON_DOCUMENT = """{
+  "type": "object",
+  "required": ["id", "name"],
+  "properties": {
+    "id": {"type": "integer", "minimum": -1e3}
+  }
+}
+"""
+
+YAML_DOCUMENT = """\
+type: object
+required:
+  - id
+  - name
+properties:
+  id:
+    type: integer
+    minimum: -1e3
+"""
+
+
+def load(data, uri="file:///spec"):
+    source_map = SourceMap()
+    result = FileHandler(source_map=source_map).loads(data, uri=uri)
+    return result, source_map
+
+
+class TestLoadsJsonLocated:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            JSON_DOCUMENT,
+            '{"a": [1, {"b": null}, []], "c": {}, "d": "\\u00e9"}',
+            "[]",
+            '"scalar"',
+            '{"a": 1, "a": 2}',
+        ],
+    )
+    def test_matches_json(self, data):
+        result, _ = loads_json_located(data)
+
+        assert result == json.loads(data)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            "",
+            "{",
+            '{"a": 1,}',
+            "[1,]",
+            '{"a" 1}',
+            "[1 2]",
+            "{} {}",
+            "[NaN]",
+            "\ufeff{}",
+        ],
+    )
+    def test_invalid(self, data):
+        with pytest.raises(ValueError):
+            loads_json_located(data)
+
+    def test_bytes(self):
+        result, _ = loads_json_located('{"a": "é"}'.encode("utf-16"))
+
+        assert result == {"a": "é"}
+
+
+class TestSourceMap:
+    @pytest.mark.parametrize(
+        ("data", "lines"),
+        [
+            (JSON_DOCUMENT, (2, 3, 5, 5)),
+            (YAML_DOCUMENT, (1, 4, 6, 8)),
+        ],
+    )
+    def test_locate(self, data, lines):
+        result, source_map = load(data)
+
+        assert source_map.locate(result) == SourceLocation(
+            "file:///spec", 1, 1
+        )
+        assert source_map.locate(result, "type").line == lines[0]
+        assert source_map.locate(result["required"], 1).line == lines[1]
+        id_schema = result["properties"]["id"]
+        assert source_map.locate(id_schema).line == lines[2]
+        assert source_map.locate(result["properties"], "id").line == lines[2]
+        assert source_map.locate(id_schema, "minimum").line == lines[3]
+
+    def test_locate_json_columns(self):
+        result, source_map = load(JSON_DOCUMENT)
+
+        assert source_map.locate(result, "type").column == 3
+        assert source_map.locate(result["required"], 1).column == 22
+        assert source_map.locate(result["properties"]["id"]).column == 5
+
+    def test_locate_yaml_columns(self):
+        result, source_map = load(YAML_DOCUMENT)
+
+        assert source_map.locate(result["required"], 1).column == 5
+        assert source_map.locate(result["properties"]["id"]).column == 3
+
+    def test_duplicate_keys(self):
+        result, source_map = load("a: 1\nb: 2\na: 3\n")
+
+        assert result == {"a": 3, "b": 2}
+        assert source_map.locate(result, "a").line == 3
+        assert source_map.locate(result, "b").line == 2
+
+    def test_merge_keys(self):
+        result, source_map = load(
+            "base: &base\n  type: object\nchild:\n  <<: *base\n  title: x\n"
+        )
+
+        assert source_map.locate(result["child"], "type").line == 2
+        assert source_map.locate(result["child"], "title").line == 5
+
+    def test_normalised_keys_not_located(self):
+        result, source_map = load("200: ok\nyes: 1\n")
+
+        assert source_map.locate(result, "200").line == 1
+        assert source_map.locate(result, "true") is None
+
+    def test_unknown(self):
+        result, source_map = load(YAML_DOCUMENT)
+
+        assert source_map.locate({}) is None
+        assert source_map.locate(result, "missing") is None
+        assert source_map.locate(result["required"], 5) is None
+
+    def test_resized_node(self):
+        result, source_map = load(YAML_DOCUMENT)
+        result["required"].append("extra")
+
+        assert source_map.locate(result["required"], 0) is None
+
+    def test_invalid_json_falls_back(self):
+        result, source_map = load("{a: 1}", uri="file:///spec.json")
+
+        assert result == {"a": 1}
+        assert source_map.locate(result, "a").column == 2
+
+    def test_len(self):
+        _, source_map = load(YAML_DOCUMENT)
+
+        assert len(source_map) == 4